@@ -0,0 +1,34 @@
+"""calls.site, calls.duplicate_of
+
+Revision ID: 2f6a8d0c3e71
+Revises: 9c41e7a2d5b3
+Create Date: 2026-10-18 17:48:52.306417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '2f6a8d0c3e71'
+down_revision: Union[str, Sequence[str], None] = '9c41e7a2d5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('calls', sa.Column('site', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    op.add_column('calls', sa.Column('duplicate_of', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_calls_duplicate_of'), 'calls', ['duplicate_of'], unique=False)
+    op.create_foreign_key(op.f('fk_calls_duplicate_of_calls'), 'calls', 'calls', ['duplicate_of'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(op.f('fk_calls_duplicate_of_calls'), 'calls', type_='foreignkey')
+    op.drop_index(op.f('ix_calls_duplicate_of'), table_name='calls')
+    op.drop_column('calls', 'duplicate_of')
+    op.drop_column('calls', 'site')
@@ -0,0 +1,29 @@
+"""calls.sample_rate + calls.channels
+
+Revision ID: 3a7c95e0d2b4
+Revises: f81d2c6a4b09
+Create Date: 2026-10-18 13:21:09.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7c95e0d2b4'
+down_revision: Union[str, Sequence[str], None] = 'f81d2c6a4b09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('calls', sa.Column('sample_rate', sa.Integer(), nullable=True))
+    op.add_column('calls', sa.Column('channels', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('calls', 'channels')
+    op.drop_column('calls', 'sample_rate')
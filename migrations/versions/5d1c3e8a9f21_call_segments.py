@@ -0,0 +1,27 @@
+"""call segments
+
+Revision ID: 5d1c3e8a9f21
+Revises: 26743730bfb6
+Create Date: 2026-10-18 09:12:44.310218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1c3e8a9f21'
+down_revision: Union[str, Sequence[str], None] = '26743730bfb6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('calls', sa.Column('segments', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('calls', 'segments')
@@ -0,0 +1,28 @@
+"""talkgroups.priority
+
+Revision ID: 7d2b0e91c4f8
+Revises: 3a7c95e0d2b4
+Create Date: 2026-10-18 14:02:37.550912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2b0e91c4f8'
+down_revision: Union[str, Sequence[str], None] = '3a7c95e0d2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('talkgroups', sa.Column('priority', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('talkgroups', 'priority')
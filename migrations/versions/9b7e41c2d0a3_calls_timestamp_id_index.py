@@ -0,0 +1,28 @@
+"""calls (timestamp, id) keyset index
+
+Revision ID: 9b7e41c2d0a3
+Revises: 5d1c3e8a9f21
+Create Date: 2026-10-18 10:02:17.554902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9b7e41c2d0a3'
+down_revision: Union[str, Sequence[str], None] = '5d1c3e8a9f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves ORDER BY timestamp DESC, id DESC and (timestamp, id) < (:ts, :id)
+    op.create_index('ix_calls_timestamp_id', 'calls', ['timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_calls_timestamp_id', table_name='calls')
@@ -0,0 +1,34 @@
+"""calls.source_path, calls.audio_sha256
+
+Revision ID: 9c41e7a2d5b3
+Revises: 7d2b0e91c4f8
+Create Date: 2026-10-18 16:21:09.114032
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '9c41e7a2d5b3'
+down_revision: Union[str, Sequence[str], None] = '7d2b0e91c4f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('calls', sa.Column('source_path', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    op.add_column('calls', sa.Column('audio_sha256', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+    op.create_index(op.f('ix_calls_source_path'), 'calls', ['source_path'], unique=False)
+    op.create_index(op.f('ix_calls_audio_sha256'), 'calls', ['audio_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_calls_audio_sha256'), table_name='calls')
+    op.drop_index(op.f('ix_calls_source_path'), table_name='calls')
+    op.drop_column('calls', 'audio_sha256')
+    op.drop_column('calls', 'source_path')
@@ -0,0 +1,50 @@
+"""index corrected transcripts in transcript_tsv
+
+Revision ID: c4f0a9d27e15
+Revises: 9b7e41c2d0a3
+Create Date: 2026-10-18 10:41:05.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f0a9d27e15'
+down_revision: Union[str, Sequence[str], None] = '9b7e41c2d0a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_tsv(source_expr: str) -> None:
+    # Generated column expressions can't be altered in place; drop and re-add.
+    op.drop_index('ix_calls_transcript_tsv', table_name='calls')
+    op.execute("ALTER TABLE calls DROP COLUMN transcript_tsv")
+    op.execute(
+        f"""
+        ALTER TABLE calls
+        ADD COLUMN transcript_tsv tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english', {source_expr})
+        ) STORED
+        """
+    )
+    op.create_index(
+        'ix_calls_transcript_tsv',
+        'calls',
+        [sa.text('transcript_tsv')],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Reviewer corrections win over raw ASR output
+    _rebuild_tsv("coalesce(corrected_transcript, transcript, '')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_tsv("coalesce(transcript, '')")
@@ -0,0 +1,28 @@
+"""calls.audio_path index
+
+Revision ID: e2a86b5f13c7
+Revises: c4f0a9d27e15
+Create Date: 2026-10-18 11:20:39.118450
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a86b5f13c7'
+down_revision: Union[str, Sequence[str], None] = 'c4f0a9d27e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Catch-up scanner looks up batches of paths with audio_path IN (...)
+    op.create_index(op.f('ix_calls_audio_path'), 'calls', ['audio_path'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_calls_audio_path'), table_name='calls')
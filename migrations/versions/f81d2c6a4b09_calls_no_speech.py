@@ -0,0 +1,27 @@
+"""calls.no_speech
+
+Revision ID: f81d2c6a4b09
+Revises: e2a86b5f13c7
+Create Date: 2026-10-18 12:05:51.640377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f81d2c6a4b09'
+down_revision: Union[str, Sequence[str], None] = 'e2a86b5f13c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('calls', sa.Column('no_speech', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('calls', 'no_speech')
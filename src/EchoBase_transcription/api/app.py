@@ -25,8 +25,11 @@ def create_app() -> FastAPI:  # noqa: D401
     @asynccontextmanager
     async def lifespan(app: FastAPI):  # noqa: D401
         """Startup/Shutdown context for FastAPI 0.110+."""
+        from .sse import hub
+
+        hub.start()  # single Redis subscription shared by all SSE clients
         yield
-        # (optional) add any shutdown cleanup here
+        await hub.stop()
 
     app = FastAPI(
         title="EchoBase Transcription API",
@@ -60,6 +63,10 @@ def create_app() -> FastAPI:  # noqa: D401
     from .routes.stream import router as stream_router
     from .routes.systems import router as system_router
     from .routes.talkgroups import router as talkgroup_router
+    from .routes.radio_units import router as radio_unit_router
+    from .routes.calls import router as calls_router
+    from .routes.queues import router as queues_router
+    from .routes.metrics import router as metrics_router
     from .routes.internal.ingest import router as ingest_router
 
     app.include_router(health_router, prefix=add_base_path(""))
@@ -67,6 +74,10 @@ def create_app() -> FastAPI:  # noqa: D401
     app.include_router(stream_router, prefix=add_base_path(""))
     app.include_router(system_router, prefix=add_base_path(""))
     app.include_router(talkgroup_router, prefix=add_base_path(""))
+    app.include_router(radio_unit_router, prefix=add_base_path(""))
+    app.include_router(calls_router, prefix=add_base_path(""))
+    app.include_router(queues_router, prefix=add_base_path(""))
+    app.include_router(metrics_router, prefix=add_base_path(""))
     app.include_router(ingest_router, prefix=add_base_path(""))
 
     # -------------------------- Exception handler ------------------------- #
@@ -0,0 +1,37 @@
+"""Conditional GET (ETag / If-None-Match) for pre-serialized snapshots."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from ..services.directory_cache import Snapshot, directory_cache
+
+# Clients may reuse a response, but must revalidate it every time (cheap: 304)
+CACHE_CONTROL = "no-cache"
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: GZipMiddleware may hand back W/"..." variants
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def snapshot_response(request: Request, snapshot: Snapshot) -> Response:
+    headers = {"ETag": snapshot.etag, "Cache-Control": CACHE_CONTROL}
+    if _matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+async def directory_response(request: Request, table: str, system_id: Optional[int] = None) -> Response:
+    """Serve a directory list from the snapshot cache (DB only on a miss)."""
+    snapshot = directory_cache.peek(table, system_id)
+    if snapshot is None:
+        snapshot = await run_in_threadpool(directory_cache.get, table, system_id)
+    return snapshot_response(request, snapshot)
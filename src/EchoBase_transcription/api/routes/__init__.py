@@ -5,6 +5,10 @@ from .transcribe import router as transcribe_router
 from .stream import router as stream_router
 from .systems import router as system_router
 from .talkgroups import router as talkgroup_router
+from .radio_units import router as radio_unit_router
+from .calls import router as calls_router
+from .queues import router as queues_router
+from .metrics import router as metrics_router
 from .internal.ingest import router as ingest_router
 
 __all__ = [
@@ -13,5 +17,9 @@ __all__ = [
     "stream_router",
     "system_router",
     "talkgroup_router",
+    "radio_unit_router",
+    "calls_router",
+    "queues_router",
+    "metrics_router",
     "ingest_router",
 ]
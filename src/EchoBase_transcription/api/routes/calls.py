@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from starlette import status
+
+from ...services.call_service import search_calls, search_transcripts
+from ...db.schemas import CallSearch, Page, TranscriptSearch
+
+router = APIRouter()
+
+
+@router.get(
+    "/calls",
+    status_code=status.HTTP_200_OK,
+    response_model=Page,
+)
+async def handle_get_calls(params: Annotated[CallSearch, Query()]) -> Page:
+    """
+    Browse calls newest-first with keyset pagination.
+
+    Pass `next_cursor` / `prev_cursor` from the previous response as `cursor`.
+    `text` filters on the transcript index without changing the ordering.
+    """
+    try:
+        return search_calls(params)
+    except ValueError as e:  # bad cursor
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get(
+    "/calls/search",
+    status_code=status.HTTP_200_OK,
+    response_model=Page,
+)
+async def handle_search_calls(params: Annotated[TranscriptSearch, Query()]) -> Page:
+    """
+    Relevance-ranked transcript search with highlighted snippets.
+
+    Uses corrected transcripts where a reviewer has provided one.
+    """
+    # A query model must be the route's only query parameter, hence `q` lives on it
+    return search_transcripts(CallSearch(**params.model_dump(exclude={"q"}), text=params.q))
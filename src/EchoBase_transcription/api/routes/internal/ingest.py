@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 import xml.etree.ElementTree as ET
 
 from ....services.ingest_service import ingest_talkgroup_aliases
@@ -15,14 +16,14 @@ async def ingest_data(file: UploadFile = File(...)) -> dict:
     Ingest SDRTrunk alias XML and upsert talkgroups for system_id=1.
 
     Delegates all parsing / DB work to services.ingest_service so the route
-    just handles HTTP concerns (request/response + error mapping).
+    just handles HTTP concerns (request/response + error mapping). The upload
+    is parsed straight from its spooled file, never read into memory whole.
     """
-    xml_bytes = await file.read()
-    if not xml_bytes:
+    if not file.size:
         raise HTTPException(status_code=400, detail="Empty file")
 
     try:
-        talkgroups_map, created = ingest_talkgroup_aliases(xml_bytes, system_id=1)
+        result = await run_in_threadpool(ingest_talkgroup_aliases, file.file, 1)
     except ET.ParseError as e:
         raise HTTPException(status_code=400, detail=f"Invalid XML: {e}")
     except ValueError as e:
@@ -34,6 +35,6 @@ async def ingest_data(file: UploadFile = File(...)) -> dict:
 
     return {
         "message": "Data ingested successfully",
-        "counts": {"created": created, "updated": 0, "skipped": 0},
-        "talkgroups": {str(k): v for k, v in talkgroups_map.items()},
+        "counts": {"created": result.created, "updated": result.updated, "skipped": result.skipped},
+        "talkgroups": {str(k): v for k, v in result.talkgroups.items()},
     }
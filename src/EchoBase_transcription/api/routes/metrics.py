@@ -0,0 +1,20 @@
+"""Prometheus scrape endpoint for the API process(es)."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+from starlette.concurrency import run_in_threadpool
+
+from ...services.metrics import QueueDepthCollector, exposition_registry, render
+
+router = APIRouter()
+
+# Queue depth lives in Redis, not in any process: the API reports it for the
+# whole deployment, read at scrape time
+_registry = exposition_registry(extra=[QueueDepthCollector()])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def handle_get_metrics() -> Response:
+    body, content_type = await run_in_threadpool(render, _registry)
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,19 @@
+"""Transcription queue depth and wait per priority tier."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from starlette.concurrency import run_in_threadpool
+
+from ...services.priority_service import queue_stats
+
+router = APIRouter()
+
+
+@router.get("/queues", response_model=list[dict])
+async def handle_get_queues() -> list[dict]:
+    """
+    One entry per tier in drain order: queued calls (`depth`) and how long the
+    oldest of them has been waiting (`oldest_wait_seconds`).
+    """
+    return await run_in_threadpool(queue_stats)
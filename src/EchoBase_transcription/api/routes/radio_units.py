@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Query, Request, Response
+from starlette import status
+
+from ..conditional import directory_response
+from ...services.directory_cache import RADIO_UNITS
+from ...db.schemas import RadioUnitRead
+
+router = APIRouter()
+
+
+@router.get(
+    "/radio-units",
+    status_code=status.HTTP_200_OK,
+    response_model=list[RadioUnitRead],
+    responses={304: {"description": "Not modified (If-None-Match)"}},
+)
+async def handle_get_radio_units(
+        request: Request,
+        system_id: int = Query(
+            1,
+            description="System ID whose radio units to return (defaults to 1)",
+        ),
+) -> Response:
+    """
+    Return all known subscriber radios for the requested system.
+
+    Served from the per-process directory snapshot; send the ETag back as
+    If-None-Match to get a 304 while nothing has changed.
+    """
+    return await directory_response(request, RADIO_UNITS, system_id)
@@ -1,16 +1,35 @@
 """Server‑Sent Events endpoint for live transcription updates (FastAPI)."""
 
-from fastapi import APIRouter
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Header, Query
 from fastapi.responses import StreamingResponse
 
+from ...events import CallEventFilter
 from ..sse import create_call_stream_response
 
 router = APIRouter()
 
 
+class CallStreamQuery(CallEventFilter):
+    # A query model must be the route's only query parameter, so the resume
+    # position rides along with the filters
+    since: Optional[str] = None  # stream id to resume after (clients that can't set Last-Event-ID)
+
+
 @router.get("/transcription/events", response_class=StreamingResponse)
-async def transcription_events() -> StreamingResponse:
+async def transcription_events(
+        params: Annotated[CallStreamQuery, Query()],
+        last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
     """
     Return an SSE stream of CallEvent objects.
+
+    Reconnects carrying Last-Event-ID (sent automatically by EventSource)
+    get the events they missed replayed first.
+
+    Optional filters (system_id, talkgroup_id=…&talkgroup_id=…, unit_id,
+    needs_review, min_confidence, include_duplicates=false) are applied
+    server-side, so a client only receives the calls it asked for.
     """
-    return create_call_stream_response()
+    return create_call_stream_response(last_event_id or params.since, params)
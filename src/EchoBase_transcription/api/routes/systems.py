@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from starlette import status
 
-from ...services.system_service import list_systems, get_or_create_system
+from ..conditional import directory_response
+from ...services.directory_cache import SYSTEMS
+from ...services.system_service import get_or_create_system
 from ...db.schemas import SystemRead, SystemCreate
 
 router = APIRouter()
@@ -13,10 +15,11 @@ router = APIRouter()
     "/systems",
     status_code=status.HTTP_200_OK,
     response_model=list[SystemRead],
+    responses={304: {"description": "Not modified (If-None-Match)"}},
 )
-async def handle_get_systems() -> list[SystemRead]:
-    """Return all systems."""
-    return list_systems()
+async def handle_get_systems(request: Request) -> Response:
+    """Return all systems (directory snapshot; supports If-None-Match)."""
+    return await directory_response(request, SYSTEMS)
 
 
 @router.post(
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 from starlette import status
 
-from ...services.talkgroup_service import list_talkgroups_for_system
+from ..conditional import directory_response
+from ...services.directory_cache import TALKGROUPS
 from ...db.schemas import TalkGroupRead
 
 router = APIRouter()
@@ -13,16 +14,19 @@ router = APIRouter()
     "/talkgroups",
     status_code=status.HTTP_200_OK,
     response_model=list[TalkGroupRead],
+    responses={304: {"description": "Not modified (If-None-Match)"}},
 )
 async def handle_get_talkgroups(
+        request: Request,
         system_id: int = Query(
             1,
             description="System ID whose talkgroups to return (defaults to 1)",
         ),
-) -> list[TalkGroupRead]:
+) -> Response:
     """
     Return all talkgroups for the requested system.
 
-    We delegate to talkgroup_service so API and worker share the same logic.
+    Served from the per-process directory snapshot; send the ETag back as
+    If-None-Match to get a 304 while nothing has changed.
     """
-    return list_talkgroups_for_system(system_id)
+    return await directory_response(request, TALKGROUPS, system_id)
@@ -2,43 +2,195 @@
 
 from __future__ import annotations
 
-import mutagen
-from fastapi import APIRouter, File, UploadFile, HTTPException, status
+from typing import BinaryIO, Optional
+
+from fastapi import APIRouter, Request, HTTPException, status
 from pathlib import Path
 from uuid import uuid4
 
 from pydantic import BaseModel
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
 
 from ...config.settings import settings
-from ...worker.tasks.transcribe import transcribe_audio_task
+from ...services import metrics
+from ...services.audio import probe_audio
+from ...worker.tasks.transcribe import enqueue_transcription
 
 router = APIRouter()
 
 TEMP_DIR = Path(settings.temp_audio_path)
 TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
-
-@router.post("/transcribe", status_code=status.HTTP_202_ACCEPTED)
-async def handle_transcribe_audio(file: UploadFile = File(...)) -> dict[str, str]:
-    """Accept a WAV/MP3 file, save to disk, enqueue Celery task, return task ID."""
-    file_path = TEMP_DIR / f"{uuid4()}_{file.filename}"
-    file_path.write_bytes(await file.read())
-
-    if file_path.suffix.lower() not in {".wav", ".mp3"}:
-        raise HTTPException(status_code=400, detail="Unsupported file type")
-
+ALLOWED_SUFFIXES = {".wav", ".mp3"}
+UPLOAD_FIELD = b"file"
+FORM_OVERHEAD_BYTES = 64 * 1024  # multipart framing + any other (ignored) form fields
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class UnsupportedUpload(Exception):
+    pass
+
+
+class _UploadReceiver:
+    """
+    Incremental multipart/form-data parser for the upload route.
+
+    The request body is fed in as it arrives; the `file` part is written
+    straight to TEMP_DIR. Its name is checked from the part headers before
+    any of its bytes are written, and MAX_UPLOAD_BYTES is enforced while
+    reading, so neither a missing nor a false Content-Length lets a client
+    push more than that to disk. Other parts are discarded.
+    """
+
+    def __init__(self, boundary: bytes, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.file_name: Optional[str] = None
+        self.path: Optional[Path] = None
+        self.complete = False
+        self._received = 0
+        self._written = 0
+        self._out: Optional[BinaryIO] = None
+        self._headers: dict[bytes, bytes] = {}
+        self._field = b""
+        self._value = b""
+        self._parser = MultipartParser(boundary, callbacks={
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+    def feed(self, chunk: bytes) -> None:
+        self._received += len(chunk)
+        if self._received > self.max_bytes + FORM_OVERHEAD_BYTES:
+            raise UploadTooLarge
+        self._parser.write(chunk)
+
+    def close(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+    def discard(self) -> None:
+        self.close()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._field.lower()] = self._value
+        self._field = self._value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if options.get(b"name") != UPLOAD_FIELD or self.path is not None:
+            return
+        file_name = Path(options.get(b"filename", b"").decode("utf-8", "replace")).name
+        if Path(file_name).suffix.lower() not in ALLOWED_SUFFIXES:
+            raise UnsupportedUpload
+        self.file_name = file_name
+        self.path = TEMP_DIR / f"{uuid4()}_{file_name}"
+        self._out = self.path.open("wb")
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._out is None:
+            return
+        self._written += end - start
+        if self._written > self.max_bytes:
+            raise UploadTooLarge
+        self._out.write(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._out is not None:
+            self.close()
+            self.complete = True
+
+
+def _multipart_boundary(request: Request) -> bytes:
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or not options.get(b"boundary"):
+        raise HTTPException(status_code=400, detail="Expected multipart/form-data")
+    return options[b"boundary"]
+
+
+def _probe(path: Path):
+    with metrics.stage("probe"):
+        return probe_audio(path)
+
+
+@router.post(
+    "/transcribe",
+    status_code=status.HTTP_202_ACCEPTED,
+    # The body is parsed by hand (see _UploadReceiver); document it for /docs
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"multipart/form-data": {"schema": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary"}},
+                "required": ["file"],
+            }}},
+        },
+    },
+)
+async def handle_transcribe_audio(request: Request) -> dict[str, str]:
+    """Accept a WAV/MP3 file, stream it to disk, enqueue Celery task, return task ID."""
+    # Announced size over the cap: reject before reading the body at all
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.max_upload_bytes + FORM_OVERHEAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+
+    receiver = _UploadReceiver(_multipart_boundary(request), settings.max_upload_bytes)
     try:
-        if mutagen.File(file_path) is None:
-            raise ValueError
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid audio file")
-
-    task = transcribe_audio_task.delay(
-        file.filename,
+        # Parsing + file writes are blocking; keep them off the event loop
+        async for chunk in request.stream():
+            if chunk:
+                await run_in_threadpool(receiver.feed, chunk)
+        receiver.close()
+        if not receiver.complete:
+            raise HTTPException(status_code=400, detail="No file uploaded")
+        if await run_in_threadpool(_probe, receiver.path) is None:
+            raise HTTPException(status_code=400, detail="Invalid audio file")
+    except UnsupportedUpload:
+        receiver.discard()
+        raise HTTPException(status_code=400, detail="Unsupported file type")
+    except UploadTooLarge:
+        receiver.discard()
+        raise HTTPException(status_code=413, detail="File too large")
+    except MultipartParseError:
+        receiver.discard()
+        raise HTTPException(status_code=400, detail="Malformed multipart body")
+    except BaseException:
+        receiver.discard()
+        raise
+
+    file_name, file_path = receiver.file_name, receiver.path
+
+    # In-flight claim, priority lookup and broker publish all block
+    task = await run_in_threadpool(
+        enqueue_transcription,
+        file_name,
         str(file_path),
         prompt=settings.whisper_initial_prompt,
         language=settings.whisper_language,
     )
+    metrics.UPLOADS.labels("upload").inc()
 
     return {"message": "Transcription started", "taskId": task.id}
 
@@ -65,7 +217,7 @@ async def handle_internal_transcribe_audio(
 
     print(f"Internal transcribe request for file: {file_name}")
 
-    if Path(file_name).suffix.lower() not in {".wav", ".mp3"}:
+    if Path(file_name).suffix.lower() not in ALLOWED_SUFFIXES:
         raise HTTPException(status_code=400, detail="Unsupported file type")
 
     # Resolve full path and validate existence/content
@@ -73,20 +225,20 @@ async def handle_internal_transcribe_audio(
     if not full_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
 
-    try:
-        if mutagen.File(str(full_path)) is None:
-            raise ValueError
-    except Exception:
+    if await run_in_threadpool(_probe, full_path) is None:
         raise HTTPException(status_code=400, detail="Invalid audio file")
 
-    task = transcribe_audio_task.delay(
+    task = await run_in_threadpool(
+        enqueue_transcription,
         file_name,
         file_path=str(full_path),
         prompt=settings.whisper_initial_prompt,
         language=settings.whisper_language,
         timestamp=timestamp,
         tg_number=int(destination_id) if destination_id and destination_id.isdigit() else None,
-        unit_id=int(source_id) if source_id and source_id.isdigit() else None
+        unit_id=int(source_id) if source_id and source_id.isdigit() else None,
+        site=site,
     )
+    metrics.UPLOADS.labels("internal").inc()
 
     return {"message": "Transcription started", "taskId": task.id}
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import re
 import uuid
-import time
-from typing import Generator
+from typing import AsyncGenerator, Callable, Optional
 
 from fastapi.responses import StreamingResponse
 
-from ..events import subscribe_call_events, CallEvent
+from ..config.settings import settings
+from ..services.metrics import SSE_CLIENTS
+from ..events import (
+    CallEvent,
+    CallEventFilter,
+    call_event_stream_tail,
+    read_call_events_async,
+    replay_call_events_async,
+    stream_id_key,
+)
 
 HEARTBEAT_INTERVAL = 25  # seconds  (tweak as desired)
+RECONNECT_DELAY = 2  # seconds between Redis reconnect attempts
+STREAM_ID_RE = re.compile(r"^\d+-\d+$")
+
+logger = logging.getLogger(__name__)
 
 
 def _serialize_event(evt: CallEvent) -> str:
@@ -17,27 +32,165 @@ def _serialize_event(evt: CallEvent) -> str:
     return evt.model_dump_json()
 
 
-def create_call_stream_response() -> StreamingResponse:
-    """Flask Response emitting live CallEvent SSE."""
-    client_id = uuid.uuid4().hex
-    event_iter = subscribe_call_events()
-
-    def _stream() -> Generator[str, None, None]:
-        # send a one-time "connected" event immediately on connect
-        yield f"id: {client_id}\n"
-        yield "event: connected\n"
-        yield f"data: {json.dumps({'client_id': client_id})}\n\n"
-
-        last_heartbeat = time.time()
-        for evt in event_iter:
-            # Filter here if you need per-request scoping
-            yield f"id: {evt.call_id}\n"
-            yield f"event: call\n"
-            yield f"data: {_serialize_event(evt)}\n\n"
-
-            # Heartbeat comments keep proxies from timing out idle streams
-            if time.time() - last_heartbeat > HEARTBEAT_INTERVAL:
-                yield ": heartbeat\n\n"
-                last_heartbeat = time.time()
+def _render_frame(entry_id: str, evt: CallEvent) -> str:
+    """
+    Full SSE frame for one call; rendered once and shared by every client.
+
+    The SSE id is the Redis Stream entry id, so a reconnecting EventSource
+    sends it back as Last-Event-ID and resumes exactly where it left off.
+    """
+    return f"id: {entry_id}\nevent: call\ndata: {_serialize_event(evt)}\n\n"
+
+
+class _Client:
+    __slots__ = ("id", "queue", "accepts")
+
+    def __init__(self, maxsize: int, accepts: Optional[Callable[[CallEvent], bool]] = None):
+        self.id = uuid.uuid4().hex
+        self.accepts = accepts  # compiled CallEventFilter; None = every call
+        # (stream_id, frame); None is the "you were too slow, goodbye" sentinel
+        self.queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize=maxsize)
+
+
+class CallEventHub:
+    """
+    One Redis Stream reader per API process, fanned out to every SSE client.
+
+    The reader resumes from the last entry it saw, so a Redis blip doesn't
+    drop events for connected clients either.
+
+    Each client gets a bounded asyncio.Queue. A client whose queue fills up
+    (slow network, stalled tab) is disconnected rather than allowed to grow
+    memory; EventSource will reconnect on its own.
+    """
+
+    def __init__(self, queue_size: int = settings.sse_client_queue_size):
+        self.queue_size = queue_size
+        self._clients: dict[str, _Client] = {}
+        self._task: asyncio.Task | None = None
+        self._last_id: str | None = None
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="call-event-hub")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for client in list(self._clients.values()):
+            self._disconnect(client)
+
+    def register(self, accepts: Optional[Callable[[CallEvent], bool]] = None) -> _Client:
+        self.start()
+        client = _Client(self.queue_size, accepts)
+        self._clients[client.id] = client
+        SSE_CLIENTS.set(len(self._clients))
+        return client
+
+    def unregister(self, client: _Client) -> None:
+        self._clients.pop(client.id, None)
+        SSE_CLIENTS.set(len(self._clients))
+
+    def publish(self, entry_id: str, evt: CallEvent) -> None:
+        # Filter on the parsed event before anything is serialized; the frame
+        # is rendered at most once, and only if some client wants it
+        frame = None
+        for client in list(self._clients.values()):
+            if client.accepts is not None and not client.accepts(evt):
+                continue
+            if frame is None:
+                frame = _render_frame(entry_id, evt)
+            try:
+                client.queue.put_nowait((entry_id, frame))
+            except asyncio.QueueFull:
+                logger.info("SSE client %s fell behind; disconnecting", client.id)
+                self._disconnect(client)
+
+    def _disconnect(self, client: _Client) -> None:
+        self.unregister(client)
+        # Make room for the sentinel; the backlog is useless to a dropped client
+        while not client.queue.empty():
+            client.queue.get_nowait()
+        client.queue.put_nowait(None)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self._last_id is None:
+                    self._last_id = await call_event_stream_tail()
+                async for entry_id, evt in read_call_events_async(self._last_id):
+                    self._last_id = entry_id
+                    self.publish(entry_id, evt)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Call event subscription dropped (%s); reconnecting", exc)
+            await asyncio.sleep(RECONNECT_DELAY)
+
+
+hub = CallEventHub()
+
+
+def create_call_stream_response(
+        last_event_id: Optional[str] = None,
+        scope: Optional[CallEventFilter] = None,
+) -> StreamingResponse:
+    """
+    StreamingResponse emitting live CallEvent SSE from the shared hub.
+
+    With a `last_event_id` (the Last-Event-ID header of a reconnect) the
+    events missed since then are replayed from the Redis Stream first. If
+    the gap can't be filled (too long, or already trimmed) a `reset` event
+    tells the client to reload from /calls instead.
+
+    `scope` limits the stream (and the replay) to matching calls.
+    """
+    accepts = scope.compile() if scope is not None else None
+    # Register before replaying so nothing published meanwhile is missed;
+    # anything that shows up in both is dropped from the live side below
+    client = hub.register(accepts)
+
+    async def _stream() -> AsyncGenerator[str, None]:
+        try:
+            # send a one-time "connected" event immediately on connect (no
+            # id: it must not overwrite the client's Last-Event-ID)
+            yield "event: connected\n"
+            yield f"data: {json.dumps({'client_id': client.id})}\n\n"
+
+            replayed_up_to = None
+            if last_event_id and STREAM_ID_RE.match(last_event_id):
+                events, complete = await replay_call_events_async(last_event_id, settings.sse_replay_limit)
+                if not complete:
+                    yield "event: reset\ndata: {}\n\n"
+                else:
+                    for entry_id, evt in events:
+                        replayed_up_to = stream_id_key(entry_id)
+                        if accepts is None or accepts(evt):
+                            yield _render_frame(entry_id, evt)
+
+            while True:
+                try:
+                    frame = await asyncio.wait_for(client.queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    # Heartbeat comments keep proxies from timing out idle streams
+                    yield ": heartbeat\n\n"
+                    continue
+                if frame is None:
+                    break
+                entry_id, frame = frame
+                if replayed_up_to is not None and stream_id_key(entry_id) <= replayed_up_to:
+                    continue
+                yield frame
+        finally:
+            hub.unregister(client)
 
     return StreamingResponse(_stream(), media_type="text/event-stream")
@@ -0,0 +1 @@
+"""End-to-end throughput benchmarks (see __main__ for usage)."""
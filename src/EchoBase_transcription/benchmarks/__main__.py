@@ -0,0 +1,119 @@
+"""
+Throughput benchmark CLI.
+
+    python -m EchoBase_transcription.benchmarks run --calls 200 --mode batch
+    python -m EchoBase_transcription.benchmarks compare base.json head.json
+
+`run` writes a JSON result to --out (default benchmarks/results/); run it
+on two commits with the same arguments and `compare` the files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .compare import compare
+from .corpus import generate_corpus
+from .stats import StageTimer
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True).stdout.strip()
+        return out + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run(args: argparse.Namespace) -> int:
+    from . import standins
+
+    work_dir = standins.install(args.database_url)
+    model = standins.install_model(args.model, args.stub_rtf)
+
+    from .run import corpus_summary, run_fan_out, run_pipeline
+
+    clips = generate_corpus(
+        work_dir / "corpus", args.calls, seed=args.seed, mp3_share=args.mp3_share
+    )
+    timer = StageTimer()
+    pipeline = run_pipeline(clips, mode=args.mode, batch_size=args.batch_size, timer=timer)
+    fan_out = run_fan_out(clients=args.sse_clients, filters=args.sse_filtered, timer=timer)
+
+    commit = _git_commit()
+    result = {
+        "meta": {
+            "commit": commit,
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "model": model,
+            "database": os.environ["DATABASE_URL"].split(":", 1)[0],
+            "args": {k: v for k, v in vars(args).items() if k not in ("func", "out", "database_url")},
+        },
+        "corpus": corpus_summary(clips),
+        "pipeline": pipeline,
+        "sse": fan_out,
+        "stages": timer.summary(),
+    }
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    out = args.out / f"{stamp}_{commit or 'nogit'}_{args.mode}.json"
+    out.write_text(json.dumps(result, indent=2))
+
+    print(json.dumps({"pipeline": pipeline, "sse": fan_out}, indent=2))
+    print(f"\nwrote {out}")
+    return 0 if pipeline["failures"] == 0 else 1
+
+
+def _compare(args: argparse.Namespace) -> int:
+    print(compare(args.base, args.head))
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m EchoBase_transcription.benchmarks")
+    sub = parser.add_subparsers(required=True)
+
+    run = sub.add_parser("run", help="generate a corpus and time the pipeline")
+    run.add_argument("--calls", type=int, default=100, help="clips in the synthetic corpus")
+    run.add_argument("--seed", type=int, default=0, help="corpus seed (keep fixed across commits)")
+    run.add_argument("--mode", choices=("single", "batch"), default="single")
+    run.add_argument("--batch-size", type=int, default=8, help="WHISPER_BATCH_SIZE in batch mode")
+    run.add_argument("--model", default=None,
+                     help="real faster-whisper model (e.g. tiny.en); default is the stub")
+    run.add_argument("--stub-rtf", type=float, default=0.05,
+                     help="stub model: seconds of simulated inference per second of audio")
+    run.add_argument("--mp3-share", type=float, default=0.0, help="fraction of clips written as MP3 (ffmpeg)")
+    run.add_argument("--database-url", default=None, help="default: a throwaway SQLite file")
+    run.add_argument("--sse-clients", type=int, default=50)
+    run.add_argument("--sse-filtered", type=int, default=25, help="how many SSE clients use a talkgroup filter")
+    run.add_argument("--out", type=Path, default=Path("benchmarks/results"))
+    run.set_defaults(func=_run)
+
+    cmp = sub.add_parser("compare", help="diff two result files")
+    cmp.add_argument("base", type=Path)
+    cmp.add_argument("head", type=Path)
+    cmp.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
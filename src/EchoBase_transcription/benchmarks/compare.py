@@ -0,0 +1,50 @@
+"""Side-by-side comparison of two benchmark result files."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+# (section, key, higher_is_better)
+HEADLINE = (
+    ("pipeline", "calls_per_s", True),
+    ("pipeline", "rtf", False),
+    ("pipeline", "inference_rtf", False),
+)
+
+
+def _pct(before, after) -> str:
+    if not before or after is None:
+        return ""
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(base_path: Path, head_path: Path) -> str:
+    base = json.loads(Path(base_path).read_text())
+    head = json.loads(Path(head_path).read_text())
+
+    lines = [
+        f"base: {base['meta'].get('commit')}  ({base_path})",
+        f"head: {head['meta'].get('commit')}  ({head_path})",
+    ]
+    if base["meta"].get("args") != head["meta"].get("args"):
+        lines.append("warning: the runs used different arguments; numbers may not be comparable")
+    lines.append("")
+
+    for section, key, higher_is_better in HEADLINE:
+        before, after = base[section].get(key), head[section].get(key)
+        better = after is not None and before is not None and (after > before) == higher_is_better
+        mark = "" if before == after else (" better" if better else " worse")
+        lines.append(f"{key:<16} {before!s:>10} -> {after!s:<10} {_pct(before, after):>8}{mark}")
+
+    lines += ["", f"{'stage (p50 / p99 ms)':<22} {'base':>20} {'head':>20} {'p50':>8}"]
+    stages = sorted(set(base["stages"]) | set(head["stages"]))
+    for stage in stages:
+        b, h = base["stages"].get(stage, {}), head["stages"].get(stage, {})
+        lines.append(
+            f"{stage:<22} "
+            f"{b.get('p50_ms', '-')!s:>9} / {b.get('p99_ms', '-')!s:<8} "
+            f"{h.get('p50_ms', '-')!s:>9} / {h.get('p99_ms', '-')!s:<8} "
+            f"{_pct(b.get('p50_ms'), h.get('p50_ms')):>8}"
+        )
+    return "\n".join(lines)
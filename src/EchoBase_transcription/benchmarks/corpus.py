@@ -0,0 +1,156 @@
+"""
+Synthetic radio-call corpus.
+
+Real recordings can't be checked in, so the benchmark synthesises clips
+with the properties that matter to the pipeline:
+
+- "voice": a band-limited harmonic voice proxy with a syllable envelope,
+  carrier hiss and a squelch tail (what the VAD should pass),
+- "noise": key-ups that carry nothing but low-level carrier hiss,
+- "tone": steady data / paging tones,
+- "long": voice calls over one Whisper window (single-call path in batch
+  mode).
+
+Clips are 8 kHz mono 16-bit like SDRTrunk's output and named the way
+SDRTrunk names them, so talkgroup / radio ids are parsed exactly as in
+production. With ffmpeg on PATH a share of them is written as MP3.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import wave
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+RATE = 8_000
+DEFAULT_MIX = {"voice": 0.7, "noise": 0.15, "tone": 0.05, "long": 0.1}
+
+
+@dataclass(frozen=True)
+class Clip:
+    path: Path
+    kind: str
+    duration: float
+    tg_number: int
+    unit_id: int
+
+
+def _bandpass(signal: np.ndarray, low: float, high: float) -> np.ndarray:
+    spectrum = np.fft.rfft(signal)
+    freqs = np.fft.rfftfreq(len(signal), 1 / RATE)
+    spectrum[(freqs < low) | (freqs > high)] = 0
+    return np.fft.irfft(spectrum, len(signal))
+
+
+def _hiss(rng: np.random.Generator, n: int, level: float) -> np.ndarray:
+    return _bandpass(rng.normal(0, 1, n), 300, 3400) * level
+
+
+def _voice(rng: np.random.Generator, seconds: float) -> np.ndarray:
+    """Syllable-rate bursts of a gliding harmonic series (300-3400 Hz radio band)."""
+    n = int(seconds * RATE)
+    t = np.arange(n) / RATE
+    f0 = rng.uniform(95, 210) * (1 + 0.08 * np.sin(2 * np.pi * rng.uniform(0.5, 2) * t))
+    phase = 2 * np.pi * np.cumsum(f0) / RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 16))
+
+    envelope = np.zeros(n)
+    cursor = int(rng.uniform(0.1, 0.3) * RATE)
+    while cursor < n:
+        syllable = int(rng.uniform(0.12, 0.3) * RATE)
+        end = min(cursor + syllable, n)
+        envelope[cursor:end] = np.hanning(syllable)[: end - cursor] * rng.uniform(0.5, 1.0)
+        # short gaps between syllables, longer ones between phrases
+        cursor = end + int((rng.uniform(0.3, 0.8) if rng.random() < 0.15 else rng.uniform(0.02, 0.1)) * RATE)
+    return _bandpass(voiced * envelope, 300, 3400)
+
+
+def synthesize(kind: str, rng: np.random.Generator) -> np.ndarray:
+    """Float samples in [-1, 1] at RATE for one clip of `kind`."""
+    if kind == "voice":
+        audio = _voice(rng, rng.uniform(2.0, 12.0))
+    elif kind == "long":
+        audio = _voice(rng, rng.uniform(35.0, 55.0))
+    elif kind == "noise":
+        # open carrier, nobody talking: low-level hiss only
+        return _hiss(rng, int(rng.uniform(0.8, 4.0) * RATE), rng.uniform(0.0005, 0.002))
+    elif kind == "tone":
+        n = int(rng.uniform(1.0, 3.0) * RATE)
+        audio = 0.4 * np.sin(2 * np.pi * rng.choice([853.0, 960.0, 1000.0, 1200.0]) * np.arange(n) / RATE)
+    else:
+        raise ValueError(f"unknown clip kind {kind!r}")
+
+    peak = np.max(np.abs(audio)) or 1.0
+    audio = audio / peak * rng.uniform(0.3, 0.8)
+    audio += _hiss(rng, len(audio), rng.uniform(0.003, 0.02))
+    if kind == "tone":
+        return np.clip(audio, -1.0, 1.0)
+    # voice transmissions end with a burst of squelch noise
+    tail = int(0.15 * RATE)
+    audio = np.concatenate([audio, _hiss(rng, tail, 0.15)])
+    return np.clip(audio, -1.0, 1.0)
+
+
+def _write_wav(path: Path, audio: np.ndarray) -> None:
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(RATE)
+        f.writeframes((audio * 32767).astype("<i2").tobytes())
+
+
+def _to_mp3(wav: Path) -> Path:
+    mp3 = wav.with_suffix(".mp3")
+    subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-y", "-i", str(wav), "-codec:a", "libmp3lame", "-b:a", "16k", str(mp3)],
+        check=True,
+    )
+    wav.unlink()
+    return mp3
+
+
+def generate_corpus(
+        out_dir: Path,
+        count: int,
+        *,
+        seed: int = 0,
+        mix: dict[str, float] | None = None,
+        mp3_share: float = 0.0,
+        talkgroups: int = 20,
+        units: int = 200,
+) -> list[Clip]:
+    """
+    Write `count` clips to `out_dir` and describe them.
+
+    The same `seed` always yields the same corpus, so results from two
+    commits are comparable.
+    """
+    mix = mix or DEFAULT_MIX
+    rng = np.random.default_rng(seed)
+    kinds = list(mix)
+    weights = np.array([mix[k] for k in kinds], dtype=float)
+    if mp3_share and shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required for MP3 clips (--mp3-share)")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    started = datetime(2026, 1, 1, 8, 0, 0)
+    tg_numbers = rng.choice(np.arange(41001, 49999), size=talkgroups, replace=False)
+    unit_ids = rng.choice(np.arange(1_000_000, 9_999_999), size=units, replace=False)
+
+    clips = []
+    for i in range(count):
+        kind = kinds[rng.choice(len(kinds), p=weights / weights.sum())]
+        audio = synthesize(kind, rng)
+        tg, unit = int(rng.choice(tg_numbers)), int(rng.choice(unit_ids))
+        stamp = (started + timedelta(seconds=7 * i)).strftime("%Y%m%d_%H%M%S")
+        path = out_dir / f"{stamp}_Bench_Site1_TO_{tg}_FROM_{unit}.wav"
+        _write_wav(path, audio)
+        if rng.random() < mp3_share:
+            path = _to_mp3(path)
+        clips.append(Clip(path=path, kind=kind, duration=len(audio) / RATE, tg_number=tg, unit_id=unit))
+    return clips
@@ -0,0 +1,192 @@
+"""
+Pipeline and SSE fan-out benchmarks.
+
+Everything here imports the application lazily: `standins.install()` has
+to patch settings and Redis before the first import.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from .corpus import Clip
+from .stats import StageTimer
+
+
+class _TimedModel:
+    """Drains the (lazy) segment generator inside the timed section."""
+
+    def __init__(self, model, timer: StageTimer):
+        self._model = model
+        self._timer = timer
+
+    def transcribe(self, audio, **kwargs):
+        with self._timer.time("inference"):
+            segments, info = self._model.transcribe(audio, **kwargs)
+            segments = list(segments)
+        return segments, info
+
+
+def _instrument(timer: StageTimer) -> None:
+    from ..services import call_service, call_writer
+    from ..worker.tasks import transcribe
+
+    timer.wrap(transcribe, "load_audio", "decode")
+    timer.wrap(transcribe, "detect_voice", "vad")
+    timer.wrap(transcribe, "transcribe_many", "inference")
+    timer.wrap(transcribe, "_resolve_related_ids", "resolve")
+    timer.wrap(transcribe, "_await_call", "writer_wait")
+    timer.wrap(call_writer, "insert_calls_bulk", "db_write")
+    timer.wrap(call_service, "publish_call_updates", "publish")
+    timer.swap(transcribe, "whisper_model", _TimedModel(transcribe.whisper_model, timer))
+
+
+def _batch_request(clip: Clip):
+    """A celery-batches request as the worker hands it over (headers in request_dict)."""
+    from celery_batches import SimpleRequest
+
+    from ..services.sdrtrunk import recording_task_kwargs
+
+    task_id = uuid.uuid4().hex
+    return SimpleRequest(
+        id=task_id,
+        name="transcribe_audio_batch",
+        args=(clip.path.name, str(clip.path)),
+        kwargs=recording_task_kwargs(clip.path),
+        delivery_info={"routing_key": "default"},
+        hostname="bench",
+        ignore_result=False,
+        reply_to=None,
+        correlation_id=task_id,
+        request_dict={"id": task_id, "enqueued_at": time.time()},
+    )
+
+
+def _queue_wait_samples() -> int:
+    """Queue waits recorded by the worker code (batch requests must report theirs too)."""
+    from ..services import metrics
+
+    return int(sum(
+        sample.value
+        for family in metrics.QUEUE_WAIT_SECONDS.collect()
+        for sample in family.samples
+        if sample.name.endswith("_count")
+    ))
+
+
+def run_pipeline(clips: list[Clip], *, mode: str, batch_size: int, timer: StageTimer) -> dict:
+    """
+    Push every clip through the worker code path and time it.
+
+    "single": enqueue_transcription → transcribe_audio_task (eager), one
+    call per task. "batch": _transcribe_batch over WHISPER_BATCH_SIZE
+    requests, as celery-batches would hand them over.
+    """
+    from sqlmodel import func, select
+
+    from ..config import settings
+    from ..db import get_session
+    from ..db.models.call import Call
+    from ..services.sdrtrunk import recording_task_kwargs
+    from ..worker.tasks import transcribe
+
+    _instrument(timer)
+    failures = 0
+    started = time.perf_counter()
+    try:
+        if mode == "single":
+            for clip in clips:
+                try:
+                    with timer.time("call"):
+                        transcribe.enqueue_transcription(
+                            clip.path.name, str(clip.path), **recording_task_kwargs(clip.path)
+                        )
+                except Exception:  # noqa: BLE001
+                    failures += 1
+        else:
+            settings.whisper_batch_size = batch_size
+            for i in range(0, len(clips), batch_size):
+                requests = [_batch_request(clip) for clip in clips[i:i + batch_size]]
+                with timer.time("batch"):
+                    transcribe._transcribe_batch(requests)
+    finally:
+        wall = time.perf_counter() - started
+        timer.restore()
+
+    with get_session() as session:
+        stored = session.exec(select(func.count()).select_from(Call)).one()
+        no_speech = session.exec(select(func.count()).select_from(Call).where(Call.no_speech)).one()
+
+    if mode != "single":
+        failures = len(clips) - stored
+    audio_seconds = sum(clip.duration for clip in clips)
+    inference = sum(timer.samples.get("inference", []))
+    # A run with failed calls did less work than it claims; report no rate at all
+    complete = failures == 0 and wall > 0
+    return {
+        "calls": len(clips),
+        "stored": stored,
+        "no_speech": no_speech,
+        "failures": failures,
+        "wall_s": round(wall, 3),
+        "calls_per_s": round(len(clips) / wall, 3) if complete else None,
+        "audio_s": round(audio_seconds, 1),
+        # wall seconds per second of audio; < 1 means faster than real time
+        "rtf": round(wall / audio_seconds, 4) if complete and audio_seconds else None,
+        "inference_rtf": round(inference / audio_seconds, 4) if complete and audio_seconds else None,
+        "queue_waits": _queue_wait_samples(),
+    }
+
+
+async def _fan_out(clients: int, filters: int, timer: StageTimer) -> dict:
+    from ..api.sse import CallEventHub
+    from ..events import CallEventFilter, replay_call_events_async
+
+    with timer.time("sse.replay_decode"):
+        events, _complete = await replay_call_events_async("0-0", limit=1_000_000)
+    if not events:
+        return {"events": 0}
+
+    talkgroups = sorted({evt.talkgroup_id for _, evt in events if evt.talkgroup_id is not None})
+    hub = CallEventHub(queue_size=len(events) + 1)
+    hub.start = lambda: None  # no live reader: events are fed in below
+    registered = []
+    for i in range(clients):
+        scope = None
+        if i < filters and talkgroups:
+            scope = CallEventFilter(talkgroup_id=talkgroups[i % len(talkgroups)::max(len(talkgroups) // 2, 1)])
+        registered.append(hub.register(scope.compile() if scope else None))
+
+    for entry_id, evt in events:
+        with timer.time("sse.publish"):
+            hub.publish(entry_id, evt)
+    delivered = sum(client.queue.qsize() for client in registered)
+    return {"events": len(events), "clients": clients, "filtered_clients": min(filters, clients), "delivered": delivered}
+
+
+def run_fan_out(*, clients: int, filters: int, timer: StageTimer) -> dict:
+    """Replay the events the pipeline run published through an SSE hub with `clients` listeners."""
+    return asyncio.run(_fan_out(clients, filters, timer))
+
+
+def corpus_summary(clips: list[Clip]) -> dict:
+    durations = np.array([clip.duration for clip in clips])
+    kinds: dict[str, int] = {}
+    for clip in clips:
+        kinds[clip.kind] = kinds.get(clip.kind, 0) + 1
+    return {
+        "clips": len(clips),
+        "kinds": kinds,
+        "formats": sorted({Path(clip.path).suffix for clip in clips}),
+        "duration_s": {
+            "min": round(float(durations.min()), 2),
+            "mean": round(float(durations.mean()), 2),
+            "max": round(float(durations.max()), 2),
+        },
+        "audio_s": round(float(durations.sum()), 1),
+    }
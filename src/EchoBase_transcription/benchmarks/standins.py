@@ -0,0 +1,158 @@
+"""
+Local stand-ins for the services the pipeline talks to.
+
+`install()` must run before anything under EchoBase_transcription that
+reads settings is imported: the engine, the Redis clients and the Celery
+app are all created at import time.
+
+- Database: a throwaway SQLite file (or any DATABASE_URL, e.g. a scratch
+  Postgres), with tables created by init_db.
+- Redis: every `Redis.from_url` (sync and asyncio) returns a fakeredis
+  client on one shared in-process server, so the in-flight keys, the
+  call-event stream and the SSE replay all behave as in production.
+- Celery: eager mode with an in-memory broker and result backend.
+- Whisper: `StubWhisperModel` emits plausible segments after sleeping for
+  `rtf` x the audio it was given, isolating everything around inference;
+  pass a real model name to measure the model too.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class StubSegment:
+    """The fields of faster_whisper's Segment that the pipeline reads."""
+
+    id: int
+    start: float
+    end: float
+    text: str
+    avg_logprob: float
+    no_speech_prob: float
+
+
+@dataclass(frozen=True)
+class StubInfo:
+    language: str = "en"
+    duration: float = 0.0
+
+
+_PHRASES = (
+    "engine 12 responding",
+    "copy that, en route",
+    "10-4 show me on scene",
+    "medic 7 available",
+    "dispatch, can you repeat the address",
+)
+
+
+class StubWhisperModel:
+    """
+    Stands in for WhisperModel and BatchedInferencePipeline.
+
+    Inference cost is simulated as `rtf` seconds of sleep per second of
+    audio actually decoded (so VAD trimming shows up as saved time).
+    """
+
+    def __init__(self, rtf: float = 0.05, sample_rate: int = 16_000):
+        self.rtf = rtf
+        self.sample_rate = sample_rate
+        self._n = 0
+
+    def _spans(self, audio, clip_timestamps) -> list[tuple[float, float]]:
+        total = len(audio) / self.sample_rate
+        if not clip_timestamps or clip_timestamps == "0":
+            return [(0.0, total)]
+        if isinstance(clip_timestamps[0], dict):  # batched: sample offsets
+            return [(c["start"] / self.sample_rate, c["end"] / self.sample_rate) for c in clip_timestamps]
+        flat = list(clip_timestamps) + ([total] if len(clip_timestamps) % 2 else [])
+        return list(zip(flat[::2], flat[1::2]))
+
+    def transcribe(self, audio, language=None, clip_timestamps="0", **_kwargs):
+        spans = self._spans(audio, clip_timestamps)
+        time.sleep(sum(end - start for start, end in spans) * self.rtf)
+        segments = []
+        for start, end in spans:
+            self._n += 1
+            segments.append(StubSegment(
+                id=self._n,
+                start=start,
+                end=end,
+                text=" " + _PHRASES[self._n % len(_PHRASES)],
+                avg_logprob=-0.2 - 0.1 * (self._n % 5),
+                no_speech_prob=0.02 * (self._n % 7),
+            ))
+        return iter(segments), StubInfo(language=language or "en", duration=len(audio) / self.sample_rate)
+
+
+def install(database_url: Optional[str] = None, work_dir: Optional[Path] = None) -> Path:
+    """
+    Point settings at the stand-ins and patch the Redis clients.
+
+    Returns the working directory (temp audio, SQLite file).
+    """
+    import fakeredis
+    import redis
+    import redis.asyncio as aioredis
+
+    work_dir = Path(work_dir or tempfile.mkdtemp(prefix="echobase-bench-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    os.environ["DATABASE_URL"] = database_url or f"sqlite:///{work_dir / 'bench.db'}"
+    os.environ["REDIS_URL"] = "redis://bench/0"
+    os.environ.setdefault("FLASK_API_KEY", "bench")
+    os.environ["TEMP_AUDIO_PATH"] = str(work_dir / "audio")
+    os.environ.setdefault("CATCH_UP_INTERVAL_SECONDS", "0")
+
+    server = fakeredis.FakeServer()
+    redis.Redis.from_url = classmethod(
+        lambda cls, url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs)
+    )
+    aioredis.Redis.from_url = classmethod(
+        lambda cls, url, **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs)
+    )
+
+    from ..db import init_db, models  # noqa: F401  (registers the tables)
+    from ..worker.celery_app import celery_app
+
+    init_db()
+    celery_app.conf.update(
+        broker_url="memory://",
+        result_backend="cache+memory://",
+        task_always_eager=True,
+        task_eager_propagates=True,
+        task_store_eager_result=False,
+    )
+    return work_dir
+
+
+def install_model(model_name: Optional[str], rtf: float) -> str:
+    """
+    Load `model_name` into the worker (real faster-whisper model), or the
+    stub when None. Returns the label recorded in the results.
+    """
+    from ..config import settings
+    from ..services.whisper import ModelLoader
+    from ..worker.tasks import transcribe
+
+    if model_name:
+        settings.whisper_model_name = model_name
+        transcribe.whisper_model = ModelLoader.get_model(model_name)
+        return model_name
+
+    stub = StubWhisperModel(rtf=rtf)
+    name = settings.whisper_model_name
+    ModelLoader._models[name] = stub
+    ModelLoader._batched[name] = stub
+    if settings.whisper_cascade_model:
+        ModelLoader._models[settings.whisper_cascade_model] = stub
+        ModelLoader._batched[settings.whisper_cascade_model] = stub
+    transcribe.whisper_model = stub
+    return f"stub(rtf={rtf})"
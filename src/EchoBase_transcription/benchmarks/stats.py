@@ -0,0 +1,81 @@
+"""Per-stage wall-clock timing for the benchmark runs."""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+
+
+def summarize(samples: list[float]) -> dict:
+    """Percentiles of `samples` (seconds) in milliseconds."""
+    if not samples:
+        return {"count": 0}
+    ms = np.asarray(samples) * 1000
+    return {
+        "count": len(ms),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p90_ms": round(float(np.percentile(ms, 90)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "mean_ms": round(float(ms.mean()), 3),
+        "max_ms": round(float(ms.max()), 3),
+        "total_s": round(float(ms.sum()) / 1000, 3),
+    }
+
+
+class StageTimer:
+    """
+    Collects durations per named stage.
+
+    `wrap` replaces a module attribute with a timed version, so stages are
+    measured in the real code path without touching it; `restore` puts
+    every original back.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self._patched: list[tuple[object, str, object]] = []
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.samples[stage].append(seconds)
+
+    @contextmanager
+    def time(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def swap(self, owner: object, attr: str, value: object) -> None:
+        """Replace `owner.attr` until restore()."""
+        self._patched.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, value)
+
+    def wrap(self, owner: object, attr: str, stage: str) -> None:
+        original = getattr(owner, attr)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            with self.time(stage):
+                return original(*args, **kwargs)
+
+        self.swap(owner, attr, timed)
+
+    def restore(self) -> None:
+        for owner, attr, original in reversed(self._patched):
+            setattr(owner, attr, original)
+        self._patched.clear()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.samples.clear()
+
+    def summary(self) -> dict:
+        return {stage: summarize(samples) for stage, samples in sorted(self.samples.items())}
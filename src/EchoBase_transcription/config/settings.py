@@ -28,6 +28,22 @@ class Settings(BaseSettings):
     # --------------------------------------------------------------------- #
     redis_url: str = Field("redis://redis:6379/0", validation_alias="REDIS_URL")
 
+    # Priority tiers: calls are routed to transcribe_high / default / transcribe_low.
+    # "high:1001,1002;low:3001" (tg_numbers, any system) overrides TalkGroup.priority.
+    priority_talkgroups: str = Field("", validation_alias="PRIORITY_TALKGROUPS")
+    priority_refresh_seconds: int = Field(60, validation_alias="PRIORITY_REFRESH_SECONDS")
+
+    # Bus payload encoding: json | msgpack (subscribers accept both)
+    event_encoding: str = Field("json", validation_alias="EVENT_ENCODING")
+
+    # Call events live in a capped Redis Stream: roughly this many are kept for
+    # Last-Event-ID replay; at most SSE_REPLAY_LIMIT are replayed per reconnect.
+    call_event_stream_maxlen: int = Field(10_000, validation_alias="CALL_EVENT_STREAM_MAXLEN")
+    sse_replay_limit: int = Field(1_000, validation_alias="SSE_REPLAY_LIMIT")
+
+    # Per-client SSE buffer; clients that fall this far behind are disconnected
+    sse_client_queue_size: int = Field(256, validation_alias="SSE_CLIENT_QUEUE_SIZE")
+
     # --------------------------------------------------------------------- #
     # Whisper
     # --------------------------------------------------------------------- #
@@ -38,11 +54,106 @@ class Settings(BaseSettings):
     whisper_compute_type: Optional[str] = Field(None, validation_alias="WHISPER_COMPUTE_TYPE")
     whisper_cache_dir: str = Field("/models", validation_alias="WHISPER_CACHE_DIR")
 
+    # Worker pool. "solo" runs one call at a time in the main process;
+    # "threads" runs WORKER_CONCURRENCY calls at once against one model whose
+    # replicas share the weights; "prefork" runs WORKER_CONCURRENCY children,
+    # each building its own copy of the model (CTranslate2 models can't cross
+    # fork()), so it needs that many times the memory.
+    # Concurrency 0 = cores / WHISPER_CPU_THREADS; each replica / child decodes
+    # with WHISPER_CPU_THREADS intra-op threads (0 = even share of the cores).
+    # Prefork children above WORKER_MAX_MEMORY_PER_CHILD_MB are replaced after
+    # their current task (0 = never).
+    worker_pool: str = Field("solo", validation_alias="WORKER_POOL")
+    worker_concurrency: int = Field(0, validation_alias="WORKER_CONCURRENCY")
+    whisper_cpu_threads: int = Field(0, validation_alias="WHISPER_CPU_THREADS")
+    worker_max_memory_per_child_mb: int = Field(0, validation_alias="WORKER_MAX_MEMORY_PER_CHILD_MB")
+
+    # Batched inference: a worker collects up to WHISPER_BATCH_SIZE queued calls
+    # (or waits WHISPER_BATCH_INTERVAL_MS) and decodes them in one pass.
+    # 0 or 1 keeps the one-call-per-task path.
+    whisper_batch_size: int = Field(0, validation_alias="WHISPER_BATCH_SIZE")
+    whisper_batch_interval_ms: int = Field(500, validation_alias="WHISPER_BATCH_INTERVAL_MS")
+
+    # Model cascade: every call goes through WHISPER_MODEL_NAME first; calls whose
+    # confidence / no-speech stats miss these thresholds are re-run on
+    # WHISPER_CASCADE_MODEL. Unset disables the cascade.
+    whisper_cascade_model: Optional[str] = Field(None, validation_alias="WHISPER_CASCADE_MODEL")
+    cascade_min_confidence: float = Field(0.6, validation_alias="CASCADE_MIN_CONFIDENCE")
+    cascade_min_segment_confidence: float = Field(0.3, validation_alias="CASCADE_MIN_SEGMENT_CONFIDENCE")
+    cascade_max_no_speech_prob: float = Field(0.5, validation_alias="CASCADE_MAX_NO_SPEECH_PROB")
+
+    # Voice-activity pre-filter (services/vad.py): calls without speech skip the model
+    vad_enabled: bool = Field(True, validation_alias="VAD_ENABLED")
+    vad_margin_db: float = Field(10.0, validation_alias="VAD_MARGIN_DB")  # above the clip's noise floor
+    vad_abs_floor_db: float = Field(-50.0, validation_alias="VAD_ABS_FLOOR_DB")  # dBFS, never speech below
+    vad_max_flatness: float = Field(0.5, validation_alias="VAD_MAX_FLATNESS")  # hiss/carrier is ~1
+    vad_min_speech_ms: int = Field(300, validation_alias="VAD_MIN_SPEECH_MS")
+
+    # Long recordings (at least CHUNK_MIN_SECONDS; 0 = never) are cut at silences
+    # into ~CHUNK_TARGET_SECONDS chunks, transcribed in parallel and merged
+    chunk_min_seconds: float = Field(300.0, validation_alias="CHUNK_MIN_SECONDS")
+    chunk_target_seconds: float = Field(60.0, validation_alias="CHUNK_TARGET_SECONDS")
+
+    # Simulcast / repeat suppression (services/dedup_service.py): a voiced call
+    # whose talkgroup, source unit and audio envelope match a call within
+    # DEDUP_WINDOW_SECONDS is linked to it (Call.duplicate_of) and skips the
+    # model. A copy whose original is still being transcribed is re-queued as a
+    # link_duplicate task, re-checked every few seconds for up to
+    # DEDUP_WAIT_SECONDS, then transcribed itself; no worker sleeps on it.
+    # Longer waits catch more copies of slow originals, at the price of those
+    # copies' Call rows (and events) arriving later.
+    dedup_enabled: bool = Field(True, validation_alias="DEDUP_ENABLED")
+    dedup_window_seconds: float = Field(3.0, validation_alias="DEDUP_WINDOW_SECONDS")
+    dedup_min_similarity: float = Field(0.85, validation_alias="DEDUP_MIN_SIMILARITY")  # envelope correlation
+    dedup_wait_seconds: float = Field(20.0, validation_alias="DEDUP_WAIT_SECONDS")
+
+    # Automatic review gate (confidence is exp(avg_logprob) * (1 - no_speech))
+    review_min_confidence: float = Field(0.45, validation_alias="REVIEW_MIN_CONFIDENCE")
+    review_max_no_speech_prob: float = Field(0.6, validation_alias="REVIEW_MAX_NO_SPEECH_PROB")
+
+    # Buffered Call writer (worker): calls finished at the same time (batch mode,
+    # WHISPER_BATCH_SIZE > 1) are inserted together, up to CALL_WRITER_BATCH_SIZE
+    # per transaction. The one-call-per-task path waits on each call, so it
+    # writes one row per transaction. 0 ms groups only what is already waiting
+    # (no added latency); more holds the first call up to that long.
+    call_writer_batch_size: int = Field(100, validation_alias="CALL_WRITER_BATCH_SIZE")
+    call_writer_flush_ms: int = Field(0, validation_alias="CALL_WRITER_FLUSH_MS")
+
+    # Per-process LRU size for talkgroup / radio unit id resolution
+    resolver_cache_size: int = Field(4096, validation_alias="RESOLVER_CACHE_SIZE")
+
+    # Prometheus: the API serves GET /metrics; each worker serves /metrics on
+    # this port (0 = off). Prefork pools (and multi-process API servers) must
+    # also set PROMETHEUS_MULTIPROC_DIR to an empty, writable directory.
+    worker_metrics_port: int = Field(9191, validation_alias="WORKER_METRICS_PORT")
+
     # --------------------------------------------------------------------- #
     # Files & paths
     # --------------------------------------------------------------------- #
     call_watch_path: Optional[str] = Field(None, validation_alias="CALL_WATCH_PATH")
     temp_audio_path: str = Field("/tmp/audio", validation_alias="TEMP_AUDIO_PATH")
+    max_upload_bytes: int = Field(50 * 1024 * 1024, validation_alias="MAX_UPLOAD_BYTES")
+
+    # Catch-up scanner: files younger than the settle time are left for the
+    # next run (may still be written); the overlap re-checks recent files.
+    scan_settle_seconds: int = Field(10, validation_alias="SCAN_SETTLE_SECONDS")
+    scan_overlap_seconds: int = Field(600, validation_alias="SCAN_OVERLAP_SECONDS")
+    scan_db_batch_size: int = Field(500, validation_alias="SCAN_DB_BATCH_SIZE")
+    # Interval of the beat catch-up scan; 0 disables it (e.g. when the
+    # inotify watcher is running, which scans once on start-up instead)
+    catch_up_interval_seconds: int = Field(300, validation_alias="CATCH_UP_INTERVAL_SECONDS")
+    # Quiet period after the last write before the watcher enqueues a file
+    watcher_debounce_ms: int = Field(250, validation_alias="WATCHER_DEBOUNCE_MS")
+    # How long a queued file is considered in flight if its task never reports back
+    inflight_ttl_seconds: int = Field(6 * 3600, validation_alias="INFLIGHT_TTL_SECONDS")
+
+    # Content-addressed audio store (services/audio_store.py); off when unset.
+    # Stored calls are moved to <path>/ab/cd/<sha256>.<ext>, identical audio kept once.
+    audio_store_path: Optional[str] = Field(None, validation_alias="AUDIO_STORE_PATH")
+    audio_store_format: str = Field("opus", validation_alias="AUDIO_STORE_FORMAT")  # opus | original
+    audio_store_opus_bitrate: int = Field(16_000, validation_alias="AUDIO_STORE_OPUS_BITRATE")  # bits/s
+    # Uploads are always removed once stored; SDRTrunk recordings only with this on
+    audio_store_delete_source: bool = Field(False, validation_alias="AUDIO_STORE_DELETE_SOURCE")
 
     # --------------------------------------------------------------------- #
     # Database
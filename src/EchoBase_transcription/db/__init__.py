@@ -23,6 +23,20 @@ def init_db() -> None:
     SQLModel.metadata.create_all(bind=engine)
 
 
+def dialect_insert(table):
+    """
+    ``INSERT`` construct with ``ON CONFLICT`` support for the configured backend.
+
+    Production runs on Postgres; SQLite (benchmarks, one-off scripts) has the
+    same on_conflict_do_nothing / on_conflict_do_update API.
+    """
+    if engine.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(table)
+
+
 @contextmanager
 def get_session() -> Generator:
     """Provide a transactional scope around a series of operations.
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Column, JSON
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
@@ -16,15 +17,19 @@ class CallBase(SQLModel):
     # Core timing
     timestamp: datetime = Field(index=True)
     duration: Optional[float] = None  # seconds of audio
+    sample_rate: Optional[int] = None  # of the source file (header), before resampling
+    channels: Optional[int] = None
 
     # File path
-    audio_path: str
+    audio_path: str = Field(index=True)
+    site: Optional[str] = None  # recording site / channel label, when known
 
     # ASR data
     transcript: Optional[str] = None
     corrected_transcript: Optional[str] = None
     confidence: Optional[float] = None
     needs_review: bool = Field(default=False)
+    no_speech: bool = Field(default=False)  # VAD found no voice; model was skipped
     transcriber: Optional[str] = None
 
     reviewed_at: Optional[datetime] = None
@@ -42,6 +47,16 @@ class Call(CallBase, table=True):
     talkgroup_id: Optional[int] = Field(default=None, foreign_key="talkgroups.id", index=True)
     unit_id: Optional[int] = Field(default=None, foreign_key="radio_units.id", index=True)
     reviewed_by: Optional[int] = Field(default=None, foreign_key="users.id")
+    # Simulcast / repeat copy of another call: no transcript of its own
+    duplicate_of: Optional[int] = Field(default=None, foreign_key="calls.id", index=True)
+
+    # Compact per-segment ASR output: [[start, end, confidence, no_speech_prob, text], ...]
+    segments: Optional[list] = Field(default=None, sa_column=Column(JSON, nullable=True))
+
+    # Audio store (services/audio_store.py): once archived, audio_path points
+    # into the store and source_path keeps the original recording / upload path
+    source_path: Optional[str] = Field(default=None, index=True)
+    audio_sha256: Optional[str] = Field(default=None, index=True, max_length=64)
 
     # Relationships
     system: "System" = Relationship(back_populates="calls")
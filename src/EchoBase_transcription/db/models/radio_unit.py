@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import UniqueConstraint
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
@@ -19,6 +20,9 @@ class RadioUnit(RadioUnitBase, table=True):
     """Individual subscriber radio (the 'from' ID)."""
 
     __tablename__ = "radio_units"
+    __table_args__ = (
+        UniqueConstraint("system_id", "unit_id", name="uq_radio_units_system_unit"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
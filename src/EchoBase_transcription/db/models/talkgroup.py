@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import UniqueConstraint
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
@@ -14,12 +15,16 @@ class TalkGroupBase(SQLModel):
     tg_number: int
     alias: Optional[str] = None
     whisper_prompt: Optional[str] = None
+    priority: Optional[str] = None  # "high" | "low" queue tier; None = normal
 
 
 class TalkGroup(TalkGroupBase, table=True):
     """A talk‑group / channel within a system."""
 
     __tablename__ = "talkgroups"
+    __table_args__ = (
+        UniqueConstraint("system_id", "tg_number", name="uq_talkgroups_system_tg"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -10,13 +10,16 @@ from .call import (
     CallRead,
     CallPatch,
     CallSearch,
+    CallSearchHit,
+    TranscriptSearch,
 )
-from .base import DTOBase, Page
+from .base import DTOBase, Page, TotalMode
 
 __all__ = [
     # Shared
     "DTOBase",
     "Page",
+    "TotalMode",
     # System
     "SystemCreate",
     "SystemRead",
@@ -31,4 +34,6 @@ __all__ = [
     "CallRead",
     "CallPatch",
     "CallSearch",
+    "CallSearchHit",
+    "TranscriptSearch",
 ]
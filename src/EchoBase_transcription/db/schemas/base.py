@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from sqlmodel import SQLModel, Field
 
@@ -27,10 +27,21 @@ class DTOBase(SQLModel):
     }
 
 
+TotalMode = Literal["none", "estimate", "exact"]
+
+
 class Page(DTOBase):
-    """Generic pagination wrapper for list endpoints."""
+    """
+    Generic pagination wrapper for list endpoints.
+
+    Keyset-paginated endpoints fill next_cursor / prev_cursor (opaque strings
+    to pass back as `cursor`); `total` is only exact when asked for.
+    """
 
     items: list[Any]
-    total: int
+    total: int | None = None
+    total_is_estimate: bool = False
     page: int = Field(1, ge=1)
     per_page: int = Field(50, ge=1, le=500)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+
+from pydantic import model_validator
 from sqlmodel import Field
 
-from .base import DTOBase
+from .base import DTOBase, TotalMode
 
 
 # ── Create / ingest (used by worker / Celery) ─────────────────────────────
@@ -19,14 +21,22 @@ class CallCreate(DTOBase):
 
     timestamp: datetime
     duration: float = Field(..., gt=0, description="Seconds of audio in this call/PTT")
+    sample_rate: int | None = None
+    channels: int | None = None
     audio_path: str
+    site: str | None = None
+    duplicate_of: int | None = None  # calls.id of the original (simulcast / repeat)
 
     # ASR output at ingest time
     transcript: str | None = None
     confidence: float | None = None
     needs_review: bool = False
+    no_speech: bool = False
     transcriber: str | None = None
 
+    # [[start, end, confidence, no_speech_prob, text], ...] from SegmentAggregator
+    segments: list[list] | None = None
+
 
 # ── Read-only representation (API responses / UI) ────────────────────────
 class CallRead(CallCreate):
@@ -36,6 +46,16 @@ class CallRead(CallCreate):
     reviewed_by: int | None = None
     reviewed_at: datetime | None = None
 
+    # Set once the audio has moved into the content-addressed store
+    source_path: str | None = None
+    audio_sha256: str | None = None
+
+
+# ── Ranked full-text search hit ---------------------------------------------
+class CallSearchHit(CallRead):
+    rank: float
+    headline: str | None = None  # ts_headline snippet, matches wrapped in <mark>
+
 
 # ── PATCH body for human correction --------------------------------------
 class CallPatch(DTOBase):
@@ -48,7 +68,9 @@ class CallPatch(DTOBase):
 
 
 # ── Search / filter params (query payload / request body) -----------------
-class CallSearch(DTOBase):
+class CallFilters(DTOBase):
+    """Filters and paging shared by /calls and /calls/search."""
+
     system_id: int | None = None
     talkgroup_id: int | None = None
     unit_id: int | None = None
@@ -59,7 +81,35 @@ class CallSearch(DTOBase):
     min_confidence: float | None = None
     max_confidence: float | None = None
 
-    text: str | None = None  # full-text search query (tsvector match, etc.)
+    include_duplicates: bool = True  # False hides simulcast / repeat copies
+
+    total: TotalMode = "estimate"
 
     page: int = Field(1, ge=1)
     per_page: int = Field(50, ge=1, le=500)
+
+
+class CallSearch(CallFilters):
+    text: str | None = None  # websearch_to_tsquery syntax: "exact phrase" or -not
+
+    # Keyset pagination: pass back Page.next_cursor / prev_cursor. `page` is
+    # only honoured (as OFFSET) when no cursor is given.
+    cursor: str | None = None
+
+
+class TranscriptSearch(CallFilters):
+    """
+    Query for /calls/search: the CallSearch filters plus the search terms.
+
+    Ranked results only page with page / per_page; a keyset cursor is
+    rejected rather than silently ignored.
+    """
+
+    q: str = Field(..., min_length=1, description="Search terms (websearch syntax)")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _no_cursor(cls, values):
+        if isinstance(values, dict) and values.get("cursor") is not None:
+            raise ValueError("cursor is not supported by /calls/search; page with `page`")
+        return values
@@ -1,20 +1,42 @@
 """Public interface for EchoBase_transcription.events package."""
 
-from .channels import CALL_EVENTS, HEARTBEAT
-from .publisher import publish_call_update, publish_heartbeat
-from .subscriber import subscribe, subscribe_call_events
-from .schemas import CallEvent, Heartbeat
+from .channels import CALL_EVENTS, CALL_EVENT_STREAM, HEARTBEAT, DIRECTORY_EVENTS
+from .publisher import CallRefs, publish_call_update, publish_call_updates, publish_heartbeat, publish_directory_change
+from .subscriber import (
+    call_event_stream_tail,
+    read_call_events,
+    read_call_events_async,
+    replay_call_events_async,
+    stream_id_key,
+    subscribe,
+    subscribe_call_events,
+    watch_directory_changes,
+)
+from .schemas import CallEvent, CallEventFilter, Heartbeat, DirectoryChanged
 
 __all__ = [
     # channels
     "CALL_EVENTS",
+    "CALL_EVENT_STREAM",
     "HEARTBEAT",
+    "DIRECTORY_EVENTS",
     # schemas
     "CallEvent",
+    "CallEventFilter",
     "Heartbeat",
+    "DirectoryChanged",
     # api
+    "CallRefs",
     "publish_call_update",
+    "publish_call_updates",
     "publish_heartbeat",
+    "publish_directory_change",
+    "call_event_stream_tail",
+    "read_call_events",
+    "read_call_events_async",
+    "replay_call_events_async",
+    "stream_id_key",
     "subscribe",
     "subscribe_call_events",
+    "watch_directory_changes",
 ]
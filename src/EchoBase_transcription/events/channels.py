@@ -1,6 +1,11 @@
 """Canonical Redis (or NATS, etc.) channel names."""
 
-CALL_EVENTS = "echobase:call_events"      # new transcription finished
+CALL_EVENTS = "echobase:call_events"      # legacy pub/sub channel (superseded by the stream)
+CALL_EVENT_STREAM = "echobase:call_event_stream"  # capped Redis Stream of CallEvents (replayable)
 HEARTBEAT   = "echobase:heartbeat"        # worker heartbeat / liveness probe
+DIRECTORY_EVENTS = "echobase:directory_events"  # talkgroup / radio unit rows changed
 
-__all__ = ["CALL_EVENTS", "HEARTBEAT"]
\ No newline at end of file
+# Field holding the encoded event in each stream entry
+STREAM_FIELD = b"e"
+
+__all__ = ["CALL_EVENTS", "CALL_EVENT_STREAM", "STREAM_FIELD", "HEARTBEAT", "DIRECTORY_EVENTS"]
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Wire encoding for bus messages.
+
+EVENT_ENCODING=json (default) publishes plain JSON; =msgpack publishes the
+same fields as MessagePack, which is smaller and cheaper to parse at high
+call rates. Decoding sniffs the payload, so subscribers accept both and the
+setting can be flipped without a coordinated restart.
+"""
+
+from __future__ import annotations
+
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+from ..config.settings import settings
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def encode_event(evt: BaseModel) -> bytes | str:
+    if settings.event_encoding == "msgpack":
+        import msgpack
+
+        return msgpack.packb(evt.model_dump(mode="json", exclude_none=True))
+    return evt.model_dump_json(exclude_none=True)
+
+
+def decode_event(schema_cls: Type[M], data: bytes | str) -> M:
+    if isinstance(data, str) or data[:1] == b"{":
+        return schema_cls.model_validate_json(data)
+    import msgpack
+
+    return schema_cls.model_validate(msgpack.unpackb(data))
+
+
+def decode_raw(data: bytes | str):
+    """Payload on a channel without a schema: JSON or msgpack → plain Python."""
+    import json
+
+    if isinstance(data, str) or data[:1] in (b"{", b"["):
+        return json.loads(data)
+    import msgpack
+
+    return msgpack.unpackb(data)
@@ -3,26 +3,50 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import NamedTuple, Optional
 
 import redis
 from ..config.settings import settings
-from .channels import CALL_EVENTS, HEARTBEAT
-from .schemas import CallEvent, Heartbeat
+from .codec import encode_event
+from .channels import CALL_EVENT_STREAM, HEARTBEAT, DIRECTORY_EVENTS, STREAM_FIELD
+from .schemas import CallEvent, Heartbeat, DirectoryChanged
 from ..db.models import Call
 
-# Instantiate one Redis connection for publishers
-_redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+# Instantiate one Redis connection for publishers (bytes: payloads may be msgpack)
+_redis_client = redis.Redis.from_url(settings.redis_url)
 
 
-def publish_call_update(call: Call) -> None:
-    """Publish a CallEvent to CALL_EVENTS channel."""
-    dto = CallEvent(
+class CallRefs(NamedTuple):
+    """
+    Directory data for a CallEvent that the caller already has in hand (e.g.
+    the worker's resolver cache), so building the event needs no SELECTs.
+    """
+
+    talkgroup_alias: Optional[str] = None
+    unit_id: Optional[int] = None  # radio_units.unit_id (the radio's number)
+    unit_alias: Optional[str] = None
+
+
+def _refs_from_relationships(call: Call) -> CallRefs:
+    """Fallback for callers without refs; may lazy-load talkgroup / unit."""
+    return CallRefs(
+        talkgroup_alias=(getattr(call.talkgroup, "alias", None) if call.talkgroup_id else None),
+        unit_id=(getattr(call.unit, "unit_id", None) if call.unit_id else None),
+        unit_alias=(getattr(call.unit, "alias", None) if call.unit_id else None),
+    )
+
+
+def _call_event(call: Call, refs: Optional[CallRefs] = None) -> CallEvent:
+    refs = refs or _refs_from_relationships(call)
+    return CallEvent(
         call_id=call.id,
         system_id=call.system_id,
         talkgroup_id=call.talkgroup_id,
-        unit_id=(getattr(call.unit, "unit_id", None) if call.unit_id else None),  # use radio_units.unit_id
+        unit_id=refs.unit_id,
         timestamp=call.timestamp,
         duration=call.duration,
+        site=call.site,
+        duplicate_of=call.duplicate_of,
         transcript=call.transcript,
         corrected_transcript=call.corrected_transcript,
         confidence=call.confidence,
@@ -30,13 +54,42 @@ def publish_call_update(call: Call) -> None:
         transcriber=call.transcriber,
         reviewed_at=call.reviewed_at,
         reviewed_by=call.reviewed_by,
-        talkgroup_alias=(getattr(call.talkgroup, "alias", None) if call.talkgroup_id else None),
-        unit_alias=(getattr(call.unit, "alias", None) if call.unit_id else None),
+        talkgroup_alias=refs.talkgroup_alias,
+        unit_alias=refs.unit_alias,
     )
-    _redis_client.publish(CALL_EVENTS, dto.model_dump_json())
+
+
+def _append_call_event(client, call: Call, refs: Optional[CallRefs]) -> None:
+    # MAXLEN ~ lets Redis trim whole macro-nodes: O(1), memory stays bounded
+    client.xadd(
+        CALL_EVENT_STREAM,
+        {STREAM_FIELD: encode_event(_call_event(call, refs))},
+        maxlen=settings.call_event_stream_maxlen,
+        approximate=True,
+    )
+
+
+def publish_call_update(call: Call, refs: Optional[CallRefs] = None) -> None:
+    """Append a CallEvent to the CALL_EVENT_STREAM log."""
+    _append_call_event(_redis_client, call, refs)
+
+
+def publish_call_updates(calls: list[Call], refs: Optional[list[Optional[CallRefs]]] = None) -> None:
+    """Append one CallEvent per call, pipelined into a single round trip."""
+    refs = refs or [None] * len(calls)
+    pipe = _redis_client.pipeline(transaction=False)
+    for call, call_refs in zip(calls, refs):
+        _append_call_event(pipe, call, call_refs)
+    pipe.execute()
 
 
 def publish_heartbeat(worker_id: str) -> None:
     """Publish a Heartbeat message (called by a Celery beat job)."""
     hb = Heartbeat(worker_id=worker_id, ts=datetime.now())
-    _redis_client.publish(HEARTBEAT, hb.model_dump_json())
+    _redis_client.publish(HEARTBEAT, encode_event(hb))
+
+
+def publish_directory_change(table: str, system_id: int | None = None, action: str = "changed") -> None:
+    """Tell every process that cached rows of `table` are stale ("created": rows were only added)."""
+    evt = DirectoryChanged(table=table, system_id=system_id, action=action)
+    _redis_client.publish(DIRECTORY_EVENTS, encode_event(evt))
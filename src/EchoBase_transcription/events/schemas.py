@@ -1,7 +1,7 @@
 """Typed event payloads used on the pub/sub bus."""
 
 from datetime import datetime
-from typing import Literal
+from typing import Callable, Literal
 
 from pydantic import BaseModel, Field
 from ..db.schemas.base import DTOBase
@@ -15,6 +15,8 @@ class CallEvent(DTOBase):
     unit_alias: str | None = None
     timestamp: datetime
     duration: float | None = None
+    site: str | None = None
+    duplicate_of: int | None = None
     transcript: str | None = None
     corrected_transcript: str | None = None
     confidence: float | None = None
@@ -24,9 +26,61 @@ class CallEvent(DTOBase):
     reviewed_by: int | None = None
 
 
+class CallEventFilter(BaseModel):
+    """Per-connection scoping for the live call stream (all fields optional)."""
+
+    system_id: int | None = None
+    talkgroup_id: list[int] | None = None  # talkgroups.id
+    unit_id: list[int] | None = None  # radio number, as in CallEvent.unit_id
+    needs_review: bool | None = None
+    min_confidence: float | None = None
+    include_duplicates: bool = True
+
+    def compile(self) -> Callable[[CallEvent], bool] | None:
+        """
+        Build the predicate once per connection; None means "everything".
+
+        Only the clauses actually requested are checked, against sets, so a
+        miss costs a few attribute reads per event.
+        """
+        checks: list[Callable[[CallEvent], bool]] = []
+        if self.system_id is not None:
+            system_id = self.system_id
+            checks.append(lambda e: e.system_id == system_id)
+        if self.talkgroup_id:
+            talkgroups = frozenset(self.talkgroup_id)
+            checks.append(lambda e: e.talkgroup_id in talkgroups)
+        if self.unit_id:
+            units = frozenset(self.unit_id)
+            checks.append(lambda e: e.unit_id in units)
+        if self.needs_review is not None:
+            needs_review = self.needs_review
+            checks.append(lambda e: e.needs_review is needs_review)
+        if self.min_confidence is not None:
+            floor = self.min_confidence
+            checks.append(lambda e: e.confidence is not None and e.confidence >= floor)
+        if not self.include_duplicates:
+            checks.append(lambda e: e.duplicate_of is None)
+
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda e: all(check(e) for check in checks)
+
+
 class Heartbeat(BaseModel):
     """Periodic ping so you can monitor worker health."""
 
     type: Literal["worker.heartbeat"] = "worker.heartbeat"
     worker_id: str
-    ts: datetime
\ No newline at end of file
+    ts: datetime
+
+
+class DirectoryChanged(BaseModel):
+    """Rows in a directory table (talkgroups, radio_units, ...) were rewritten."""
+
+    type: Literal["directory.changed"] = "directory.changed"
+    table: str
+    system_id: int | None = None
+    action: Literal["changed", "created"] = "changed"  # "created": new rows only
\ No newline at end of file
@@ -2,43 +2,167 @@
 
 from __future__ import annotations
 
-import json
-from typing import Generator, Type
+import logging
+import threading
+import time
+from typing import AsyncGenerator, Callable, Generator, Optional, Type
 
 import redis
+import redis.asyncio as aioredis
 
 from ..config.settings import settings
-from .channels import CALL_EVENTS, HEARTBEAT
-from .schemas import CallEvent, Heartbeat
+from .codec import decode_event, decode_raw
+from .channels import CALL_EVENTS, CALL_EVENT_STREAM, HEARTBEAT, DIRECTORY_EVENTS, STREAM_FIELD
+from .schemas import CallEvent, Heartbeat, DirectoryChanged
+
+logger = logging.getLogger(__name__)
 
 _channel_to_schema: dict[str, Type] = {
     CALL_EVENTS: CallEvent,
     HEARTBEAT: Heartbeat,
+    DIRECTORY_EVENTS: DirectoryChanged,
 }
 
 # One connection per listener (Redis pubsub objects aren’t thread-safe)
 def subscribe(*channels: str) -> Generator[object, None, None]:
     """Yield parsed Pydantic objects as they arrive on the given channels."""
-    r = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+    # Raw bytes: payloads may be msgpack (see codec.py)
+    r = redis.Redis.from_url(settings.redis_url)
     pubsub = r.pubsub(ignore_subscribe_messages=True)
     pubsub.subscribe(*channels)
 
     for message in pubsub.listen():
         if message["type"] != "message":
             continue
-        chan = message["channel"]
+        chan = message["channel"].decode()
         schema_cls = _channel_to_schema.get(chan)
         if schema_cls is None:
-            # Unknown channel – just yield raw JSON
-            yield json.loads(message["data"])
+            # Unknown channel – just yield the raw payload
+            yield decode_raw(message["data"])
             continue
         try:
-            yield schema_cls.parse_raw(message["data"])
+            yield decode_event(schema_cls, message["data"])
         except Exception as exc:  # noqa: BLE001
             # In production, log or capture to Sentry
             print(f"Malformed event on {chan}: {exc}")
 
 
+DIRECTORY_RETRY_SECONDS = 5
+
+
+def watch_directory_changes(
+        callback: Callable[[Optional[DirectoryChanged]], None],
+        name: str,
+) -> threading.Thread:
+    """
+    Call `callback(evt)` for every DirectoryChanged, from a daemon thread.
+
+    After the subscription drops it is called once with None: anything may
+    have changed while we were disconnected, so caches should drop it all.
+    """
+
+    def _run() -> None:
+        while True:
+            try:
+                for evt in subscribe(DIRECTORY_EVENTS):
+                    if isinstance(evt, DirectoryChanged):
+                        callback(evt)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Directory event listener %s dropped (%s); retrying", name, exc)
+            callback(None)
+            time.sleep(DIRECTORY_RETRY_SECONDS)
+
+    thread = threading.Thread(target=_run, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+STREAM_BLOCK_MS = 5_000  # XREAD long-poll; loops so cancellation is prompt
+
+
+def _stream_entries(entries) -> Generator[tuple[str, CallEvent], None, None]:
+    for entry_id, fields in entries:
+        try:
+            yield entry_id.decode(), decode_event(CallEvent, fields[STREAM_FIELD])
+        except Exception as exc:  # noqa: BLE001
+            print(f"Malformed event in {CALL_EVENT_STREAM} ({entry_id!r}): {exc}")
+
+
+def read_call_events(last_id: str = "$") -> Generator[tuple[str, CallEvent], None, None]:
+    """Yield (stream_id, CallEvent) for every event appended after `last_id`."""
+    r = redis.Redis.from_url(settings.redis_url)
+    while True:
+        reply = r.xread({CALL_EVENT_STREAM: last_id}, block=STREAM_BLOCK_MS)
+        for _stream, entries in reply or ():
+            for entry_id, evt in _stream_entries(entries):
+                last_id = entry_id
+                yield entry_id, evt
+
+
+async def read_call_events_async(
+        last_id: str = "$",
+) -> AsyncGenerator[tuple[str, CallEvent], None]:
+    """
+    asyncio flavour of read_call_events().
+
+    Meant for the per-process fan-out in api/sse.py. Callers that reconnect
+    should pass the last id they saw so nothing is lost in between.
+    """
+    r = aioredis.Redis.from_url(settings.redis_url)
+    try:
+        while True:
+            reply = await r.xread({CALL_EVENT_STREAM: last_id}, block=STREAM_BLOCK_MS)
+            for _stream, entries in reply or ():
+                for entry_id, evt in _stream_entries(entries):
+                    last_id = entry_id
+                    yield entry_id, evt
+    finally:
+        await r.close()
+
+
+def stream_id_key(entry_id: str) -> tuple[int, int]:
+    """Sortable form of a stream id ("1718000000000-3" → (1718000000000, 3))."""
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+async def replay_call_events_async(
+        after_id: str,
+        limit: int,
+        client: Optional[aioredis.Redis] = None,
+) -> tuple[list[tuple[str, CallEvent]], bool]:
+    """
+    Retained events strictly after `after_id`, oldest first.
+
+    Returns (events, complete). `complete` is False when the gap can't be
+    filled from the stream: more than `limit` events were missed, or the
+    oldest of them have already been trimmed away.
+    """
+    r = client or aioredis.Redis.from_url(settings.redis_url)
+    try:
+        oldest = await r.xrange(CALL_EVENT_STREAM, min="-", max="+", count=1)
+        entries = await r.xrange(CALL_EVENT_STREAM, min=f"({after_id}", max="+", count=limit + 1)
+    finally:
+        if client is None:
+            await r.close()
+
+    trimmed = bool(oldest) and stream_id_key(oldest[0][0].decode()) > stream_id_key(after_id)
+    complete = not trimmed and len(entries) <= limit
+    return list(_stream_entries(entries[:limit])), complete
+
+
+async def call_event_stream_tail(client: Optional[aioredis.Redis] = None) -> str:
+    """Id of the newest retained event ("0-0" when the stream is empty)."""
+    r = client or aioredis.Redis.from_url(settings.redis_url)
+    try:
+        newest = await r.xrevrange(CALL_EVENT_STREAM, max="+", min="-", count=1)
+    finally:
+        if client is None:
+            await r.close()
+    return newest[0][0].decode() if newest else "0-0"
+
+
 def subscribe_call_events():
     """Shortcut for the most common need: live call updates."""
-    yield from subscribe(CALL_EVENTS)
\ No newline at end of file
+    for _entry_id, evt in read_call_events():
+        yield evt
@@ -0,0 +1,104 @@
+"""
+Audio loading shared by the API (validation) and the worker (VAD + inference).
+
+`probe_audio` reads only the container header (mutagen) and is cheap enough
+for the API, though still blocking: call it from a worker thread.
+`load_audio` decodes a call exactly once into the 16 kHz mono float32 buffer
+that the VAD, batching and `WhisperModel.transcribe` all consume directly.
+`load_audio_window` decodes just one stretch of a long recording (a chunk).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import mutagen
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SAMPLE_RATE = 16_000  # what Whisper expects; every decoded buffer is resampled to this
+
+
+@dataclass(frozen=True)
+class AudioInfo:
+    """Source-file metadata from the container header (no decode)."""
+
+    duration: Optional[float]
+    sample_rate: Optional[int]
+    channels: Optional[int]
+
+
+@dataclass
+class DecodedAudio:
+    samples: "np.ndarray"  # mono float32 at SAMPLE_RATE
+    info: AudioInfo  # of the source file, before resampling
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / SAMPLE_RATE
+
+
+def probe_audio(path: Union[str, Path]) -> Optional[AudioInfo]:
+    """Header-only metadata, or None when mutagen doesn't recognise the file."""
+    try:
+        f = mutagen.File(path)
+    except Exception:
+        return None
+    if f is None:
+        return None
+    info = getattr(f, "info", None)
+    return AudioInfo(
+        duration=getattr(info, "length", None),
+        sample_rate=getattr(info, "sample_rate", None),
+        channels=getattr(info, "channels", None),
+    )
+
+
+def load_audio(path: Union[str, Path]) -> DecodedAudio:
+    """Decode `path` once (PyAV via faster-whisper) to 16 kHz mono float32."""
+    from faster_whisper.audio import decode_audio
+
+    info = probe_audio(path) or AudioInfo(None, None, None)
+    samples = decode_audio(str(path), sampling_rate=SAMPLE_RATE)
+    return DecodedAudio(samples=samples, info=info)
+
+
+def load_audio_window(path: Union[str, Path], start: float, end: float) -> "np.ndarray":
+    """
+    Decode only [start, end) seconds of `path` to 16 kHz mono float32.
+
+    Seeks to the frame at or before `start` and stops after `end`, so the
+    cost and memory follow the window, not the recording. Same resampling
+    as `load_audio`; after a seek, lossy formats (MP3) may land a few ms off
+    the exact sample, which is irrelevant at chunk boundaries cut in silence.
+    """
+    import av
+    import numpy as np
+
+    pieces = []
+    first: Optional[float] = None
+    with av.open(str(path)) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+        if start > 0:
+            container.seek(int(start * av.time_base), backward=True)  # offset in AV_TIME_BASE units
+        for frame in container.decode(stream):
+            if frame.time is None:
+                # no timestamps to trim by: fall back to the full decode
+                return load_audio(path).samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+            if frame.time >= end:
+                break
+            if first is None:
+                first = frame.time
+            pieces.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(frame))
+        pieces.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(None))
+
+    if not pieces:
+        return np.zeros(0, dtype=np.float32)
+    audio = np.concatenate(pieces).astype(np.float32) / 32768.0
+    # decoding resumed at a frame boundary at or before `start`
+    skip = max(int(round((start - first) * SAMPLE_RATE)), 0)
+    return audio[skip:skip + int(round((end - start) * SAMPLE_RATE))]
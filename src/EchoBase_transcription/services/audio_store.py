@@ -0,0 +1,149 @@
+"""
+Content-addressed store for processed call audio.
+
+Once a call is stored, its recording is moved to
+
+    AUDIO_STORE_PATH/ab/cd/<sha256>.<ext>
+
+where the sha256 is taken over the source file, so identical recordings
+are kept once. With AUDIO_STORE_FORMAT=opus the file is transcoded to
+low-bitrate mono Opus on the way in (PyAV, already present for decoding).
+Stored files never change after they are written, so backups and rsync to
+field boxes only ever copy new files.
+
+The file is written under a temp name inside the store and renamed into
+place (atomic on one filesystem) before the Call row is pointed at it. The
+row update is conditional on the old path, so archiving twice is a no-op.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from sqlalchemy import update
+from sqlmodel import select
+
+from ..config import settings
+from ..db import get_session
+from ..db.models.call import Call
+
+logger = logging.getLogger(__name__)
+
+OPUS_SAMPLE_RATE = 16_000  # what the models consume anyway; plenty for radio voice
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class StoredAudio(NamedTuple):
+    path: Path
+    sha256: str
+    created: bool  # False: identical audio was already in the store
+
+
+def enabled() -> bool:
+    return bool(settings.audio_store_path)
+
+
+def content_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_path(sha256: str, suffix: str) -> Path:
+    return Path(settings.audio_store_path) / sha256[:2] / sha256[2:4] / f"{sha256}{suffix}"
+
+
+def _transcode_opus(src: Path, dest: Path) -> None:
+    """Write `src` to `dest` as mono Opus in an Ogg container."""
+    import av
+
+    with av.open(str(src)) as inp, av.open(str(dest), "w", format="ogg") as out:
+        stream = out.add_stream("libopus", rate=OPUS_SAMPLE_RATE)
+        stream.layout = "mono"
+        stream.bit_rate = settings.audio_store_opus_bitrate
+        # The codec context resamples/re-frames to what libopus accepts
+        for frame in inp.decode(audio=0):
+            frame.pts = None
+            for packet in stream.encode(frame):
+                out.mux(packet)
+        for packet in stream.encode(None):
+            out.mux(packet)
+
+
+def put(src: Path) -> StoredAudio:
+    """Add `src` to the store (unless identical audio is already there)."""
+    sha256 = content_digest(src)
+    suffix = ".opus" if settings.audio_store_format == "opus" else src.suffix.lower()
+    dest = store_path(sha256, suffix)
+    if dest.exists():
+        return StoredAudio(dest, sha256, created=False)
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=".incoming-", suffix=suffix)
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        if suffix == ".opus":
+            _transcode_opus(src, tmp)
+        else:
+            shutil.copyfile(src, tmp)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return StoredAudio(dest, sha256, created=True)
+
+
+def _is_upload(path: Path) -> bool:
+    return path.resolve().is_relative_to(Path(settings.temp_audio_path).resolve())
+
+
+def archive_call(call_id: int) -> Optional[str]:
+    """
+    Move a stored Call's audio into the store and repoint the row.
+
+    Uploads (TEMP_AUDIO_PATH) are always removed afterwards; recordings only
+    with AUDIO_STORE_DELETE_SOURCE. Returns the new path, or None when there
+    was nothing to do.
+    """
+    with get_session() as session:
+        row = session.exec(
+            select(Call.audio_path, Call.audio_sha256).where(Call.id == call_id)
+        ).first()
+    if row is None or row.audio_sha256 is not None:
+        return None  # gone, or already archived
+
+    src = Path(row.audio_path)
+    if not src.exists():
+        logger.warning("archive: call %s audio %s is missing; leaving the row as is", call_id, src)
+        return None
+
+    source_bytes = src.stat().st_size
+    stored = put(src)
+    with get_session() as session:
+        moved = session.execute(
+            update(Call)
+            .where(Call.id == call_id, Call.audio_path == row.audio_path)
+            .values(audio_path=str(stored.path), source_path=row.audio_path, audio_sha256=stored.sha256)
+        ).rowcount
+    if not moved:
+        return None
+
+    if _is_upload(src) or settings.audio_store_delete_source:
+        src.unlink(missing_ok=True)
+
+    logger.info(
+        "archive: call %s -> %s (%s, %d -> %d bytes)",
+        call_id, stored.path.name, "new" if stored.created else "deduplicated",
+        source_bytes, stored.path.stat().st_size,
+    )
+    return str(stored.path)
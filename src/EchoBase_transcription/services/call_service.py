@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import base64
+import json
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlmodel import select
-from sqlalchemy import func
+from sqlalchemy import func, literal_column, tuple_
 
 from ..db import get_session
 from ..db.models.call import Call
@@ -13,30 +15,80 @@ from ..db.schemas import (
     CallRead,
     CallPatch,
     CallSearch,
+    CallSearchHit,
     Page,
 )
-from ..events.publisher import publish_call_update
+from ..events.publisher import CallRefs, publish_call_update, publish_call_updates
+from . import metrics
 
+# Generated tsvector column (see migrations); not mapped on the model because
+# it is maintained by Postgres.
+TRANSCRIPT_TSV = literal_column("calls.transcript_tsv")
+TS_CONFIG = "english"
+HEADLINE_OPTIONS = "MaxFragments=2, MinWords=5, MaxWords=18, FragmentDelimiter= … , StartSel=<mark>, StopSel=</mark>"
 
-def create_call(data: CallCreate) -> CallRead:
+
+def create_call(data: CallCreate, refs: Optional[CallRefs] = None) -> CallRead:
     """
     Create a new Call row from validated CallCreate data.
 
     This is used by ingestion/Celery and also (optionally) by API endpoints
-    that ingest uploaded recordings.
+    that ingest uploaded recordings. Pass `refs` (aliases / radio number)
+    when known so the event is built without touching the directory tables.
     """
     with get_session() as session:
-        db_call = Call(**data.model_dump())
-        session.add(db_call)
-        session.flush()  # populate db_call.id
-        session.commit()
+        with metrics.stage("db_insert"):
+            db_call = Call(**data.model_dump())
+            session.add(db_call)
+            session.flush()  # populate db_call.id
+            session.commit()
+        metrics.record_stored([db_call])
 
         # Broadcast to any live subscribers (SSE, websockets, etc.)
-        publish_call_update(db_call)
+        with metrics.stage("publish"):
+            publish_call_update(db_call, refs)
 
         return CallRead.model_validate(db_call)
 
 
+def create_calls_bulk(
+        items: List[CallCreate],
+        refs: Optional[List[Optional[CallRefs]]] = None,
+) -> List[CallRead]:
+    """
+    Insert many Calls in one transaction, then publish their events.
+
+    The ORM batches the flush into multi-row ``INSERT ... VALUES (...), (...)
+    RETURNING id`` statements (SQLAlchemy "insertmanyvalues"), so N calls cost
+    one commit instead of N. Events go out only after the commit, in one
+    Redis round trip.
+    """
+    db_calls = insert_calls_bulk(items)
+    publish_stored_calls(db_calls, refs)
+    return [CallRead.model_validate(db_call) for db_call in db_calls]
+
+
+def insert_calls_bulk(items: List[CallCreate]) -> List[Call]:
+    """The INSERT + commit half of create_calls_bulk (no events)."""
+    if not items:
+        return []
+    with get_session() as session:
+        with metrics.stage("db_insert"):
+            db_calls = [Call(**data.model_dump()) for data in items]
+            session.add_all(db_calls)
+            session.flush()  # populate ids
+            session.commit()
+    metrics.record_stored(db_calls)
+    return db_calls
+
+
+def publish_stored_calls(db_calls: List[Call], refs: Optional[List[Optional[CallRefs]]] = None) -> None:
+    """The event half of create_calls_bulk, for rows that are already committed."""
+    if db_calls:
+        with metrics.stage("publish"):
+            publish_call_updates(db_calls, refs)
+
+
 def get_call(call_id: int) -> CallRead:
     """Fetch a single Call by primary key and return as CallRead."""
     with get_session() as session:
@@ -81,19 +133,45 @@ def patch_call(
         return CallRead.model_validate(db_call)
 
 
-def search_calls(params: CallSearch) -> Page:
-    """
-    Filter/paginate calls for UI or API. Supports:
-    - system_id / talkgroup_id / unit_id
-    - time range (since/until)
-    - confidence thresholds
-    - basic pagination (page/per_page)
+def encode_cursor(timestamp: datetime, call_id: int, direction: str) -> str:
+    """Opaque keyset cursor: base64url(json([timestamp, id, direction]))."""
+    raw = json.dumps([timestamp.isoformat(), call_id, direction], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
 
-    NOTE: full-text search against transcript_tsv can be added where
-    params.text is set. We'll leave a placeholder for that logic.
-    """
 
-    # Build WHERE clauses first so we can reuse them for count() and data query.
+def decode_cursor(cursor: str) -> Tuple[datetime, int, str]:
+    """Inverse of encode_cursor. Raises ValueError on anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, call_id, direction = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return datetime.fromisoformat(ts), int(call_id), direction
+    except Exception as exc:  # noqa: BLE001
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def _estimate_count(session, query) -> Optional[int]:
+    """Planner row estimate for `query` (Postgres only; None elsewhere)."""
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+    compiled = query.compile(dialect=bind.dialect)
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _text_query(text: str):
+    """websearch_to_tsquery: quoted phrases, OR, -negation, like a search box."""
+    return func.websearch_to_tsquery(TS_CONFIG, text)
+
+
+def _filter_clauses(params: CallSearch) -> list:
+    """WHERE clauses shared by search_calls / search_transcripts."""
     where_clauses = []
 
     if params.system_id is not None:
@@ -117,38 +195,162 @@ def search_calls(params: CallSearch) -> Page:
     if params.max_confidence is not None:
         where_clauses.append(Call.confidence <= params.max_confidence)
 
-    # Placeholder for full text search (Postgres to_tsquery / @@):
-    # if params.text is not None:
-    #     where_clauses.append(textsearch_condition)
+    if not params.include_duplicates:
+        where_clauses.append(Call.duplicate_of.is_(None))
+
+    # Full text search over the GIN-indexed generated column (covers
+    # corrected_transcript when present, else transcript)
+    if params.text:
+        where_clauses.append(TRANSCRIPT_TSV.op("@@")(_text_query(params.text)))
+
+    return where_clauses
+
+
+def search_calls(params: CallSearch) -> Page:
+    """
+    Filter/paginate calls for UI or API, newest first. Supports:
+    - system_id / talkgroup_id / unit_id
+    - time range (since/until)
+    - confidence thresholds
+    - keyset pagination on (timestamp, id) via params.cursor, so deep pages
+      cost the same as the first one; legacy page/per_page OFFSET paging is
+      used only when no cursor is given
+    - totals: "none", planner "estimate" (default, O(1)) or "exact" count(*)
+    - full-text filter (params.text) against the indexed transcript_tsv;
+      use search_transcripts() for relevance-ranked results with snippets
+    """
+
+    # Build WHERE clauses first so we can reuse them for count() and data query.
+    where_clauses = _filter_clauses(params)
+
+    direction = "next"
+    key = None
+    if params.cursor:
+        ts, call_id, direction = decode_cursor(params.cursor)
+        key = tuple_(Call.timestamp, Call.id)
+        key = key < tuple_(ts, call_id) if direction == "next" else key > tuple_(ts, call_id)
 
     with get_session() as session:
         base_query = select(Call)
-        if where_clauses:
-            for clause in where_clauses:
-                base_query = base_query.where(clause)
-
-        # Count total matching rows
-        count_query = select(func.count(Call.id))
-        if where_clauses:
+        for clause in where_clauses:
+            base_query = base_query.where(clause)
+
+        # Totals are computed over the filters only (not the cursor window)
+        total_count: Optional[int] = None
+        total_is_estimate = False
+        if params.total != "none":
+            count_query = select(func.count(Call.id))
             for clause in where_clauses:
                 count_query = count_query.where(clause)
-        total_count = session.exec(count_query).one()
-
-        # Pagination math
-        offset = (params.page - 1) * params.per_page
-        data_query = (
-            base_query
-            .order_by(Call.timestamp.desc())
-            .offset(offset)
-            .limit(params.per_page)
-        )
+            if params.total == "estimate":
+                total_count = _estimate_count(session, select(Call.id).where(*where_clauses))
+                total_is_estimate = total_count is not None
+            if total_count is None:
+                total_count = session.exec(count_query).one()
+
+        # Fetch one extra row to know whether another page exists
+        limit = params.per_page + 1
+        if key is not None:
+            data_query = base_query.where(key)
+            if direction == "next":
+                data_query = data_query.order_by(Call.timestamp.desc(), Call.id.desc())
+            else:
+                # walk forward in time from the cursor, then flip back to newest-first
+                data_query = data_query.order_by(Call.timestamp.asc(), Call.id.asc())
+        else:
+            data_query = (
+                base_query
+                .order_by(Call.timestamp.desc(), Call.id.desc())
+                .offset((params.page - 1) * params.per_page)
+            )
+
+        rows: List[Call] = list(session.exec(data_query.limit(limit)))
+        has_more = len(rows) > params.per_page
+        rows = rows[:params.per_page]
+        if direction == "prev":
+            rows.reverse()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            first, last = rows[0], rows[-1]
+            # "next" = older rows; there are some unless we walked off the end going back
+            if has_more or direction == "prev":
+                next_cursor = encode_cursor(last.timestamp, last.id, "next")
+            # "prev" = newer rows; there are some whenever we aren't on the first page
+            if (direction == "next" and (key is not None or params.page > 1)) or (
+                    direction == "prev" and has_more):
+                prev_cursor = encode_cursor(first.timestamp, first.id, "prev")
 
-        rows: List[Call] = list(session.exec(data_query))
         dto_items = [CallRead.model_validate(c) for c in rows]
 
         return Page(
             items=dto_items,
             total=total_count,
+            total_is_estimate=total_is_estimate,
+            page=params.page,
+            per_page=params.per_page,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+
+def search_transcripts(params: CallSearch) -> Page:
+    """
+    Relevance-ranked full-text search over call transcripts.
+
+    Matches params.text with websearch_to_tsquery against the GIN-indexed
+    transcript_tsv, orders by ts_rank (newest first on ties) and returns
+    CallSearchHit items with a ts_headline snippet. The other CallSearch
+    filters apply as in search_calls. Ranked results page with page/per_page;
+    headlines are only computed for the rows on the requested page.
+    """
+    if not params.text:
+        raise ValueError("search_transcripts requires params.text")
+
+    where_clauses = _filter_clauses(params)
+    tsq = _text_query(params.text)
+    rank = func.ts_rank(TRANSCRIPT_TSV, tsq).label("rank")
+
+    with get_session() as session:
+        ranked = (
+            select(Call.id, rank)
+            .where(*where_clauses)
+            .order_by(rank.desc(), Call.timestamp.desc(), Call.id.desc())
+            .offset((params.page - 1) * params.per_page)
+            .limit(params.per_page)
+            .subquery()
+        )
+        headline = func.ts_headline(
+            TS_CONFIG,
+            func.coalesce(Call.corrected_transcript, Call.transcript, ""),
+            tsq,
+            HEADLINE_OPTIONS,
+        ).label("headline")
+        rows = session.exec(
+            select(Call, ranked.c.rank, headline)
+            .join(ranked, ranked.c.id == Call.id)
+            .order_by(ranked.c.rank.desc(), Call.timestamp.desc(), Call.id.desc())
+        ).all()
+
+        total_count: Optional[int] = None
+        total_is_estimate = False
+        if params.total == "estimate":
+            total_count = _estimate_count(session, select(Call.id).where(*where_clauses))
+            total_is_estimate = total_count is not None
+        if params.total == "exact" or (params.total == "estimate" and total_count is None):
+            total_count = session.exec(select(func.count(Call.id)).where(*where_clauses)).one()
+
+        items = [
+            CallSearchHit.model_validate(
+                {**CallRead.model_validate(call).model_dump(), "rank": r, "headline": h}
+            )
+            for call, r, h in rows
+        ]
+
+        return Page(
+            items=items,
+            total=total_count,
+            total_is_estimate=total_is_estimate,
             page=params.page,
             per_page=params.per_page,
         )
@@ -0,0 +1,113 @@
+"""
+Buffered Call writer for the worker (group commit).
+
+Tasks hand their finished CallCreate to `call_writer.submit()` and get a
+Future back. A background thread drains whatever has queued up (up to
+CALL_WRITER_BATCH_SIZE, optionally waiting CALL_WRITER_FLUSH_MS for more)
+and writes it with one INSERT transaction, then publishes the batch's
+events. A publish failure is only logged: the rows are committed and must
+not be inserted again.
+
+Grouping only happens across calls that are waiting at the same time, i.e.
+in batch mode or with several threads; the one-call-per-task path submits
+one call and waits for it, so its transactions hold a single row.
+
+Tasks block on their Future before returning, so with task_acks_late a
+message is only acked once its row is committed: a worker that dies with
+calls still buffered gets them redelivered (at-least-once, as before).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from ..config import settings
+from ..db.schemas import CallCreate, CallRead
+from ..events.publisher import CallRefs
+from .call_service import insert_calls_bulk, publish_stored_calls
+
+logger = logging.getLogger(__name__)
+
+
+class CallWriter:
+    def __init__(self, batch_size: int, flush_ms: int):
+        self.batch_size = max(batch_size, 1)
+        self.flush_ms = max(flush_ms, 0)
+        self._queue: queue.Queue[tuple[CallCreate, Optional[CallRefs], Future]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+
+    def submit(self, call: CallCreate, refs: Optional[CallRefs] = None) -> Future:
+        """Queue `call` for insertion; the Future resolves to its CallRead."""
+        self._ensure_thread()
+        future: Future = Future()
+        self._queue.put((call, refs, future))
+        return future
+
+    def write(self, call: CallCreate, refs: Optional[CallRefs] = None) -> CallRead:
+        """Insert `call` and wait until it is committed and published."""
+        return self.submit(call, refs).result()
+
+    def _ensure_thread(self) -> None:
+        # Threads don't survive fork(): (re)start per process, lazily
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue()
+            threading.Thread(target=self._run, name="call-writer", daemon=True).start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            deadline = time.monotonic() + self.flush_ms / 1000
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(q.get(timeout=remaining) if remaining > 0 else q.get_nowait())
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list[tuple[CallCreate, Optional[CallRefs], Future]]) -> None:
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        committed: list[tuple] = []  # (db_call, refs, future)
+        try:
+            db_calls = insert_calls_bulk([call for call, _, _ in batch])
+            committed = [(db_call, refs, future) for db_call, (_, refs, future) in zip(db_calls, batch)]
+        except Exception as exc:  # noqa: BLE001
+            if len(batch) == 1:
+                batch[0][2].set_exception(exc)
+                return
+            # The transaction rolled back, so nothing was stored; one bad row
+            # must not fail the whole group: retry them singly
+            logger.warning("Bulk insert of %d calls failed (%s); retrying one by one", len(batch), exc)
+            for call, refs, future in batch:
+                try:
+                    committed.append((insert_calls_bulk([call])[0], refs, future))
+                except Exception as row_exc:  # noqa: BLE001
+                    future.set_exception(row_exc)
+        if not committed:
+            return
+
+        try:
+            publish_stored_calls([db_call for db_call, _, _ in committed], [refs for _, refs, _ in committed])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Committed %d calls but could not publish their events (%s)", len(committed), exc)
+        for db_call, _, future in committed:
+            future.set_result(CallRead.model_validate(db_call))
+        logger.debug("call writer: committed %d calls", len(committed))
+
+
+call_writer = CallWriter(settings.call_writer_batch_size, settings.call_writer_flush_ms)
@@ -0,0 +1,74 @@
+"""
+Split long recordings into chunks at silences.
+
+Patched / conventional-channel captures can run for many minutes. Instead
+of one task decoding the whole recording serially, the worker cuts it into
+roughly CHUNK_TARGET_SECONDS pieces that are transcribed in parallel (a
+Celery chord, see worker/tasks/transcribe.py) and merged back in order.
+
+Cuts go in the middle of a silence between VAD regions, as close to the
+target length as possible. Without a silence in reach (or without VAD
+regions) the chunk is cut hard at the target length.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+from ..config import settings
+
+MIN_SHARE = 0.5  # chunks are between 0.5x and 1.5x the target length
+MAX_SHARE = 1.5
+
+
+class Chunk(NamedTuple):
+    start: float  # seconds into the recording
+    end: float
+    regions: Optional[list[tuple[float, float]]]  # voiced regions, relative to `start`; None = decode it all
+
+
+def chunking_enabled(duration: float) -> bool:
+    """True for recordings long enough to be split (CHUNK_MIN_SECONDS, 0 = never)."""
+    return 0 < settings.chunk_min_seconds <= duration
+
+
+def _cut_points(duration: float, gaps: list[tuple[float, float]], target: float) -> list[float]:
+    cuts = []
+    cursor = 0.0
+    while duration - cursor > target * MAX_SHARE:
+        lo, hi, ideal = cursor + target * MIN_SHARE, cursor + target * MAX_SHARE, cursor + target
+        midpoints = [(a + b) / 2 for a, b in gaps if lo < (a + b) / 2 <= hi]
+        cut = min(midpoints, key=lambda m: abs(m - ideal)) if midpoints else ideal
+        cuts.append(cut)
+        cursor = cut
+    return cuts
+
+
+def plan_chunks(
+        duration: float,
+        regions: Optional[list[tuple[float, float]]] = None,
+        target: Optional[float] = None,
+) -> list[Chunk]:
+    """
+    Chunks covering [0, duration), cut at silences between `regions`.
+
+    Chunks without any voiced region are left out; they have nothing to
+    transcribe.
+    """
+    target = target or settings.chunk_target_seconds
+    gaps = [(a_end, b_start) for (_, a_end), (b_start, _) in zip(regions or [], (regions or [])[1:])]
+    bounds = [0.0, *_cut_points(duration, gaps, target), duration]
+
+    chunks = []
+    for start, end in zip(bounds, bounds[1:]):
+        if regions is None:
+            chunks.append(Chunk(start, end, None))
+            continue
+        inside = [
+            (round(max(a, start) - start, 3), round(min(b, end) - start, 3))
+            for a, b in regions
+            if a < end and b > start
+        ]
+        if inside:
+            chunks.append(Chunk(start, end, inside))
+    return chunks
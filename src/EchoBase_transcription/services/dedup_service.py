@@ -0,0 +1,283 @@
+"""
+Simulcast / duplicate call suppression.
+
+SDRTrunk records a transmission once per site it hears it on, and may emit
+the same recording again; every copy would otherwise cost a full Whisper
+decode. Before a voiced call reaches the model we look for an earlier call
+with
+
+- the same (system, talkgroup, source unit),
+- a timestamp within DEDUP_WINDOW_SECONDS,
+- a similar duration and audio envelope.
+
+The envelope fingerprint is the per-20 ms log energy of the decoded audio,
+relative to its loudest frames. Copies from different sites differ in gain,
+noise floor and start offset, but not in the speaker's syllable pattern, so
+we compare fingerprints by the best normalised cross-correlation over a
+small lag.
+
+Recent calls live in Redis for a few minutes:
+
+    echobase:dedup:<system>:<tg>:<unit>   sorted set: token -> call time
+    echobase:dedup:entry:<token>          hash: seq, fingerprint, duration, call_id
+
+Every call registers itself before looking, so two copies processed at the
+same time still agree on which one is canonical (the lower `seq`). The
+canonical call's entry gets its Call id once it is stored. A duplicate
+whose original is still in the pipeline does not hold a worker: it is
+re-checked by a retried task (worker/tasks/transcribe.py, link_duplicate)
+for up to DEDUP_WAIT_SECONDS and otherwise transcribed normally.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+import redis
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "echobase:dedup:"
+SEQ_KEY = KEY_PREFIX + "seq"
+ENTRY_PREFIX = KEY_PREFIX + "entry:"
+ENTRY_TTL_SECONDS = 600
+
+FRAME_MS = 20
+MAX_FINGERPRINT_SECONDS = 10  # the first seconds of a call are plenty to tell calls apart
+MAX_LAG_MS = 500  # start offset between sites' recordings
+MIN_OVERLAP_MS = 1000
+FLOOR_DB = -40.0  # envelope floor below the loudest frames; hiss differences vanish below it
+DURATION_TOLERANCE = 0.2  # share of the longer call (at least 1 s)
+RECHECK_SECONDS = 2.0  # between looks for a pending original
+
+_redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+class DedupMatch(NamedTuple):
+    token: str  # the canonical call's index entry
+    call_id: Optional[int]  # None while the canonical call is still being transcribed
+    similarity: float
+
+
+class OriginalStatus(NamedTuple):
+    call_id: Optional[int]  # the original's stored Call id, once there is one
+    pending: bool  # False: it will never be stored (failed, expired or index down)
+
+
+class DedupCheck(NamedTuple):
+    token: Optional[str]  # this call's index entry (None: dedup off / not applicable)
+    match: Optional[DedupMatch]
+
+
+NOT_CHECKED = DedupCheck(None, None)
+
+
+# --------------------------------------------------------------------------- #
+# Fingerprints
+# --------------------------------------------------------------------------- #
+def fingerprint(audio: np.ndarray, sample_rate: int = 16_000) -> np.ndarray:
+    """Envelope fingerprint of mono float audio: int8 dB per FRAME_MS frame."""
+    frame_len = sample_rate * FRAME_MS // 1000
+    n = min(len(audio) // frame_len, MAX_FINGERPRINT_SECONDS * 1000 // FRAME_MS)
+    if n == 0:
+        return np.zeros(0, dtype=np.int8)
+    frames = audio[: n * frame_len].reshape(n, frame_len)
+    energy_db = 10 * np.log10(np.mean(frames.astype(np.float32) ** 2, axis=1) + 1e-10)
+    envelope = np.clip(energy_db - np.percentile(energy_db, 95), FLOOR_DB, 0.0)
+    return np.round(envelope).astype(np.int8)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Best Pearson correlation of two fingerprints over ±MAX_LAG_MS (0 if too short)."""
+    a = a.astype(np.float32)
+    b = b.astype(np.float32)
+    max_lag = MAX_LAG_MS // FRAME_MS
+    min_overlap = MIN_OVERLAP_MS // FRAME_MS
+    best = 0.0
+    for lag in range(-max_lag, max_lag + 1):
+        x = a[max(lag, 0):]
+        y = b[max(-lag, 0):]
+        n = min(len(x), len(y))
+        if n < min_overlap:
+            continue
+        x = x[:n] - x[:n].mean()
+        y = y[:n] - y[:n].mean()
+        denom = float(np.sqrt((x * x).sum() * (y * y).sum()))
+        if denom:
+            best = max(best, float((x * y).sum()) / denom)
+    return best
+
+
+def _similar_duration(a: float, b: float) -> bool:
+    return abs(a - b) <= max(1.0, DURATION_TOLERANCE * max(a, b))
+
+
+def _encode(fp: np.ndarray) -> str:
+    return base64.b64encode(fp.tobytes()).decode("ascii")
+
+
+def _decode(value: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(value), dtype=np.int8)
+
+
+# --------------------------------------------------------------------------- #
+# Index
+# --------------------------------------------------------------------------- #
+def _epoch(timestamp: Union[datetime, str, None]) -> float:
+    """Call time as epoch seconds; falls back to now for anything unparseable."""
+    if isinstance(timestamp, str):
+        value = timestamp.strip()
+        if value.isdigit():
+            number = int(value)
+            return number / 1000 if number > 10 ** 11 else float(number)  # SDRTrunk sends ms
+        try:
+            timestamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            timestamp = None
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+    return time.time()
+
+
+def check(
+        system_id: int,
+        tg_number: Optional[int],
+        unit_id: Optional[int],
+        timestamp: Union[datetime, str, None],
+        audio: np.ndarray,
+        duration: float,
+        sample_rate: int = 16_000,
+) -> DedupCheck:
+    """
+    Register a voiced call in the index and look for an earlier copy of it.
+
+    Calls without a talkgroup are never deduplicated. Redis trouble is
+    logged and treated as "no match"; dedup never blocks transcription.
+    """
+    if not settings.dedup_enabled or tg_number is None:
+        return NOT_CHECKED
+
+    fp = fingerprint(audio, sample_rate)
+    at = _epoch(timestamp)
+    key = f"{KEY_PREFIX}{system_id}:{tg_number}:{unit_id if unit_id is not None else '-'}"
+    token = uuid.uuid4().hex
+    window = settings.dedup_window_seconds
+    try:
+        seq = _redis_client.incr(SEQ_KEY)
+        pipe = _redis_client.pipeline()
+        pipe.hset(ENTRY_PREFIX + token, mapping={"seq": seq, "fp": _encode(fp), "duration": duration})
+        pipe.expire(ENTRY_PREFIX + token, ENTRY_TTL_SECONDS)
+        pipe.zadd(key, {token: at})
+        pipe.zremrangebyscore(key, "-inf", at - ENTRY_TTL_SECONDS)
+        pipe.expire(key, ENTRY_TTL_SECONDS)
+        pipe.zrangebyscore(key, at - window, at + window)
+        candidates = [t for t in pipe.execute()[-1] if t != token]
+
+        match = None
+        if candidates:
+            pipe = _redis_client.pipeline()
+            for candidate in candidates:
+                pipe.hmget(ENTRY_PREFIX + candidate, "seq", "fp", "duration", "call_id")
+            earliest = None
+            for candidate, (c_seq, c_fp, c_duration, c_call_id) in zip(candidates, pipe.execute()):
+                # only calls registered before this one can be its original
+                if c_seq is None or int(c_seq) > seq:
+                    continue
+                if not _similar_duration(duration, float(c_duration)):
+                    continue
+                score = similarity(fp, _decode(c_fp))
+                if score < settings.dedup_min_similarity:
+                    continue
+                if earliest is None or int(c_seq) < earliest:
+                    earliest = int(c_seq)
+                    match = DedupMatch(candidate, int(c_call_id) if c_call_id else None, score)
+    except redis.RedisError as exc:
+        logger.warning("dedup: index unavailable (%s); transcribing normally", exc)
+        dedup_stats.record("error")
+        return NOT_CHECKED
+
+    if match is not None:
+        forget(token)  # later copies should link to the original, not to this one
+        return DedupCheck(None, match)
+    dedup_stats.record("unique")
+    return DedupCheck(token, None)
+
+
+def settle(token: Optional[str], call_id: int) -> None:
+    """Record the stored Call id for a canonical call, releasing waiting copies."""
+    if token is None:
+        return
+    try:
+        _redis_client.hset(ENTRY_PREFIX + token, "call_id", call_id)
+    except redis.RedisError as exc:
+        logger.warning("dedup: could not record call %s (%s)", call_id, exc)
+
+
+def forget(token: Optional[str]) -> None:
+    """Drop an entry whose call will not be stored (copies then transcribe themselves)."""
+    if token is None:
+        return
+    try:
+        _redis_client.delete(ENTRY_PREFIX + token)
+    except redis.RedisError:
+        pass  # expires on its own
+
+
+def original_status(match: DedupMatch) -> OriginalStatus:
+    """Where `match`'s original stands right now; never waits."""
+    if match.call_id is not None:
+        return OriginalStatus(match.call_id, False)
+    try:
+        seq, call_id = _redis_client.hmget(ENTRY_PREFIX + match.token, "seq", "call_id")
+    except redis.RedisError:
+        return OriginalStatus(None, False)
+    if call_id:
+        return OriginalStatus(int(call_id), False)
+    return OriginalStatus(None, seq is not None)
+
+
+# --------------------------------------------------------------------------- #
+# Hit rate
+# --------------------------------------------------------------------------- #
+class DedupStats:
+    """Process-wide dedup outcomes (also exported as echobase_dedup_calls)."""
+
+    RESULTS = ("unique", "duplicate", "timeout", "error")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = dict.fromkeys(self.RESULTS, 0)
+
+    def record(self, result: str) -> None:
+        from . import metrics
+
+        with self._lock:
+            self.counts[result] += 1
+        metrics.DEDUP_CALLS.labels(result).inc()
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        checked = sum(self.counts.values())
+        return self.counts["duplicate"] / checked if checked else None
+
+    def summary(self) -> str:
+        checked = sum(self.counts.values())
+        return (
+            f"dedup: {self.counts['duplicate']}/{checked} voiced calls were duplicates "
+            f"({self.hit_rate or 0.0:.0%}); {self.counts['timeout']} waited out, "
+            f"{self.counts['error']} unchecked"
+        )
+
+
+dedup_stats = DedupStats()
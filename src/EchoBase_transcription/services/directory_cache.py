@@ -0,0 +1,99 @@
+"""
+In-process snapshots of the directory tables (systems, talkgroups, radio units).
+
+Dashboards poll these lists constantly while they change rarely, so each
+list is queried and serialized once and then served as the same bytes, with
+an ETag for conditional GETs, until a DirectoryChanged event (ingest,
+get_or_create_*, a worker resolving a new talkgroup or radio) drops it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Callable, NamedTuple, Optional
+
+from pydantic import TypeAdapter
+
+from ..db.schemas import RadioUnitRead, SystemRead, TalkGroupRead
+from .radio_unit_service import list_radio_units_for_system
+from .system_service import list_systems
+from .talkgroup_service import list_talkgroups_for_system
+
+SYSTEMS = "systems"
+TALKGROUPS = "talkgroups"
+RADIO_UNITS = "radio_units"
+
+
+class Snapshot(NamedTuple):
+    body: bytes  # JSON, exactly as the list endpoint returns it
+    etag: str
+
+
+# table -> (loader(system_id), serializer)
+_SOURCES: dict[str, tuple[Callable[[Optional[int]], list], TypeAdapter]] = {
+    SYSTEMS: (lambda _system_id: list_systems(), TypeAdapter(list[SystemRead])),
+    TALKGROUPS: (list_talkgroups_for_system, TypeAdapter(list[TalkGroupRead])),
+    RADIO_UNITS: (list_radio_units_for_system, TypeAdapter(list[RadioUnitRead])),
+}
+
+
+class DirectoryCache:
+    def __init__(self):
+        self._snapshots: dict[tuple[str, Optional[int]], Snapshot] = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; a snapshot built across one is discarded
+        self._generation = 0
+        self._listener_started = False
+
+    def peek(self, table: str, system_id: Optional[int] = None) -> Optional[Snapshot]:
+        """The cached snapshot, if any (never touches the DB; safe on the event loop)."""
+        self._ensure_listener()
+        return self._snapshots.get((table, system_id))
+
+    def get(self, table: str, system_id: Optional[int] = None) -> Snapshot:
+        """The cached snapshot, building it on a miss (blocking)."""
+        snapshot = self.peek(table, system_id)
+        if snapshot is not None:
+            return snapshot
+
+        generation = self._generation
+        loader, adapter = _SOURCES[table]
+        body = adapter.dump_json(loader(system_id), by_alias=True)
+        snapshot = Snapshot(body, f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"')
+        with self._lock:
+            if generation == self._generation:
+                self._snapshots[(table, system_id)] = snapshot
+        return snapshot
+
+    def invalidate(self, table: Optional[str] = None, system_id: Optional[int] = None) -> None:
+        """Drop snapshots of `table` (all tables if None), for one system or all."""
+        with self._lock:
+            self._generation += 1
+            for key in list(self._snapshots):
+                if table not in (None, key[0]):
+                    continue
+                # systems aren't per system; a None system_id means "any"
+                if system_id is not None and key[1] not in (None, system_id):
+                    continue
+                del self._snapshots[key]
+
+    def _ensure_listener(self) -> None:
+        if self._listener_started:
+            return
+        with self._lock:
+            if self._listener_started:
+                return
+            from ..events import watch_directory_changes
+
+            watch_directory_changes(self._on_directory_change, name="directory-cache-invalidation")
+            self._listener_started = True
+
+    def _on_directory_change(self, evt) -> None:
+        if evt is None:
+            self.invalidate()
+        else:
+            self.invalidate(evt.table, evt.system_id)
+
+
+directory_cache = DirectoryCache()
@@ -0,0 +1,46 @@
+"""
+Track audio files that are queued or being transcribed right now.
+
+A short-lived Redis key per audio path (SET NX with a TTL) lets every
+producer (API routes, catch-up scanner, watcher) skip files that are already
+on their way through the pipeline instead of enqueueing them twice. The key
+is released when the task finishes; the TTL covers workers that die
+mid-task.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import redis
+
+from ..config import settings
+
+KEY_PREFIX = "echobase:inflight:"
+
+_redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+def claim(audio_path: str, task_id: str) -> Optional[str]:
+    """
+    Mark `audio_path` as in flight under `task_id`.
+
+    Returns None if the claim succeeded, otherwise the task id that already
+    holds it.
+    """
+    key = KEY_PREFIX + audio_path
+    if _redis_client.set(key, task_id, nx=True, ex=settings.inflight_ttl_seconds):
+        return None
+    return _redis_client.get(key) or task_id
+
+
+def release(audio_path: str) -> None:
+    _redis_client.delete(KEY_PREFIX + audio_path)
+
+
+def in_flight(audio_paths: list[str]) -> set[str]:
+    """Subset of `audio_paths` currently in flight (one round trip)."""
+    if not audio_paths:
+        return set()
+    values = _redis_client.mget([KEY_PREFIX + p for p in audio_paths])
+    return {p for p, v in zip(audio_paths, values) if v is not None}
@@ -1,85 +1,151 @@
 from __future__ import annotations
 
+import io
 import xml.etree.ElementTree as ET
-from typing import Dict, Tuple
+from typing import BinaryIO, Dict, NamedTuple, Union
 
-from sqlalchemy import delete
+from sqlalchemy import Integer, String, bindparam, func, literal, literal_column, select
+from sqlalchemy.dialects import postgresql
 
-from ..db import get_session
+from ..db import dialect_insert, get_session
 from ..db.models.talkgroup import TalkGroup
+from ..events.publisher import publish_directory_change
 
+# Rows per statement on backends without array parameters (SQLite caps bind
+# variables per statement); Postgres always takes the whole playlist at once
+FALLBACK_CHUNK_ROWS = 5_000
 
-def _parse_sdrtrunk_aliases(xml_bytes: bytes) -> Dict[int, str]:
+
+class IngestResult(NamedTuple):
+    talkgroups: Dict[int, str]  # {tg_number: alias} as parsed
+    created: int
+    updated: int  # alias changed
+    skipped: int  # already up to date
+
+
+def _parse_sdrtrunk_aliases(source: Union[bytes, BinaryIO]) -> Dict[int, str]:
     """
-    Parse SDRTrunk-style alias XML and return a mapping of
+    Stream-parse SDRTrunk-style alias XML and return a mapping of
     {tg_number: alias}. The first alias we see for a tg_number wins.
 
+    Each <alias> element is dropped as soon as it has been read, so memory
+    stays flat however large the playlist is.
+
     Raises ET.ParseError if the XML is invalid.
     """
-    root = ET.fromstring(xml_bytes)
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
 
     talkgroups: Dict[int, str] = {}
+    root = None
 
-    for alias in root.findall(".//alias"):
-        name = alias.get("name")
-        if not name:
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = elem
+        if event != "end" or elem.tag != "alias":
             continue
 
-        # SDRTrunk represents talkgroups like:
-        #   <id type="talkgroup" value="1234" />
-        for id_el in alias.findall('./id[@type="talkgroup"]'):
-            raw_val = (id_el.get("value") or "").strip()
-            if not raw_val.isdigit():
-                continue
+        name = elem.get("name")
+        if name:
+            # SDRTrunk represents talkgroups like:
+            #   <id type="talkgroup" value="1234" />
+            for id_el in elem.findall('./id[@type="talkgroup"]'):
+                raw_val = (id_el.get("value") or "").strip()
+                if not raw_val.isdigit():
+                    continue
+
+                # first alias for a tg_number wins, don't overwrite
+                talkgroups.setdefault(int(raw_val), name)
 
-            tg_num = int(raw_val)
-            # first alias for a tg_number wins, don't overwrite
-            talkgroups.setdefault(tg_num, name)
+        # SDRTrunk keeps <alias> directly under <playlist>; clearing the
+        # root as well detaches the finished (now empty) elements
+        elem.clear()
+        root.clear()
 
     return talkgroups
 
 
-def ingest_talkgroup_aliases(xml_bytes: bytes, system_id: int = 1) -> Tuple[Dict[int, str], int]:
+def _upsert_postgres(session, system_id: int, talkgroups: Dict[int, str]) -> tuple[int, int]:
+    """
+    One statement for the whole playlist: the numbers and aliases travel as
+    two array parameters and are unnested server-side.
+
+    Only new talkgroups and changed aliases are written (IS DISTINCT FROM),
+    so unchanged rows keep their tuple and every row keeps its id (and its
+    call history, whisper_prompt and priority). RETURNING reports the
+    written rows; `xmax = 0` tells an insert from an update.
+    """
+    source = select(
+        literal(system_id, Integer),
+        func.unnest(bindparam("tg_numbers", list(talkgroups), type_=postgresql.ARRAY(Integer))),
+        func.unnest(bindparam("aliases", list(talkgroups.values()), type_=postgresql.ARRAY(String))),
+    )
+    stmt = postgresql.insert(TalkGroup).from_select(["system_id", "tg_number", "alias"], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["system_id", "tg_number"],
+        set_={"alias": stmt.excluded.alias},
+        where=TalkGroup.alias.is_distinct_from(stmt.excluded.alias),
+    ).returning(literal_column("xmax = 0"))
+
+    inserted = session.execute(stmt).scalars().all()
+    created = sum(1 for was_insert in inserted if was_insert)
+    return created, len(inserted) - created
+
+
+def _upsert_generic(session, system_id: int, talkgroups: Dict[int, str]) -> tuple[int, int]:
+    """Same result as _upsert_postgres, diffing in Python first (SQLite etc.)."""
+    existing = dict(
+        session.execute(
+            select(TalkGroup.tg_number, TalkGroup.alias).where(TalkGroup.system_id == system_id)
+        ).all()
+    )
+    changed = [
+        {"system_id": system_id, "tg_number": tg, "alias": alias}
+        for tg, alias in talkgroups.items()
+        if tg not in existing or existing[tg] != alias
+    ]
+    for i in range(0, len(changed), FALLBACK_CHUNK_ROWS):
+        stmt = dialect_insert(TalkGroup).values(changed[i:i + FALLBACK_CHUNK_ROWS])
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=["system_id", "tg_number"],
+            set_={"alias": stmt.excluded.alias},
+        ))
+    created = sum(1 for row in changed if row["tg_number"] not in existing)
+    return created, len(changed) - created
+
+
+def ingest_talkgroup_aliases(source: Union[bytes, BinaryIO], system_id: int = 1) -> IngestResult:
     """
     High-level ingest pipeline used by the /internal/ingest route.
 
     Steps:
-    - Parse the uploaded XML into {tg_number: alias}.
-    - Delete any existing TalkGroup rows for those tg_numbers in that system.
-    - Insert fresh rows.
-
-    Returns (talkgroups_map, created_count).
+    - Stream-parse the uploaded XML (bytes or a binary file) into {tg_number: alias}.
+    - Upsert every talkgroup in one statement: new ones are inserted,
+      changed aliases updated in place, unchanged rows left alone.
+    - Publish a DirectoryChanged event if anything was written.
 
     Raises:
     - ET.ParseError        if XML is invalid
     - SQLAlchemyError      if DB operations fail
     - ValueError           if no talkgroups were found
     """
-    talkgroups = _parse_sdrtrunk_aliases(xml_bytes)
+    talkgroups = _parse_sdrtrunk_aliases(source)
     if not talkgroups:
         raise ValueError("No talkgroup IDs found")
 
-    tg_nums = list(talkgroups.keys())
-
     with get_session() as session:
-        # 1. Delete existing rows for these talkgroup numbers in this system
-        if tg_nums:
-            session.exec(
-                delete(TalkGroup).where(
-                    TalkGroup.system_id == system_id,
-                    TalkGroup.tg_number.in_(tg_nums),
-                )
-            )
-
-        # 2. Insert new rows
-        new_rows = [
-            TalkGroup(system_id=system_id, tg_number=tg, alias=name)
-            for tg, name in talkgroups.items()
-        ]
-
-        session.add_all(new_rows)
-        session.flush()
-
-        created_count = len(new_rows)
-
-    return talkgroups, created_count
+        if session.get_bind().dialect.name == "postgresql":
+            created, updated = _upsert_postgres(session, system_id, talkgroups)
+        else:
+            created, updated = _upsert_generic(session, system_id, talkgroups)
+
+    if created or updated:
+        # Aliases changed: drop every process's cached lookups
+        publish_directory_change(TalkGroup.__tablename__, system_id)
+
+    return IngestResult(
+        talkgroups=talkgroups,
+        created=created,
+        updated=updated,
+        skipped=len(talkgroups) - created - updated,
+    )
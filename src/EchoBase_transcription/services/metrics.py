@@ -0,0 +1,188 @@
+"""
+Prometheus metrics for the API and the worker.
+
+The API serves them on GET /metrics; each worker runs a small exporter on
+WORKER_METRICS_PORT. With several processes per service (prefork pool,
+multi-worker API server) set PROMETHEUS_MULTIPROC_DIR to an empty writable
+directory: every process then writes its samples there and the exporter
+aggregates them on scrape.
+
+Pipeline stages share one histogram, labelled by stage:
+
+    probe      API: container header check of an upload
+    decode     worker: audio decode to 16 kHz float32
+    vad        worker: voice activity pre-filter
+    dedup      worker: simulcast / duplicate lookup
+    inference  worker: Whisper (including draining the segment generator)
+    resolve    worker: talkgroup / radio unit id resolution
+    db_insert  Call INSERT + commit
+    publish    call event XADD
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+STAGE_SECONDS = Histogram(
+    "echobase_stage_seconds",
+    "Wall time per pipeline stage",
+    ["stage"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+QUEUE_WAIT_SECONDS = Histogram(
+    "echobase_queue_wait_seconds",
+    "Time from enqueue to the worker starting on a call",
+    ["queue"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800),
+)
+REAL_TIME_FACTOR = Histogram(
+    "echobase_real_time_factor",
+    "Inference wall time per second of audio decoded, per model",
+    ["model"],
+    buckets=(0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5),
+)
+CALLS = Counter("echobase_calls", "Calls stored", ["transcriber"])
+NO_SPEECH = Counter("echobase_no_speech", "Calls the VAD kept away from the model")
+REVIEW_FLAGS = Counter("echobase_review_flags", "Calls flagged for review when stored")
+DEDUP_CALLS = Counter(
+    "echobase_dedup_calls",
+    "Voiced calls checked for simulcast / repeat copies, by outcome",
+    ["result"],  # unique | duplicate | timeout | error
+)
+UPLOADS = Counter("echobase_uploads", "Audio accepted by the API for transcription", ["route"])
+SSE_CLIENTS = Gauge(
+    "echobase_sse_clients",
+    "Connected live-stream clients",
+    multiprocess_mode="livesum",
+)
+
+
+@contextmanager
+def stage(name: str):
+    """Time the enclosed block into echobase_stage_seconds{stage=name}."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.labels(name).observe(time.perf_counter() - started)
+
+
+def observe_inference(model: str, wall_seconds: float, audio_seconds: float) -> None:
+    STAGE_SECONDS.labels("inference").observe(wall_seconds)
+    if audio_seconds > 0:
+        REAL_TIME_FACTOR.labels(model).observe(wall_seconds / audio_seconds)
+
+
+def _enqueued_at(request):
+    """The `enqueued_at` header of a task request, or None."""
+    enqueued_at = getattr(request, "enqueued_at", None)
+    if enqueued_at is None:
+        enqueued_at = (getattr(request, "headers", None) or {}).get("enqueued_at")
+    if enqueued_at is None:
+        # celery-batches' SimpleRequest keeps only the message headers
+        request_dict = getattr(request, "request_dict", None) or {}
+        enqueued_at = request_dict.get("enqueued_at")
+        if enqueued_at is None:
+            enqueued_at = (request_dict.get("headers") or {}).get("enqueued_at")
+    return enqueued_at
+
+
+def observe_queue_wait(request) -> None:
+    """Record enqueue → start for a Celery request (`enqueued_at` header)."""
+    enqueued_at = _enqueued_at(request)
+    if enqueued_at is None:
+        return
+    queue = (getattr(request, "delivery_info", None) or {}).get("routing_key") or "default"
+    try:
+        QUEUE_WAIT_SECONDS.labels(queue).observe(max(time.time() - float(enqueued_at), 0.0))
+    except (TypeError, ValueError):
+        pass
+
+
+def record_stored(calls: Iterable) -> None:
+    """Count freshly committed Calls (anything with the Call columns)."""
+    for call in calls:
+        CALLS.labels(call.transcriber or "unknown").inc()
+        if call.no_speech:
+            NO_SPEECH.inc()
+        if call.needs_review:
+            REVIEW_FLAGS.inc()
+
+
+class QueueDepthCollector:
+    """echobase_queue_depth / _oldest_wait_seconds, read from Redis on scrape."""
+
+    def describe(self):
+        # Without this, registering the collector calls collect() (and Redis) right away
+        return []
+
+    def collect(self):
+        from .priority_service import queue_stats
+
+        depth = GaugeMetricFamily("echobase_queue_depth", "Calls waiting per priority tier", labels=["tier"])
+        wait = GaugeMetricFamily(
+            "echobase_queue_oldest_wait_seconds", "Age of the oldest waiting call per tier", labels=["tier"]
+        )
+        try:
+            stats = queue_stats()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not read queue depth for metrics (%s)", exc)
+            stats = []
+        for row in stats:
+            depth.add_metric([row["tier"]], row["depth"])
+            if row["oldest_wait_seconds"] is not None:
+                wait.add_metric([row["tier"]], row["oldest_wait_seconds"])
+        yield depth
+        yield wait
+
+
+def exposition_registry(extra: Optional[list] = None) -> CollectorRegistry:
+    """The registry to serve: this process's, or every process's in multiprocess mode."""
+    if MULTIPROCESS:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    for collector in extra or ():
+        registry.register(collector)
+    return registry
+
+
+def render(registry: CollectorRegistry) -> tuple[bytes, str]:
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def start_exporter(port: int) -> None:
+    """Serve /metrics from a background thread (worker side)."""
+    start_http_server(port, registry=exposition_registry())
+    logger.info("Metrics exporter listening on :%d", port)
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a finished child's live gauges (multiprocess mode only)."""
+    if MULTIPROCESS:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid)
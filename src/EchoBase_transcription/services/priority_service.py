@@ -0,0 +1,109 @@
+"""
+Talkgroup priority tiers and the transcription queue each call is routed to.
+
+A call's tier comes from PRIORITY_TALKGROUPS ("high:1001,1002;low:3001",
+matched on tg_number in every system) and otherwise from TalkGroup.priority.
+The per-talkgroup column is read in one query and cached for
+PRIORITY_REFRESH_SECONDS, so routing never costs a DB round trip per call.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+import redis
+from sqlmodel import select
+
+from ..config import settings
+from ..db import get_session
+from ..db.models.talkgroup import TalkGroup
+from ..worker.celery_app import PRIORITY_QUEUES
+
+logger = logging.getLogger(__name__)
+
+NORMAL = "normal"
+
+_redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+
+_db_tiers: dict[tuple[int, int], str] = {}
+_db_tiers_loaded_at = 0.0
+_db_tiers_lock = threading.Lock()
+
+
+def parse_priority_talkgroups(spec: str) -> dict[int, str]:
+    """"high:1001,1002;low:3001" → {1001: "high", 1002: "high", 3001: "low"}."""
+    tiers: dict[int, str] = {}
+    for part in filter(None, (p.strip() for p in spec.split(";"))):
+        tier, _, numbers = part.partition(":")
+        tier = tier.strip().lower()
+        if tier not in PRIORITY_QUEUES:
+            raise ValueError(f"Unknown priority tier {tier!r} in PRIORITY_TALKGROUPS")
+        for number in numbers.split(","):
+            if number.strip().isdigit():
+                tiers[int(number)] = tier
+    return tiers
+
+
+_env_tiers = parse_priority_talkgroups(settings.priority_talkgroups)
+
+
+def _talkgroup_tiers() -> dict[tuple[int, int], str]:
+    """{(system_id, tg_number): tier} for talkgroups with a priority set (TTL-cached)."""
+    global _db_tiers, _db_tiers_loaded_at
+    if time.monotonic() - _db_tiers_loaded_at < settings.priority_refresh_seconds:
+        return _db_tiers
+    with _db_tiers_lock:
+        if time.monotonic() - _db_tiers_loaded_at >= settings.priority_refresh_seconds:
+            try:
+                with get_session() as session:
+                    rows = session.exec(
+                        select(TalkGroup.system_id, TalkGroup.tg_number, TalkGroup.priority)
+                        .where(TalkGroup.priority.is_not(None))
+                    ).all()
+                _db_tiers = {(sid, tg): prio for sid, tg, prio in rows if prio in PRIORITY_QUEUES}
+            except Exception as exc:  # noqa: BLE001
+                # Routing must not block ingest; keep the last known mapping
+                logger.warning("Could not refresh talkgroup priorities (%s)", exc)
+            _db_tiers_loaded_at = time.monotonic()
+    return _db_tiers
+
+
+def tier_for(system_id: int, tg_number: Optional[int]) -> str:
+    if tg_number is None:
+        return NORMAL
+    return _env_tiers.get(tg_number) or _talkgroup_tiers().get((system_id, tg_number), NORMAL)
+
+
+def queue_for(system_id: int, tg_number: Optional[int]) -> str:
+    return PRIORITY_QUEUES[tier_for(system_id, tg_number)]
+
+
+def queue_stats() -> list[dict]:
+    """
+    Depth and head-of-line wait for every tier, in drain order.
+
+    Kombu's Redis transport LPUSHes and BRPOPs, so the oldest message is the
+    last list element; its `enqueued_at` header is set by enqueue_transcription.
+    """
+    pipe = _redis_client.pipeline()
+    for queue in PRIORITY_QUEUES.values():
+        pipe.llen(queue)
+        pipe.lindex(queue, -1)
+    replies = pipe.execute()
+
+    now = time.time()
+    stats = []
+    for (tier, queue), depth, oldest in zip(PRIORITY_QUEUES.items(), replies[::2], replies[1::2]):
+        wait = None
+        if oldest:
+            try:
+                enqueued_at = json.loads(oldest)["headers"].get("enqueued_at")
+                wait = round(now - float(enqueued_at), 1) if enqueued_at else None
+            except (ValueError, KeyError, TypeError):
+                pass
+        stats.append({"tier": tier, "queue": queue, "depth": depth, "oldest_wait_seconds": wait})
+    return stats
@@ -7,13 +7,16 @@ from sqlmodel import select
 from ..db import get_session
 from ..db.models.radio_unit import RadioUnit
 from ..db.schemas import RadioUnitCreate, RadioUnitRead
+from ..events.publisher import publish_directory_change
 
 
 def get_or_create_radio_unit(data: RadioUnitCreate) -> RadioUnitRead:
     """
     Look up a radio unit (unique per system_id + unit_id). If it doesn't
     exist, create it. If it exists and caller passed alias, update it.
+    Any insert or change is announced (DirectoryChanged) once committed.
     """
+    action = None
     with get_session() as session:
         existing = session.exec(
             select(RadioUnit).where(
@@ -27,12 +30,18 @@ def get_or_create_radio_unit(data: RadioUnitCreate) -> RadioUnitRead:
                 existing.alias = data.alias
                 session.add(existing)
                 session.flush()
-            return RadioUnitRead.model_validate(existing)
-
-        db_ru = RadioUnit(**data.model_dump())
-        session.add(db_ru)
-        session.flush()
-        return RadioUnitRead.model_validate(db_ru)
+                action = "changed"
+            result = RadioUnitRead.model_validate(existing)
+        else:
+            db_ru = RadioUnit(**data.model_dump())
+            session.add(db_ru)
+            session.flush()
+            action = "created"
+            result = RadioUnitRead.model_validate(db_ru)
+
+    if action:
+        publish_directory_change(RadioUnit.__tablename__, result.system_id, action=action)
+    return result
 
 
 def list_radio_units_for_system(system_id: int) -> List[RadioUnitRead]:
@@ -0,0 +1,161 @@
+"""
+Per-process cache for (system_id, tg_number) / (system_id, unit_id) → DB row.
+
+Workers resolve the same few hundred talkgroups and radios over and over, so
+we keep an LRU of the answers and only touch the database on a miss. A miss
+is a single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` (plus a SELECT
+only when another worker won the race), which is safe against concurrent
+inserts on uq_talkgroups_system_tg / uq_radio_units_system_unit.
+
+Entries are dropped when a DirectoryChanged event arrives (e.g. after
+/internal/ingest rewrites aliases). Rows inserted here are announced as
+action="created" so directory snapshots pick them up; resolver caches
+ignore those.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional
+
+from sqlmodel import select
+
+from ..config import settings
+from ..db import dialect_insert, get_session
+from ..db.models.radio_unit import RadioUnit
+from ..db.models.talkgroup import TalkGroup
+from ..events.publisher import publish_directory_change
+
+logger = logging.getLogger(__name__)
+
+
+class Resolved(NamedTuple):
+    id: int
+    alias: Optional[str]
+
+
+class _LRUCache:
+    """Tiny thread-safe LRU (functools.lru_cache can't evict by key prefix)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Resolved] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Resolved]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Resolved) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_talkgroups = _LRUCache(settings.resolver_cache_size)
+_radio_units = _LRUCache(settings.resolver_cache_size)
+
+_listener_started = False
+_listener_lock = threading.Lock()
+
+
+def resolve_talkgroup(system_id: int, tg_number: int) -> Resolved:
+    """Return (id, alias) for a talkgroup, inserting a bare row if it is new."""
+    _ensure_invalidation_listener()
+    key = (system_id, tg_number)
+    cached = _talkgroups.get(key)
+    if cached is not None:
+        return cached
+
+    with get_session() as session:
+        row = session.execute(
+            dialect_insert(TalkGroup)
+            .values(system_id=system_id, tg_number=tg_number)
+            .on_conflict_do_nothing(index_elements=["system_id", "tg_number"])
+            .returning(TalkGroup.id, TalkGroup.alias)
+        ).first()
+        created = row is not None
+        if row is None:  # already existed (or another worker just inserted it)
+            row = session.execute(
+                select(TalkGroup.id, TalkGroup.alias).where(
+                    TalkGroup.system_id == system_id,
+                    TalkGroup.tg_number == tg_number,
+                )
+            ).one()
+    if created:
+        publish_directory_change(TalkGroup.__tablename__, system_id, action="created")
+
+    resolved = Resolved(row.id, row.alias)
+    _talkgroups.put(key, resolved)
+    return resolved
+
+
+def resolve_radio_unit(system_id: int, unit_id: int) -> Resolved:
+    """Return (id, alias) for a radio unit, inserting a bare row if it is new."""
+    _ensure_invalidation_listener()
+    key = (system_id, unit_id)
+    cached = _radio_units.get(key)
+    if cached is not None:
+        return cached
+
+    with get_session() as session:
+        row = session.execute(
+            dialect_insert(RadioUnit)
+            .values(system_id=system_id, unit_id=unit_id)
+            .on_conflict_do_nothing(index_elements=["system_id", "unit_id"])
+            .returning(RadioUnit.id, RadioUnit.alias)
+        ).first()
+        created = row is not None
+        if row is None:
+            row = session.execute(
+                select(RadioUnit.id, RadioUnit.alias).where(
+                    RadioUnit.system_id == system_id,
+                    RadioUnit.unit_id == unit_id,
+                )
+            ).one()
+    if created:
+        publish_directory_change(RadioUnit.__tablename__, system_id, action="created")
+
+    resolved = Resolved(row.id, row.alias)
+    _radio_units.put(key, resolved)
+    return resolved
+
+
+def invalidate_resolver_cache(table: Optional[str] = None) -> None:
+    """Drop cached entries for one table ("talkgroups" / "radio_units") or all."""
+    if table in (None, TalkGroup.__tablename__):
+        _talkgroups.clear()
+    if table in (None, RadioUnit.__tablename__):
+        _radio_units.clear()
+
+
+def _ensure_invalidation_listener() -> None:
+    """Start (once per process) a daemon thread that clears the cache on DirectoryChanged."""
+    global _listener_started
+    if _listener_started:
+        return
+    with _listener_lock:
+        if _listener_started:
+            return
+        from ..events import watch_directory_changes
+
+        watch_directory_changes(_on_directory_change, name="resolver-invalidation")
+        _listener_started = True
+
+
+def _on_directory_change(evt) -> None:
+    if evt is None:
+        invalidate_resolver_cache()
+    elif evt.action != "created":  # a new row can't make a cached answer stale
+        invalidate_resolver_cache(evt.table)
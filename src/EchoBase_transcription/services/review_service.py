@@ -5,12 +5,51 @@ from typing import Optional
 
 from sqlmodel import select
 
+from ..config import settings
 from ..db import get_session
 from ..db.models.call import Call
 from ..db.schemas import CallRead
 from ..events.publisher import publish_call_update
 
 
+def should_flag_for_review(
+        confidence: Optional[float],
+        no_speech_prob: Optional[float],
+) -> bool:
+    """
+    Automatic review gate applied to fresh ASR output.
+
+    Flags low-confidence transcripts and ones Whisper itself thinks are
+    mostly not speech (hallucination risk). Calls with no segments at all
+    have nothing to review.
+    """
+    if confidence is None:
+        return False
+    if confidence < settings.review_min_confidence:
+        return True
+    return no_speech_prob is not None and no_speech_prob > settings.review_max_no_speech_prob
+
+
+def should_escalate(
+        confidence: Optional[float],
+        min_segment_confidence: Optional[float],
+        no_speech_prob: Optional[float],
+) -> bool:
+    """
+    Cascade gate: should the fast model's output be redone on the larger one?
+
+    Stricter than the review gate; one bad segment in an otherwise clean
+    call is enough. A first pass with no segments is not escalated.
+    """
+    if confidence is None:
+        return False
+    if confidence < settings.cascade_min_confidence:
+        return True
+    if min_segment_confidence is not None and min_segment_confidence < settings.cascade_min_segment_confidence:
+        return True
+    return no_speech_prob is not None and no_speech_prob > settings.cascade_max_no_speech_prob
+
+
 def apply_human_review(
         call_id: int,
         corrected_transcript: Optional[str],
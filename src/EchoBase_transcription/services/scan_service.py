@@ -0,0 +1,87 @@
+"""
+Incremental scan of the recordings tree for the catch-up job.
+
+Instead of rglob-ing every file on every run we keep a watermark (epoch
+seconds, stored in Redis) and only hand on files whose mtime moved past
+it, so each run looks up just the recent ones in the database. Every
+audio file is still stat'ed: a directory's mtime only changes when an
+entry is added or renamed, not when a long recording created before the
+watermark is finished later.
+"""
+
+from __future__ import annotations
+
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import redis
+from sqlmodel import select
+
+from ..config import settings
+from ..db import get_session
+from ..db.models.call import Call
+
+AUDIO_SUFFIXES = {".wav", ".mp3"}
+WATERMARK_KEY = "echobase:catchup:watermark"
+LOCK_KEY = "echobase:catchup:lock"
+
+_redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+def get_watermark() -> Optional[float]:
+    raw = _redis_client.get(WATERMARK_KEY)
+    return float(raw) if raw is not None else None
+
+
+def set_watermark(value: float) -> None:
+    _redis_client.set(WATERMARK_KEY, repr(value))
+
+
+def acquire_scan_lock(ttl: int = 900) -> bool:
+    """Keep overlapping beat runs (slow disk, long backlog) from scanning twice."""
+    return bool(_redis_client.set(LOCK_KEY, "1", nx=True, ex=ttl))
+
+
+def release_scan_lock() -> None:
+    _redis_client.delete(LOCK_KEY)
+
+
+def iter_recordings(root: Path, since: Optional[float], until: float) -> Iterator[Path]:
+    """
+    Yield audio files under `root` with since <= mtime < until (no lower
+    bound when `since` is None), walking with os.scandir.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in AUDIO_SUFFIXES:
+                        mtime = entry.stat().st_mtime
+                        if (since is None or mtime >= since) and mtime < until:
+                            yield Path(entry.path)
+        except FileNotFoundError:
+            continue  # rotated away mid-scan
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def known_audio_paths(paths: list[str]) -> set[str]:
+    """Subset of `paths` that already have a Call row (bounded IN queries)."""
+    if not paths:
+        return set()
+    with get_session() as session:
+        known = set(session.exec(select(Call.audio_path).where(Call.audio_path.in_(paths))).all())
+        # Recordings whose audio has since moved into the store (kept in place
+        # unless AUDIO_STORE_DELETE_SOURCE is set)
+        known.update(session.exec(select(Call.source_path).where(Call.source_path.in_(paths))).all())
+        return known
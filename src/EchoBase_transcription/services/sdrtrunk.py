@@ -0,0 +1,68 @@
+"""
+Metadata from SDRTrunk recording file names.
+
+SDRTrunk names call recordings like
+
+    20240314_142233Metro_P25_Fire_Dispatch_TO_41001_FROM_1234567.mp3
+    20240314_142233_Metro_Site1_TO_41001.wav
+
+i.e. a local date/time stamp, a free-form system/site/channel label, the
+destination (talkgroup) and optionally the source radio. Anything we can't
+parse is simply left out and the task falls back to its defaults.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+_NAME_RE = re.compile(
+    r"^(?P<date>\d{8})_(?P<time>\d{6})_?(?P<label>.*?)"
+    r"_TO_[^_]*?(?P<to>\d+)(?=_|$)"
+    r"(?:_FROM_[^_]*?(?P<from>\d+)(?=_|$))?",
+    re.IGNORECASE,
+)
+
+
+class RecordingMeta(NamedTuple):
+    timestamp: Optional[datetime]
+    tg_number: Optional[int]
+    unit_id: Optional[int]
+    label: Optional[str]
+
+
+def parse_recording_name(file_name: str) -> RecordingMeta:
+    """Best-effort parse of an SDRTrunk recording file name."""
+    m = _NAME_RE.match(Path(file_name).stem)
+    if m is None:
+        return RecordingMeta(None, None, None, None)
+
+    try:
+        timestamp = datetime.strptime(m["date"] + m["time"], "%Y%m%d%H%M%S")
+    except ValueError:
+        timestamp = None
+
+    return RecordingMeta(
+        timestamp=timestamp,
+        tg_number=int(m["to"]),
+        unit_id=int(m["from"]) if m["from"] else None,
+        label=m["label"].strip("_") or None,
+    )
+
+
+def recording_task_kwargs(path: Path) -> dict:
+    """kwargs for enqueue_transcription() derived from a recording's name."""
+    meta = parse_recording_name(path.name)
+    kwargs: dict = {}
+    if meta.timestamp is not None:
+        kwargs["timestamp"] = meta.timestamp.isoformat()
+    if meta.tg_number is not None:
+        kwargs["tg_number"] = meta.tg_number
+    if meta.unit_id is not None:
+        kwargs["unit_id"] = meta.unit_id
+    if meta.label is not None:
+        # the label names the site / channel that heard the call (simulcast copies differ here)
+        kwargs["site"] = meta.label
+    return kwargs
@@ -7,6 +7,7 @@ from sqlmodel import select
 from ..db import get_session
 from ..db.models.system import System
 from ..db.schemas import SystemCreate, SystemRead
+from ..events.publisher import publish_directory_change
 
 
 def get_or_create_system(data: SystemCreate) -> SystemRead:
@@ -16,7 +17,9 @@ def get_or_create_system(data: SystemCreate) -> SystemRead:
     We currently treat System.name as the unique identity for a system.
     If a system already exists but the caller provided a new description,
     we'll update that description.
+    Any insert or change is announced (DirectoryChanged) once committed.
     """
+    action = None
     with get_session() as session:
         existing = session.exec(
             select(System).where(System.name == data.name)
@@ -31,15 +34,21 @@ def get_or_create_system(data: SystemCreate) -> SystemRead:
                 existing.description = data.description
                 session.add(existing)
                 session.flush()
+                action = "changed"
 
-            return SystemRead.model_validate(existing)
+            result = SystemRead.model_validate(existing)
+        else:
+            # Create a brand new system
+            db_system = System(**data.model_dump())
+            session.add(db_system)
+            session.flush()
+            action = "created"
 
-        # Create a brand new system
-        db_system = System(**data.model_dump())
-        session.add(db_system)
-        session.flush()
+            result = SystemRead.model_validate(db_system)
 
-        return SystemRead.model_validate(db_system)
+    if action:
+        publish_directory_change(System.__tablename__, result.id, action=action)
+    return result
 
 
 def list_systems() -> List[SystemRead]:
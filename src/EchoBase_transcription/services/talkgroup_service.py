@@ -7,6 +7,7 @@ from sqlmodel import select
 from ..db import get_session
 from ..db.models.talkgroup import TalkGroup
 from ..db.schemas import TalkGroupCreate, TalkGroupRead
+from ..events.publisher import publish_directory_change
 
 
 def get_or_create_talkgroup(data: TalkGroupCreate) -> TalkGroupRead:
@@ -22,7 +23,9 @@ def get_or_create_talkgroup(data: TalkGroupCreate) -> TalkGroupRead:
       - Return TalkGroupRead for the new row.
 
     This is used by ingestion (Celery) and can also be used by API routes.
+    Any insert or change is announced (DirectoryChanged) once committed.
     """
+    action = None
     with get_session() as session:
         existing = session.exec(
             select(TalkGroup).where(
@@ -50,15 +53,21 @@ def get_or_create_talkgroup(data: TalkGroupCreate) -> TalkGroupRead:
             if changed:
                 session.add(existing)
                 session.flush()
+                action = "changed"
 
-            return TalkGroupRead.model_validate(existing)
+            result = TalkGroupRead.model_validate(existing)
+        else:
+            # Not found -> create new TalkGroup
+            db_tg = TalkGroup(**data.model_dump())
+            session.add(db_tg)
+            session.flush()
+            action = "created"
 
-        # Not found -> create new TalkGroup
-        db_tg = TalkGroup(**data.model_dump())
-        session.add(db_tg)
-        session.flush()
+            result = TalkGroupRead.model_validate(db_tg)
 
-        return TalkGroupRead.model_validate(db_tg)
+    if action:
+        publish_directory_change(TalkGroup.__tablename__, result.system_id, action=action)
+    return result
 
 
 def list_talkgroups_for_system(system_id: int) -> List[TalkGroupRead]:
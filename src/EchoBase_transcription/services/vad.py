@@ -0,0 +1,159 @@
+"""
+Cheap energy / spectral-flatness voice activity detection.
+
+Runs on the decoded 16 kHz float32 buffer before Whisper so that key-ups,
+carrier noise and data bursts never reach the model (where they cost a full
+decode and often come back as hallucinated text), and so that voiced calls
+are only decoded over their voiced regions.
+
+Per 30 ms frame we look at:
+- energy (dBFS) relative to the clip's own noise floor (10th percentile),
+- spectral flatness: broadband hiss / carrier noise is flat (≈1), voice is
+  peaky (≪ 0.5).
+Voiced frames are smoothed (short gaps bridged, blips dropped) into regions,
+and long runs at a constant level (tones, data bursts) are discarded.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..config import settings
+
+FRAME_MS = 30
+MERGE_GAP_MS = 300  # bridge pauses shorter than this
+MIN_RUN_MS = 120  # ignore voiced blips shorter than this
+PAD_MS = 200  # keep a little context around each region
+STEADY_MIN_MS = 300  # runs at least this long are checked for steadiness
+STEADY_MAX_STD_DB = 2.0  # tones / data bursts hold their level; syllables don't
+
+
+@dataclass
+class VadResult:
+    total_seconds: float
+    speech_seconds: float
+    regions: list[tuple[float, float]] = field(default_factory=list)  # seconds
+
+    @property
+    def is_speech(self) -> bool:
+        return self.speech_seconds * 1000 >= settings.vad_min_speech_ms
+
+    @property
+    def voiced_seconds(self) -> float:
+        return sum(end - start for start, end in self.regions)
+
+
+def _frames(audio: np.ndarray, frame_len: int) -> np.ndarray:
+    n = len(audio) // frame_len
+    return audio[: n * frame_len].reshape(n, frame_len)
+
+
+def _runs(mask: np.ndarray) -> list[tuple[int, int]]:
+    """[start, end) index pairs of True runs."""
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(edges[::2], edges[1::2]))
+
+
+def detect_voice(audio: np.ndarray, sample_rate: int = 16_000) -> VadResult:
+    """Classify `audio` (mono float32) and return its voiced regions."""
+    total_seconds = len(audio) / sample_rate
+    frame_len = sample_rate * FRAME_MS // 1000
+    frames = _frames(audio, frame_len)
+    if len(frames) == 0:
+        return VadResult(total_seconds, 0.0)
+
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(frame_len), axis=1)) + 1e-10
+    flatness = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(spectrum, axis=1)
+
+    noise_floor = np.percentile(energy_db, 10)
+    dynamic_range = np.percentile(energy_db, 90) - noise_floor
+    loud = energy_db > settings.vad_abs_floor_db
+    if dynamic_range >= settings.vad_margin_db:
+        loud &= energy_db > noise_floor + settings.vad_margin_db
+    # else: no quiet frames to compare against (all voice or all noise);
+    # flatness alone has to decide
+
+    voiced = loud & (flatness < settings.vad_max_flatness)
+
+    frame_s = FRAME_MS / 1000
+    runs = [
+        (start, end) for start, end in _runs(voiced)
+        if (end - start) * FRAME_MS >= MIN_RUN_MS
+        and not (
+            (end - start) * FRAME_MS >= STEADY_MIN_MS
+            and np.std(energy_db[start:end]) < STEADY_MAX_STD_DB
+        )
+    ]
+    speech_seconds = float(sum(end - start for start, end in runs) * frame_s)
+
+    regions: list[tuple[float, float]] = []
+    pad = PAD_MS / 1000
+    for start, end in runs:
+        s = max(float(start) * frame_s - pad, 0.0)
+        e = min(float(end) * frame_s + pad, total_seconds)
+        if regions and s - regions[-1][1] <= MERGE_GAP_MS / 1000:
+            regions[-1] = (regions[-1][0], e)
+        else:
+            regions.append((s, e))
+
+    return VadResult(total_seconds, speech_seconds, [(round(s, 2), round(e, 2)) for s, e in regions])
+
+
+class VadStats:
+    """
+    Process-wide tally of what the pre-filter saved.
+
+    Model time saved is estimated from the observed real-time factor of the
+    calls that did go through Whisper.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.skipped_calls = 0
+        self.skipped_audio_seconds = 0.0
+        self.trimmed_audio_seconds = 0.0  # silence cut out of voiced calls
+        self.model_audio_seconds = 0.0
+        self.model_wall_seconds = 0.0
+
+    def record_skip(self, audio_seconds: float) -> None:
+        with self._lock:
+            self.skipped_calls += 1
+            self.skipped_audio_seconds += audio_seconds
+
+    def record_inference(self, total_seconds: float, voiced_seconds: float, wall_seconds: float) -> None:
+        with self._lock:
+            self.trimmed_audio_seconds += max(total_seconds - voiced_seconds, 0.0)
+            self.model_audio_seconds += voiced_seconds
+            self.model_wall_seconds += wall_seconds
+
+    @property
+    def real_time_factor(self) -> float | None:
+        if not self.model_audio_seconds:
+            return None
+        return self.model_wall_seconds / self.model_audio_seconds
+
+    @property
+    def estimated_seconds_saved(self) -> float | None:
+        rtf = self.real_time_factor
+        if rtf is None:
+            return None
+        return (self.skipped_audio_seconds + self.trimmed_audio_seconds) * rtf
+
+    def summary(self) -> str:
+        text = (
+            f"VAD: {self.skipped_calls} calls skipped ({self.skipped_audio_seconds:.1f}s audio), "
+            f"{self.trimmed_audio_seconds:.1f}s silence trimmed"
+        )
+        saved = self.estimated_seconds_saved
+        if saved is not None:
+            text += f"; ~{saved:.1f}s model time saved"
+        return text
+
+
+vad_stats = VadStats()
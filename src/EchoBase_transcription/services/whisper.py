@@ -1,24 +1,213 @@
+import logging
 import math
+import os
+import threading
+from bisect import bisect_right
+from dataclasses import replace
 from pathlib import Path
 
 from ..config import settings
+from .audio import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
 
 
 def segment_confidence(seg):
     return math.exp(seg.avg_logprob) * (1 - seg.no_speech_prob)
 
 
+class SegmentAggregator:
+    """
+    Single-pass consumer for faster-whisper's lazy segment generator.
+
+    Reading the generator once yields everything the task needs: the joined
+    transcript, a duration-weighted confidence, no-speech statistics and a
+    compact per-segment list ([start, end, confidence, no_speech_prob, text])
+    that is stored on Call.segments.
+    """
+
+    def __init__(self, offset: float = 0.0):
+        self.offset = offset  # seconds added to every segment (chunked audio)
+        self.rows: list[list] = []
+        self._texts: list[str] = []
+        self._weight = 0.0
+        self._conf_sum = 0.0
+        self._no_speech_sum = 0.0
+        self.max_no_speech_prob: float | None = None
+
+    def add(self, start: float, end: float, text: str, avg_logprob: float, no_speech_prob: float) -> None:
+        self._add(start + self.offset, end + self.offset, math.exp(avg_logprob) * (1 - no_speech_prob),
+                  no_speech_prob, text)
+
+    def add_rows(self, rows: list[list]) -> "SegmentAggregator":
+        """Fold in rows from another aggregator (e.g. one chunk of a long call), in order."""
+        for start, end, conf, no_speech_prob, text in rows:
+            self._add(start + self.offset, end + self.offset, conf, no_speech_prob, text)
+        return self
+
+    def _add(self, start: float, end: float, conf: float, no_speech_prob: float, text: str) -> None:
+        text = (text or "").strip()
+        # zero-length segments still count, just barely
+        weight = max(end - start, 0.01)
+
+        self._weight += weight
+        self._conf_sum += conf * weight
+        self._no_speech_sum += no_speech_prob * weight
+        if self.max_no_speech_prob is None or no_speech_prob > self.max_no_speech_prob:
+            self.max_no_speech_prob = no_speech_prob
+
+        if text:
+            self._texts.append(text)
+        self.rows.append([
+            round(start, 2),
+            round(end, 2),
+            round(conf, 3),
+            round(no_speech_prob, 3),
+            text,
+        ])
+
+    def consume(self, segments) -> "SegmentAggregator":
+        """Drain an iterable of faster-whisper Segment objects."""
+        for seg in segments:
+            self.add(seg.start, seg.end, seg.text, seg.avg_logprob, seg.no_speech_prob)
+        return self
+
+    @property
+    def transcript(self) -> str:
+        return " ".join(self._texts)
+
+    @property
+    def confidence(self) -> float | None:
+        return self._conf_sum / self._weight if self._weight else None
+
+    @property
+    def no_speech_prob(self) -> float | None:
+        """Duration-weighted mean no-speech probability."""
+        return self._no_speech_sum / self._weight if self._weight else None
+
+    @property
+    def min_segment_confidence(self) -> float | None:
+        return min((row[2] for row in self.rows), default=None)
+
+    @property
+    def needs_review(self) -> bool:
+        from .review_service import should_flag_for_review
+
+        return should_flag_for_review(self.confidence, self.no_speech_prob)
+
+    @property
+    def needs_escalation(self) -> bool:
+        from .review_service import should_escalate
+
+        return should_escalate(self.confidence, self.min_segment_confidence, self.no_speech_prob)
+
+
+BATCH_CLIP_MAX_SECONDS = 30  # one Whisper window per clip
+
+DEFAULT_PREFORK_THREADS = 4  # intra-op threads per child when neither knob is set
+
+
+def worker_concurrency() -> int:
+    """Number of calls this worker transcribes at once (processes or threads)."""
+    if settings.worker_pool not in ("prefork", "threads"):
+        return 1
+    if settings.worker_concurrency > 0:
+        return settings.worker_concurrency
+    threads = settings.whisper_cpu_threads or DEFAULT_PREFORK_THREADS
+    return max((os.cpu_count() or 1) // threads, 1)
+
+
+def cpu_threads_per_model() -> int:
+    """Intra-op threads for each loaded model (0 = CTranslate2's default)."""
+    if settings.whisper_cpu_threads > 0:
+        return settings.whisper_cpu_threads
+    if settings.worker_pool not in ("prefork", "threads"):
+        return 0
+    # Fixed, even slice of the cores so children / replicas don't oversubscribe the CPU
+    return max((os.cpu_count() or 1) // worker_concurrency(), 1)
+
+
+def model_replicas() -> int:
+    """CTranslate2 workers per model: one per pool thread, sharing the weights."""
+    return worker_concurrency() if settings.worker_pool == "threads" else 1
+
+
+def check_prefork_memory(model_paths: list[str]) -> None:
+    """
+    Log what the prefork children's model copies will take, and warn when
+    they don't fit in the memory available now (weights on disk x children,
+    a lower bound on CPU; on GPU the copies go to device memory instead).
+    """
+    weights = sum(
+        os.path.getsize(os.path.join(path, "model.bin"))
+        for path in model_paths
+        if os.path.isfile(os.path.join(path, "model.bin"))
+    )
+    children = worker_concurrency()
+    logger.info("prefork: %d children will each load %.0f MB of model weights", children, weights / 2 ** 20)
+    try:
+        available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return
+    if settings.whisper_device != "cuda" and weights * children > available:
+        logger.warning(
+            "prefork: %d model copies need ~%.0f MB but only %.0f MB is free; lower "
+            "WORKER_CONCURRENCY or use WORKER_POOL=threads (one shared model)",
+            children, weights * children / 2 ** 20, available / 2 ** 20,
+        )
+
+
 class ModelLoader:
-    _model = None
+    """
+    Per-process model cache, keyed by model name.
+
+    Normally holds just settings.whisper_model_name; in cascade mode the
+    escalation model (WHISPER_CASCADE_MODEL) is cached alongside it.
+    """
+
+    _models: dict = {}
+    _batched: dict = {}
+
+    @classmethod
+    def get_model(cls, name: str | None = None):
+        name = name or settings.whisper_model_name
+        if name not in cls._models:
+            cls._models[name] = cls._load_model(name)
+        return cls._models[name]
 
     @classmethod
-    def get_model(cls):
-        if cls._model is None:
-            cls._model = cls._load_model()
-        return cls._model
+    def get_batched_pipeline(cls, name: str | None = None):
+        """Wrap a loaded model in faster-whisper's batched pipeline (shares weights)."""
+        name = name or settings.whisper_model_name
+        if name not in cls._batched:
+            from faster_whisper import BatchedInferencePipeline
+
+            cls._batched[name] = BatchedInferencePipeline(model=cls.get_model(name))
+        return cls._batched[name]
+
+    @staticmethod
+    def prefetch(model_name: str | None = None) -> str:
+        """
+        Import the inference stack and make sure the model files are on disk,
+        without creating a model. Returns the model directory.
+
+        Used by the prefork parent: CTranslate2 starts its worker threads when
+        a model is constructed, and threads don't survive fork(), so the model
+        itself must be built in each child. Everything up to that point
+        (imports, download, tokenizer files) is done once here and inherited.
+        """
+        from faster_whisper.utils import download_model
+
+        model_name = model_name or settings.whisper_model_name
+        Path(settings.whisper_cache_dir).mkdir(parents=True, exist_ok=True)
+        try:
+            return download_model(model_name, local_files_only=True, cache_dir=settings.whisper_cache_dir)
+        except Exception:  # noqa: BLE001
+            print(f"Prefetching faster_whisper model: {model_name}")
+            return download_model(model_name, cache_dir=settings.whisper_cache_dir)
 
     @staticmethod
-    def _load_model():
+    def _load_model(model_name: str):
         from faster_whisper import WhisperModel
 
         # Determine device
@@ -34,16 +223,19 @@ class ModelLoader:
         Path(settings.whisper_cache_dir).mkdir(parents=True, exist_ok=True)
 
         print(
-            f"Using faster_whisper model: {settings.whisper_model_name} "
-            f"on {device} (compute_type={settings.whisper_compute_type})"
+            f"Using faster_whisper model: {model_name} "
+            f"on {device} (compute_type={settings.whisper_compute_type}, "
+            f"cpu_threads={cpu_threads_per_model() or 'default'}, replicas={model_replicas()})"
         )
 
         try:
             # First try with local files only
             model = WhisperModel(
-                settings.whisper_model_name,
+                model_name,
                 device=device,
                 compute_type=settings.whisper_compute_type,
+                cpu_threads=cpu_threads_per_model(),
+                num_workers=model_replicas(),
                 download_root=settings.whisper_cache_dir,
                 local_files_only=True
             )
@@ -53,15 +245,101 @@ class ModelLoader:
             try:
                 # If local fails, try downloading
                 model = WhisperModel(
-                    settings.whisper_model_name,
+                    model_name,
                     device=device,
                     compute_type=settings.whisper_compute_type,
+                    cpu_threads=cpu_threads_per_model(),
+                    num_workers=model_replicas(),
                     download_root=settings.whisper_cache_dir,
                     local_files_only=False
                 )
                 print("Model downloaded successfully")
             except Exception as download_error:
                 print(f"Download failed: {download_error}")
-                raise RuntimeError(f"Could not load model {settings.whisper_model_name}: {download_error}")
+                raise RuntimeError(f"Could not load model {model_name}: {download_error}")
 
         return model
+
+
+def cascade_enabled() -> bool:
+    """True when low-confidence calls are re-run on WHISPER_CASCADE_MODEL."""
+    return bool(settings.whisper_cascade_model) and settings.whisper_cascade_model != settings.whisper_model_name
+
+
+class CascadeStats:
+    """Process-wide escalation rate for the model cascade."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.first_pass = 0
+        self.escalated = 0
+
+    def record(self, calls: int, escalated: int) -> None:
+        with self._lock:
+            self.first_pass += calls
+            self.escalated += escalated
+
+    def summary(self) -> str:
+        rate = self.escalated / self.first_pass if self.first_pass else 0.0
+        return (
+            f"cascade: {self.escalated}/{self.first_pass} calls escalated to "
+            f"{settings.whisper_cascade_model} ({rate:.0%})"
+        )
+
+
+cascade_stats = CascadeStats()
+
+
+def transcribe_many(audios, language=None, batch_size=8, regions=None, model_name=None):
+    """
+    Transcribe several short decoded clips (16 kHz float32 arrays) in one
+    batched inference pass.
+
+    The clips are laid end to end in a single buffer and handed to the batched
+    pipeline as explicit clip_timestamps, so every clip becomes one entry in the
+    same decode batch. Segments are mapped back to their source clip and their
+    timestamps rebased to that clip.
+
+    `regions` optionally gives, per clip, the (start, end) seconds to decode
+    (e.g. VAD voiced regions); each region becomes its own batch entry.
+
+    `model_name` picks the model (default settings.whisper_model_name).
+
+    Every clip must be at most BATCH_CLIP_MAX_SECONDS long.
+    Returns a list (one per input clip) of segment lists.
+    """
+    import numpy as np
+
+    if not audios:
+        return []
+
+    offsets = []
+    clip_timestamps = []
+    cursor = 0
+    for i, audio in enumerate(audios):
+        if len(audio) > BATCH_CLIP_MAX_SECONDS * SAMPLE_RATE:
+            raise ValueError("clip longer than one Whisper window; use the single-call path")
+        offsets.append(cursor / SAMPLE_RATE)
+        clip_regions = regions[i] if regions and regions[i] else [(0.0, len(audio) / SAMPLE_RATE)]
+        for start, end in clip_regions:
+            clip_timestamps.append({
+                "start": cursor + int(start * SAMPLE_RATE),
+                "end": cursor + min(int(end * SAMPLE_RATE), len(audio)),
+            })
+        cursor += len(audio)
+
+    buffer = np.concatenate(audios).astype(np.float32, copy=False)
+    segments, _info = ModelLoader.get_batched_pipeline(model_name).transcribe(
+        buffer,
+        language=language,
+        batch_size=batch_size,
+        vad_filter=False,
+        clip_timestamps=clip_timestamps,
+    )
+
+    per_clip = [[] for _ in audios]
+    for seg in segments:
+        idx = max(bisect_right(offsets, seg.start + 1e-3) - 1, 0)
+        base = offsets[idx]
+        per_clip[idx].append(replace(seg, start=seg.start - base, end=seg.end - base))
+    return per_clip
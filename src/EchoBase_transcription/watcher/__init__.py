@@ -0,0 +1 @@
+"""Event-driven ingest: watch CALL_WATCH_PATH and enqueue recordings as they land."""
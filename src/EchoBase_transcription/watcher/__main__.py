@@ -0,0 +1,153 @@
+"""
+Standalone recordings watcher.
+
+    python -m EchoBase_transcription.watcher
+
+Uses inotify (IN_CLOSE_WRITE / IN_MOVED_TO) on every directory under
+settings.call_watch_path and enqueues transcribe tasks as soon as a file is
+complete. On start-up (and after an inotify queue overflow) it runs the
+incremental catch-up scan once to cover whatever arrived while it was down;
+after that no polling is needed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from pathlib import Path
+
+from inotify_simple import INotify, flags
+
+from ..config import settings
+from ..services import scan_service
+from ..services.sdrtrunk import recording_task_kwargs
+from ..worker.tasks.housekeeping import catch_up_unprocessed
+from ..worker.tasks.transcribe import enqueue_transcription
+
+logger = logging.getLogger("echobase.watcher")
+
+DIR_MASK = (
+    flags.CLOSE_WRITE
+    | flags.MOVED_TO
+    | flags.MODIFY
+    | flags.CREATE
+    | flags.DELETE_SELF
+)
+WATERMARK_EVERY = 60  # seconds between watermark advances
+
+
+class RecordingsWatcher:
+    """
+    inotify loop with per-file debounce.
+
+    A file becomes due `debounce` seconds after its last CLOSE_WRITE /
+    MOVED_TO; any further write to it before then pushes the deadline back,
+    so writers that reopen the file don't get enqueued half-done.
+    """
+
+    def __init__(self, root: Path, debounce: float):
+        self.root = root
+        self.debounce = debounce
+        self.inotify = INotify()
+        self.watches: dict[int, Path] = {}
+        self.pending: dict[Path, float] = {}  # path -> due time
+        self.first_seen: dict[Path, float] = {}
+        self._last_watermark = 0.0
+
+    # ------------------------------------------------------------------ #
+    def watch_tree(self, top: Path) -> None:
+        for dirpath, _dirnames, _files in os.walk(top):
+            try:
+                wd = self.inotify.add_watch(dirpath, DIR_MASK)
+            except OSError as exc:
+                logger.warning("Cannot watch %s: %s", dirpath, exc)
+                continue
+            self.watches[wd] = Path(dirpath)
+
+    def run(self) -> None:
+        self.watch_tree(self.root)
+        logger.info("Watching %d directories under %s", len(self.watches), self.root)
+        # Cover the gap since the last run; inotify covers everything after
+        catch_up_unprocessed()
+
+        while True:
+            self._handle(self.inotify.read(timeout=self._timeout_ms()))
+            self._flush_due()
+            self._advance_watermark()
+
+    # ------------------------------------------------------------------ #
+    def _timeout_ms(self) -> int:
+        if not self.pending:
+            return WATERMARK_EVERY * 1000
+        return max(int((min(self.pending.values()) - time.monotonic()) * 1000), 0)
+
+    def _handle(self, events) -> None:
+        now = time.monotonic()
+        for event in events:
+            if event.mask & flags.Q_OVERFLOW:
+                logger.warning("inotify queue overflowed; rescanning")
+                catch_up_unprocessed()
+                continue
+
+            parent = self.watches.get(event.wd)
+            if parent is None:
+                continue
+            if event.mask & flags.IGNORED:
+                self.watches.pop(event.wd, None)
+                continue
+
+            path = parent / event.name
+            if event.mask & flags.ISDIR:
+                if event.mask & (flags.CREATE | flags.MOVED_TO):
+                    self.watch_tree(path)
+                    # files may have landed before the watch existed
+                    for fp in scan_service.iter_recordings(path, None, time.time()):
+                        self._arm(fp, now)
+                continue
+
+            if path.suffix.lower() not in scan_service.AUDIO_SUFFIXES:
+                continue
+            if event.mask & (flags.CLOSE_WRITE | flags.MOVED_TO):
+                self._arm(path, now)
+            elif event.mask & flags.MODIFY and path in self.pending:
+                self._arm(path, now)  # still being written: push back
+
+    def _arm(self, path: Path, now: float) -> None:
+        self.pending[path] = now + self.debounce
+        self.first_seen.setdefault(path, time.time())
+
+    def _flush_due(self) -> None:
+        now = time.monotonic()
+        for path in [p for p, due in self.pending.items() if due <= now]:
+            del self.pending[path]
+            first_seen = self.first_seen.pop(path, None)
+            if not path.exists():
+                continue
+            try:
+                enqueue_transcription(path.name, str(path), **recording_task_kwargs(path))
+            except Exception as exc:  # noqa: BLE001
+                # Broker hiccup: retry later; first_seen keeps the watermark behind it
+                logger.error("Failed to enqueue %s: %s", path, exc)
+                self.pending[path] = now + max(self.debounce, 1.0) * 10
+                self.first_seen[path] = first_seen or time.time()
+
+    def _advance_watermark(self) -> None:
+        """Everything before the oldest pending file has been enqueued."""
+        now = time.time()
+        if now - self._last_watermark < WATERMARK_EVERY:
+            return
+        oldest = min(self.first_seen.values(), default=now)
+        scan_service.set_watermark(oldest - settings.scan_settle_seconds)
+        self._last_watermark = now
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if not settings.call_watch_path:
+        raise SystemExit("CALL_WATCH_PATH is not set; nothing to watch")
+    RecordingsWatcher(Path(settings.call_watch_path), settings.watcher_debounce_ms / 1000).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import os
+
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
 from kombu import Exchange, Queue
 
 from ..config import settings
+from ..services import metrics
+from ..services.whisper import worker_concurrency
 
 # ---------------------------------------------------------------------------- #
 # Celery application
@@ -16,6 +21,13 @@ celery_app = Celery(
 )
 celery_app.conf.broker_connection_retry_on_startup = True
 
+# Priority tiers → queues, in drain order (routing: services/priority_service.py)
+PRIORITY_QUEUES = {
+    "high": "transcribe_high",
+    "normal": "default",
+    "low": "transcribe_low",
+}
+
 # Shared task settings
 celery_app.conf.update(
     timezone="UTC",
@@ -24,18 +36,28 @@ celery_app.conf.update(
     task_serializer="json",
     result_serializer="json",
     accept_content=["json"],
-    worker_prefetch_multiplier=1,  # fair scheduling
+    # fair scheduling; in batch mode the worker must hold a full batch of
+    # unacked messages so celery-batches can flush WHISPER_BATCH_SIZE at once
+    worker_prefetch_multiplier=max(settings.whisper_batch_size, 1),
     task_send_sent_event=True,  # emit “Task-sent” events
     worker_send_task_events=True,  # emit “started/succeeded” events
     task_default_queue="default",
     task_default_exchange="echobase",
     task_default_routing_key="default",
+    # Process model (see WORKER_POOL in settings); the CLI -P/-c flags still win
+    worker_pool=settings.worker_pool,
+    worker_concurrency=worker_concurrency(),
+    worker_max_memory_per_child=settings.worker_max_memory_per_child_mb * 1024 or None,  # KiB
+    # With several queues the Redis transport polls them round-robin by
+    # default; "priority" makes every fetch try them in declaration order,
+    # so transcribe_high is always drained before default and transcribe_low.
+    broker_transport_options={"queue_order_strategy": "priority"},
 )
 
 # Fan-out durable queue
 default_exchange = Exchange("echobase", type="direct")
-celery_app.conf.task_queues = (
-    Queue("default", default_exchange, routing_key="default"),
+celery_app.conf.task_queues = tuple(
+    Queue(name, default_exchange, routing_key=name) for name in PRIORITY_QUEUES.values()
 )
 
 # Beat scheduler (for housekeeping)
@@ -44,8 +66,22 @@ celery_app.conf.beat_schedule = {
     #     "task": "EchoBase_transcription.worker.tasks.housekeeping.cleanup_temp",
     #     "schedule": 3600,
     # },
-    "catchup-unprocessed-every-5min": {
-        "task": "EchoBase_transcription.worker.tasks.housekeeping.catch_up_unprocessed",
-        "schedule": 300,
-    },
-}
\ No newline at end of file
+}
+if settings.catch_up_interval_seconds > 0:
+    celery_app.conf.beat_schedule["catchup-unprocessed"] = {
+        "task": "catch_up_unprocessed",  # name= given in @shared_task
+        "schedule": settings.catch_up_interval_seconds,
+    }
+
+
+# Prometheus exporter: one per worker, started in the main process; prefork
+# children report through PROMETHEUS_MULTIPROC_DIR (see services/metrics.py)
+@worker_init.connect(weak=False)
+def _start_metrics_exporter(**_):
+    if settings.worker_metrics_port:
+        metrics.start_exporter(settings.worker_metrics_port)
+
+
+@worker_process_shutdown.connect(weak=False)
+def _forget_child_metrics(pid=None, **_):
+    metrics.mark_process_dead(pid or os.getpid())
@@ -1,3 +1,4 @@
 """Auto-import task modules so Celery sees them."""
 from . import transcribe
 from . import housekeeping
+from . import storage
@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import logging
-from datetime import time
+import time
 from pathlib import Path
-from typing import List
 
 from celery import shared_task
 
 from ...config import settings
-from ...db import get_session
-from ...db.models import Call
-from ...worker.tasks.transcribe import transcribe_audio_task
+from ...services import inflight_service, scan_service
+from ...services.sdrtrunk import recording_task_kwargs
+from ...worker.tasks.transcribe import enqueue_transcription
 
 TEMP_DIR = Path("/app/temp")  # same as volume mount in compose
 CALL_DIR = Path(settings.call_watch_path or "/app/recordings")
@@ -32,16 +31,46 @@ logger = logging.getLogger(__name__)
 
 @shared_task(name="catch_up_unprocessed")
 def catch_up_unprocessed() -> None:
-    """Scan recordings dir; enqueue any audio not in DB."""
-    audio_files: List[Path] = list(CALL_DIR.rglob("*.wav")) + list(CALL_DIR.rglob("*.mp3"))
-    if not audio_files:
+    """
+    Enqueue recordings that never made it into the DB.
+
+    Incremental: only files modified since the stored watermark (minus an
+    overlap window) are considered, they are checked against the DB in
+    bounded batches, and files already queued or running are skipped.
+    """
+    if not scan_service.acquire_scan_lock():
+        logger.info("catch-up: previous scan still running, skipping")
         return
 
-    with get_session() as db:
-        existing = {
-            Path(p) for (p,) in db.query(Call.audio_path).filter(Call.audio_path.in_(map(str, audio_files)))
-        }
+    try:
+        scan_started = time.time()
+        watermark = scan_service.get_watermark()
+        since = None if watermark is None else watermark - settings.scan_overlap_seconds
+        # Leave files that may still be being written for the next run
+        settle_cutoff = scan_started - settings.scan_settle_seconds
+
+        found = enqueued = 0
+        for batch in scan_service.chunked(
+                scan_service.iter_recordings(CALL_DIR, since, settle_cutoff),
+                settings.scan_db_batch_size,
+        ):
+            paths = [str(fp) for fp in batch]
+            found += len(paths)
+            known = scan_service.known_audio_paths(paths)
+            busy = inflight_service.in_flight([p for p in paths if p not in known])
+            for path in paths:
+                if path in known or path in busy:
+                    continue
+                fp = Path(path)
+                enqueue_transcription(fp.name, path, **recording_task_kwargs(fp))
+                enqueued += 1
+
+        # Everything older than the settle cutoff has now been looked at
+        scan_service.set_watermark(settle_cutoff)
+    finally:
+        scan_service.release_scan_lock()
 
-    for fp in audio_files:
-        if fp not in existing:
-            transcribe_audio_task.delay(fp.name, str(fp))
\ No newline at end of file
+    logger.info(
+        "catch-up: %d candidate files since %s, %d enqueued in %.1fs",
+        found, since, enqueued, time.time() - scan_started,
+    )
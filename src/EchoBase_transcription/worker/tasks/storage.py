@@ -0,0 +1,41 @@
+"""Move transcribed calls' audio into the content-addressed store."""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+from ...services import audio_store
+from ...worker.celery_app import PRIORITY_QUEUES
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name="archive_call_audio",
+    autoretry_for=(OSError,),  # store volume briefly unavailable etc.
+    retry_backoff=True,
+    max_retries=5,
+    ignore_result=True,
+)
+def archive_call_audio(call_id: int) -> None:
+    """Copy / transcode a call's audio into the store and repoint Call.audio_path."""
+    audio_store.archive_call(call_id)
+
+
+def enqueue_archive(call_id: int) -> None:
+    """
+    Queue the store step for a freshly committed call (no-op when the store is off).
+
+    It runs behind transcription on the low-priority queue, so archiving
+    never delays the next call.
+    """
+    if not audio_store.enabled():
+        return
+    queue = PRIORITY_QUEUES["low"]
+    try:
+        archive_call_audio.apply_async((call_id,), queue=queue, routing_key=queue)
+    except Exception as exc:  # noqa: BLE001
+        # The call itself is stored; the audio simply stays where it is
+        logger.warning("Could not queue audio archiving for call %s (%s)", call_id, exc)
@@ -1,28 +1,366 @@
-"""Celery task to transcribe a single radio call."""
+"""Celery tasks to transcribe radio calls (one per task, or batched)."""
 from __future__ import annotations
 
+import gc
+import logging
 import os
+import time
+import uuid
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from celery import chord
+from celery.signals import worker_init, worker_process_init
+from celery_batches import Batches
+
 from ...worker.celery_app import celery_app
 from ...config import settings
-from ...services.whisper import segment_confidence
-from ...db.schemas import CallCreate, RadioUnitCreate, TalkGroupCreate
-from ...services.call_service import create_call
-from ...services.radio_unit_service import get_or_create_radio_unit
-from ...services.talkgroup_service import get_or_create_talkgroup
+from ...services.whisper import (
+    BATCH_CLIP_MAX_SECONDS,
+    SAMPLE_RATE,
+    ModelLoader,
+    SegmentAggregator,
+    cascade_enabled,
+    cascade_stats,
+    check_prefork_memory,
+    transcribe_many,
+)
+from ...services.audio import AudioInfo, DecodedAudio, load_audio, load_audio_window
+from ...services.chunking import chunking_enabled, plan_chunks
+from ...services.vad import VadResult, detect_voice, vad_stats
+from ...db.schemas import CallCreate
+from ...services import dedup_service, inflight_service, metrics, priority_service
+from ...services.call_writer import call_writer
+from ...events.publisher import CallRefs
+from ...services.resolver_service import resolve_radio_unit, resolve_talkgroup
+from .storage import enqueue_archive
+
+logger = logging.getLogger(__name__)
 
 # ----------------------- Load Whisper *once* per worker -------------------- #
 
+whisper_model = None  # Not loaded in Flask app
+
+
+def _load_worker_models() -> None:
+    global whisper_model
+    whisper_model = ModelLoader.get_model()
+    # Cascade mode: load the escalation model up front too, so the first hard
+    # call doesn't pay for the load
+    if settings.whisper_cascade_model:
+        ModelLoader.get_model(settings.whisper_cascade_model)
+
+
 # Only load the model in the worker process
 if __name__ == "__main__" or os.environ.get("CELERY_WORKER_RUNNING") == "1":
-    from ...services.whisper import ModelLoader
+    if settings.worker_pool == "prefork":
+        # The parent imports the stack and fetches the weights once; each
+        # child builds its own model copy after fork (CTranslate2 threads
+        # can't be inherited) with its own WHISPER_CPU_THREADS slice.
+        # WORKER_POOL=threads is the single-copy alternative.
+        model_paths = [ModelLoader.prefetch()]
+        if settings.whisper_cascade_model:
+            model_paths.append(ModelLoader.prefetch(settings.whisper_cascade_model))
+        check_prefork_memory(model_paths)
 
-    whisper_model = ModelLoader.get_model()
-else:
-    whisper_model = None  # Not loaded in Flask app
+        @worker_init.connect(weak=False)
+        def _freeze_parent_heap(**_):
+            # Move everything the parent allocated out of the GC's reach so
+            # children's collections don't write to (and un-share) those pages
+            gc.collect()
+            gc.freeze()
+
+        @worker_process_init.connect(weak=False)
+        def _load_child_models(**_):
+            _load_worker_models()
+    else:
+        _load_worker_models()
+
+
+def batch_mode_enabled() -> bool:
+    """True when workers should pull calls in batches (WHISPER_BATCH_SIZE > 1)."""
+    return settings.whisper_batch_size > 1
+
+
+def enqueue_transcription(file_name: str, file_path: str, **kwargs):
+    """
+    Queue a call for transcription on whichever task the deployment uses.
+
+    API routes and housekeeping go through here so switching batch mode on/off
+    is purely a settings change. A file that is already queued or running is
+    not sent again; the existing task's AsyncResult is returned instead.
+
+    The call is routed to its talkgroup's priority queue; `enqueued_at` is
+    carried as a header so queue wait can be measured (see /queues).
+    """
+    task = transcribe_audio_batch_task if batch_mode_enabled() else transcribe_audio_task
+    task_id = uuid.uuid4().hex
+    existing = inflight_service.claim(file_path, task_id)
+    if existing is not None:
+        return task.AsyncResult(existing)
+    queue = priority_service.queue_for(kwargs.get("system_id", 1), kwargs.get("tg_number"))
+    try:
+        return task.apply_async(
+            (file_name, file_path),
+            kwargs,
+            task_id=task_id,
+            queue=queue,
+            routing_key=queue,
+            headers={"enqueued_at": time.time()},
+        )
+    except Exception:
+        inflight_service.release(file_path)
+        raise
+
+
+def _resolve_related_ids(
+        system_id: int,
+        tg_number: Optional[int],
+        unit_id: Optional[int],
+) -> tuple[Optional[int], Optional[int], CallRefs]:
+    """
+    Return (talkgroup_db_id, radio_unit_db_id, refs), creating rows as needed.
+
+    Served from the per-process resolver cache; only unseen keys hit the DB.
+    `refs` carries the aliases so the CallEvent is built without queries.
+    """
+    # Upsert / resolve RadioUnit (per system_id + unit_id)
+    radio_unit = resolve_radio_unit(system_id, unit_id) if unit_id is not None else None
+
+    # Upsert / resolve TalkGroup (per system_id + tg_number)
+    talkgroup = resolve_talkgroup(system_id, tg_number) if tg_number is not None else None
+
+    refs = CallRefs(
+        talkgroup_alias=talkgroup.alias if talkgroup else None,
+        unit_id=unit_id,
+        unit_alias=radio_unit.alias if radio_unit else None,
+    )
+    return (talkgroup.id if talkgroup else None), (radio_unit.id if radio_unit else None), refs
+
+
+def _submit_call(
+        *,
+        audio_fp: Path,
+        timestamp: Optional[datetime],
+        duration: float,
+        agg: SegmentAggregator,
+        system_id: int,
+        tg_number: Optional[int],
+        unit_id: Optional[int],
+        source: Optional[AudioInfo] = None,
+        site: Optional[str] = None,
+        no_speech: bool = False,
+        transcriber: Optional[str] = None,
+        duplicate_of: Optional[int] = None,
+) -> tuple[Future, SegmentAggregator]:
+    """Resolve related rows and hand the Call to the buffered writer."""
+    with metrics.stage("resolve"):
+        talkgroup_db_id, radio_unit_db_id, refs = _resolve_related_ids(system_id, tg_number, unit_id)
+
+    future = call_writer.submit(
+        CallCreate(
+            system_id=system_id,
+            talkgroup_id=talkgroup_db_id,
+            unit_id=radio_unit_db_id,
+            timestamp=timestamp or datetime.utcnow(),
+            duration=duration,
+            sample_rate=source.sample_rate if source else None,
+            channels=source.channels if source else None,
+            audio_path=str(audio_fp),
+            site=site,
+            duplicate_of=duplicate_of,
+            transcript=agg.transcript,
+            confidence=agg.confidence,
+            needs_review=agg.needs_review,
+            no_speech=no_speech,
+            transcriber=transcriber or settings.whisper_model_name,
+            segments=agg.rows,
+        ),
+        refs,
+    )
+    return future, agg
+
+
+def _await_call(pending: tuple[Future, SegmentAggregator], dedup_token: Optional[str] = None) -> dict:
+    """
+    Block until the writer has committed the Call (and published its event).
+
+    Tasks must not return before this: with acks_late the message is acked
+    on return, so waiting here keeps delivery at-least-once.
+
+    `dedup_token` is the call's duplicate-index entry; copies waiting on it
+    are given the new Call id (or told to transcribe themselves on failure).
+    """
+    future, agg = pending
+    try:
+        call_dto = future.result()
+    except Exception:
+        dedup_service.forget(dedup_token)
+        raise
+    dedup_service.settle(dedup_token, call_dto.id)
+    enqueue_archive(call_dto.id)
+    return {
+        "call_id": call_dto.id,
+        "text": call_dto.transcript,
+        "confidence": call_dto.confidence,
+        "no_speech_prob": agg.no_speech_prob,
+        "needs_review": call_dto.needs_review,
+        "no_speech": call_dto.no_speech,
+        "transcriber": call_dto.transcriber,
+    }
+
+
+def _decode(path) -> DecodedAudio:
+    with metrics.stage("decode"):
+        return load_audio(path)
+
+
+def _voice_activity(audio) -> Optional[VadResult]:
+    """VAD result for `audio`, or None when the pre-filter is off."""
+    if not settings.vad_enabled:
+        return None
+    with metrics.stage("vad"):
+        return detect_voice(audio, SAMPLE_RATE)
+
+
+def _find_duplicate(
+        decoded: DecodedAudio,
+        *,
+        timestamp,
+        system_id: int,
+        tg_number: Optional[int],
+        unit_id: Optional[int],
+        **_,
+) -> dedup_service.DedupCheck:
+    """Register a voiced call in the duplicate index and look for its original."""
+    with metrics.stage("dedup"):
+        return dedup_service.check(
+            system_id, tg_number, unit_id, timestamp, decoded.samples, decoded.duration, SAMPLE_RATE
+        )
+
+
+def _persist_call(dedup_token: Optional[str] = None, **kwargs) -> dict:
+    """Create the Call via the writer and summarise it."""
+    return _await_call(_submit_call(**kwargs), dedup_token)
+
+
+def _submit_no_speech(*, audio_fp: Path, duration: float, **kwargs) -> tuple[Future, SegmentAggregator]:
+    """Store a call the VAD rejected: no transcript, never sent to the model."""
+    vad_stats.record_skip(duration)
+    return _submit_call(
+        audio_fp=audio_fp,
+        duration=duration,
+        agg=SegmentAggregator(),
+        no_speech=True,
+        transcriber="vad",
+        **kwargs,
+    )
+
+
+def _submit_duplicate(*, duplicate_of: int, **kwargs) -> tuple[Future, SegmentAggregator]:
+    """Store a simulcast / repeat copy: linked to its original, never sent to the model."""
+    return _submit_call(agg=SegmentAggregator(), transcriber="dedup", duplicate_of=duplicate_of, **kwargs)
+
+
+def _handed_off(result: dict) -> bool:
+    """True when another task now owns the recording (and its in-flight claim)."""
+    return bool(result.get("chunked") or result.get("deferred"))
+
+
+def _defer_duplicate(
+        audio_fp: Path,
+        duration: float,
+        match: dedup_service.DedupMatch,
+        *,
+        language: Optional[str],
+        timestamp,
+        system_id: int,
+        tg_number: Optional[int],
+        unit_id: Optional[int],
+        source: AudioInfo,
+        site: Optional[str],
+) -> dict:
+    """
+    Hand a copy whose original is still in the pipeline to link_duplicate.
+
+    This worker moves on instead of waiting; the recording stays in flight
+    until the copy is linked or, after DEDUP_WAIT_SECONDS, transcribed.
+    """
+    queue = priority_service.queue_for(system_id, tg_number)
+    task = link_duplicate_task.apply_async(
+        (str(audio_fp), list(match), time.time() + settings.dedup_wait_seconds),
+        dict(
+            duration=duration,
+            timestamp=timestamp,
+            system_id=system_id,
+            tg_number=tg_number,
+            unit_id=unit_id,
+            sample_rate=source.sample_rate,
+            channels=source.channels,
+            site=site,
+            language=language,
+        ),
+        queue=queue,
+        routing_key=queue,
+        countdown=dedup_service.RECHECK_SECONDS,
+    )
+    logger.info("dedup: %s waits for its original in task %s", audio_fp.name, task.id)
+    return {"deferred": True, "link_task_id": task.id}
+
+
+def _run_model(
+        audio,
+        *,
+        language: Optional[str],
+        regions: Optional[list[tuple[float, float]]],
+        label: str,
+        offset: float = 0.0,
+) -> tuple[SegmentAggregator, str]:
+    """
+    Whisper (+ cascade) over one clip, decoding only `regions` when given.
+
+    Segment times are shifted by `offset` (a chunk's place in its recording).
+    Returns the aggregator and the model that produced it.
+    """
+    inference_started = time.perf_counter()
+    clip_timestamps = [t for region in regions for t in region] if regions is not None else "0"
+    segments, info = whisper_model.transcribe(
+        audio,
+        language=language,
+        clip_timestamps=clip_timestamps,
+        # initial_prompt=make_prompt(prompt),
+    )
+
+    # `segments` is a lazy generator: drain it exactly once into the
+    # aggregator (transcript, confidence, no-speech stats, per-segment rows).
+    agg = SegmentAggregator(offset=offset).consume(segments)
+    transcriber = settings.whisper_model_name
+    duration = len(audio) / SAMPLE_RATE
+    decoded_seconds = sum(end - start for start, end in regions) if regions is not None else duration
+    metrics.observe_inference(transcriber, time.perf_counter() - inference_started, decoded_seconds)
+
+    # Cascade: redo the hard calls on the larger model
+    if cascade_enabled():
+        escalate = agg.needs_escalation
+        cascade_stats.record(1, int(escalate))
+        if escalate:
+            logger.info("cascade: %s confidence %.2f on %s; re-running on %s",
+                        label, agg.confidence, transcriber, settings.whisper_cascade_model)
+            cascade_started = time.perf_counter()
+            segments, info = ModelLoader.get_model(settings.whisper_cascade_model).transcribe(
+                audio,
+                language=language,
+                clip_timestamps=clip_timestamps,
+            )
+            agg = SegmentAggregator(offset=offset).consume(segments)
+            transcriber = settings.whisper_cascade_model
+            metrics.observe_inference(transcriber, time.perf_counter() - cascade_started, decoded_seconds)
+
+    if regions is not None:
+        vad_stats.record_inference(duration, decoded_seconds, time.perf_counter() - inference_started)
+    return agg, transcriber
 
 
 @celery_app.task(name="transcribe_audio", bind=True)
@@ -30,87 +368,552 @@ def transcribe_audio_task(
         self,  # Celery task instance
         file_name: str,
         file_path: str,
-        timestamp: datetime,
+        timestamp: Optional[datetime] = None,
         tg_number: Optional[int] = None,
         unit_id: Optional[int] = None,
         system_id: int = 1,  # TODO
         prompt: Optional[str] = None,
         language: Optional[str] = None,
+        site: Optional[str] = None,
+) -> dict:
+    """
+    Transcribe an audio file and persist the Call row.
+
+    Long recordings are handed to a chord of chunk tasks instead; the result
+    then says {"chunked": true, ...} and the Call is stored by merge_chunks.
+    """
+    metrics.observe_queue_wait(self.request)
+    handed_off = False
+    try:
+        result = _transcribe_single(
+            file_path, timestamp, tg_number, unit_id, system_id, language, site=site
+        )
+        handed_off = _handed_off(result)
+        return result
+    finally:
+        # A chunked / deferred recording stays in flight until its Call is stored
+        if not handed_off:
+            inflight_service.release(file_path)
+
+
+def _transcribe_single(
+        file_path: str,
+        timestamp: Optional[datetime],
+        tg_number: Optional[int],
+        unit_id: Optional[int],
+        system_id: int,
+        language: Optional[str],
+        decoded: Optional[DecodedAudio] = None,
+        site: Optional[str] = None,
+        check_duplicates: bool = True,
 ) -> dict:
-    """Transcribe an audio file and persist the Call row."""
     audio_fp = Path(file_path)
+    started = time.perf_counter()
 
-    print(f"Transcribing audio file: {audio_fp} with model {settings.whisper_model_name}")
+    logger.info("single: transcribing %s with %s", audio_fp.name, settings.whisper_model_name)
 
-    # ------------------- 1. Run Faster-Whisper ----------------------------- #
-    segments, info = whisper_model.transcribe(
-        str(audio_fp),
-        language=language,
-        # initial_prompt=make_prompt(prompt),
+    # ------------------- 1. Decode once + voice activity pre-filter -------- #
+    if decoded is None:
+        decoded = _decode(audio_fp)
+    audio, duration = decoded.samples, decoded.duration
+    related = dict(
+        timestamp=timestamp, system_id=system_id, tg_number=tg_number, unit_id=unit_id,
+        source=decoded.info, site=site,
     )
 
-    # Collapse segments into a single transcript string
-    text = " ".join(s.text.strip() for s in segments if s.text.strip())
+    vad = _voice_activity(audio)
+    if vad is not None and not vad.is_speech:
+        result = _await_call(_submit_no_speech(audio_fp=audio_fp, duration=duration, **related))
+        logger.info("single: %s has no speech (%.1fs audio); skipped model. %s",
+                    audio_fp.name, duration, vad_stats.summary())
+        return result
 
-    # Confidence scoring
-    confidences = [segment_confidence(segment) for segment in segments]
-    overall_confidence = (
-        sum(confidences) / len(confidences) if confidences else None
+    # ------------------- 2. Simulcast / repeat copies skip the model ------- #
+    dedup = _find_duplicate(decoded, **related) if check_duplicates else dedup_service.NOT_CHECKED
+    if dedup.match is not None:
+        original = dedup_service.original_status(dedup.match)
+        if original.call_id is not None:
+            dedup_service.dedup_stats.record("duplicate")
+            result = _await_call(_submit_duplicate(
+                audio_fp=audio_fp, duration=duration, duplicate_of=original.call_id, **related
+            ))
+            logger.info("single: %s duplicates call %s (similarity %.2f); skipped model. %s",
+                        audio_fp.name, original.call_id, dedup.match.similarity, dedup_service.dedup_stats.summary())
+            return result
+        if original.pending:
+            return _defer_duplicate(audio_fp, duration, dedup.match, language=language, **related)
+        # The original will never be stored: transcribe this copy after all
+        dedup_service.dedup_stats.record("timeout")
+
+    # ------------------- 3. Long recordings fan out over the workers ------- #
+    if chunking_enabled(duration):
+        return _dispatch_chunks(audio_fp, decoded, vad, language=language, dedup_token=dedup.token, **related)
+
+    # ------------------- 4. Run Faster-Whisper ----------------------------- #
+    agg, transcriber = _run_model(
+        audio,
+        language=language,
+        regions=vad.regions if vad is not None else None,
+        label=audio_fp.name,
     )
 
-    # Heuristic review gate
-    needs_review = (
-            overall_confidence is not None and overall_confidence < -1.0
+    # ------------------- 5. Resolve related rows + create Call ------------- #
+    result = _persist_call(
+        dedup.token, audio_fp=audio_fp, duration=duration, agg=agg, transcriber=transcriber, **related
     )
 
-    # ------------------- 2. Ensure related rows exist ---------------------- #
-    # Upsert / resolve RadioUnit (per system_id + unit_id)
-    radio_unit_db_id: Optional[int] = None
-    if unit_id is not None:
-        ru_dto = get_or_create_radio_unit(
-            RadioUnitCreate(
-                system_id=system_id,
-                unit_id=unit_id,
-                alias=None,
-            )
+    # ------------------- 6. Return summary to caller ----------------------- #
+    elapsed = time.perf_counter() - started
+    logger.info("single: 1 call (%.1fs audio) in %.2fs -> %.2f calls/s",
+                duration, elapsed, 1 / elapsed if elapsed else 0.0)
+    result["calls_per_sec"] = 1 / elapsed if elapsed else None
+    return result
+
+
+def _dispatch_chunks(
+        audio_fp: Path,
+        decoded: DecodedAudio,
+        vad: Optional[VadResult],
+        *,
+        language: Optional[str],
+        dedup_token: Optional[str],
+        timestamp,
+        system_id: int,
+        tg_number: Optional[int],
+        unit_id: Optional[int],
+        source: AudioInfo,
+        site: Optional[str],
+) -> dict:
+    """
+    Transcribe a long recording as a chord: one task per chunk, then merge_chunks.
+
+    Returns as soon as the chord is queued, so this worker moves on to the
+    next call while the chunks run wherever there is capacity.
+    """
+    chunks = plan_chunks(decoded.duration, vad.regions if vad is not None else None)
+    queue = priority_service.queue_for(system_id, tg_number)
+    options = dict(queue=queue, routing_key=queue, headers={"enqueued_at": time.time()})
+
+    header = [
+        transcribe_chunk_task.signature((str(audio_fp), chunk.start, chunk.end, chunk.regions, language), **options)
+        for chunk in chunks
+    ]
+    body = merge_chunks_task.signature(
+        kwargs=dict(
+            file_path=str(audio_fp),
+            duration=decoded.duration,
+            timestamp=timestamp,
+            system_id=system_id,
+            tg_number=tg_number,
+            unit_id=unit_id,
+            sample_rate=source.sample_rate,
+            channels=source.channels,
+            site=site,
+            dedup_token=dedup_token,
+        ),
+        **options,
+    ).on_error(chunked_call_failed_task.signature(kwargs=dict(file_path=str(audio_fp), dedup_token=dedup_token)))
+    merge = chord(header)(body)
+
+    logger.info("chunked: %s (%.1fs audio) split into %d chunks of ~%.0fs",
+                audio_fp.name, decoded.duration, len(chunks), settings.chunk_target_seconds)
+    return {"chunked": True, "chunks": len(chunks), "merge_task_id": merge.id}
+
+
+@celery_app.task(name="transcribe_chunk", bind=True)
+def transcribe_chunk_task(
+        self,
+        file_path: str,
+        start: float,
+        end: float,
+        regions: Optional[list],
+        language: Optional[str] = None,
+) -> dict:
+    """Transcribe [start, end) seconds of a long recording; segment times are the recording's."""
+    metrics.observe_queue_wait(self.request)
+    with metrics.stage("decode"):
+        audio = load_audio_window(file_path, start, end)
+    agg, transcriber = _run_model(
+        audio,
+        language=language,
+        regions=[tuple(region) for region in regions] if regions is not None else None,
+        label=f"{Path(file_path).name}@{start:.0f}s",
+        offset=start,
+    )
+    return {"rows": agg.rows, "transcriber": transcriber}
+
+
+@celery_app.task(name="merge_chunks")
+def merge_chunks_task(
+        results: list[dict],
+        *,
+        file_path: str,
+        duration: float,
+        timestamp=None,
+        system_id: int = 1,
+        tg_number: Optional[int] = None,
+        unit_id: Optional[int] = None,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+        site: Optional[str] = None,
+        dedup_token: Optional[str] = None,
+) -> dict:
+    """Chord body: stitch the chunks' segments in order and store the one Call."""
+    try:
+        agg = SegmentAggregator()
+        for part in results:  # chord results keep the header's order
+            agg.add_rows(part["rows"])
+        # any chunk escalated by the cascade -> credit the larger model
+        transcriber = next(
+            (part["transcriber"] for part in results if part["transcriber"] != settings.whisper_model_name),
+            settings.whisper_model_name,
+        )
+        result = _persist_call(
+            dedup_token,
+            audio_fp=Path(file_path),
+            duration=duration,
+            agg=agg,
+            transcriber=transcriber,
+            timestamp=timestamp,
+            system_id=system_id,
+            tg_number=tg_number,
+            unit_id=unit_id,
+            source=AudioInfo(duration, sample_rate, channels),
+            site=site,
         )
-        radio_unit_db_id = ru_dto.id
+    finally:
+        inflight_service.release(file_path)
 
-    # Upsert / resolve TalkGroup (per system_id + tg_number)
-    talkgroup_db_id: Optional[int] = None
-    if tg_number is not None:
-        tg_dto = get_or_create_talkgroup(
-            TalkGroupCreate(
+    logger.info("chunked: %s stored as call %s from %d chunks", Path(file_path).name, result["call_id"], len(results))
+    result["chunks"] = len(results)
+    return result
+
+
+@celery_app.task(name="chunked_call_failed")
+def chunked_call_failed_task(request, exc, traceback, file_path: str, dedup_token: Optional[str] = None) -> None:
+    """Chord error callback: release the recording so the catch-up scan retries it."""
+    logger.error("chunked: %s failed in task %s (%s)", Path(file_path).name, getattr(request, "id", None), exc)
+    inflight_service.release(file_path)
+    dedup_service.forget(dedup_token)
+
+
+@celery_app.task(name="link_duplicate", bind=True, max_retries=None)
+def link_duplicate_task(
+        self,
+        file_path: str,
+        match: list,  # DedupMatch fields
+        deadline: float,  # epoch seconds; after this the copy is transcribed itself
+        *,
+        duration: float,
+        timestamp=None,
+        system_id: int = 1,
+        tg_number: Optional[int] = None,
+        unit_id: Optional[int] = None,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+        site: Optional[str] = None,
+        language: Optional[str] = None,
+) -> dict:
+    """
+    Store a simulcast / repeat copy once its original is stored.
+
+    Re-checks every RECHECK_SECONDS by retrying (no worker sleeps on it);
+    a copy whose original doesn't show up by `deadline` is transcribed.
+    """
+    match = dedup_service.DedupMatch(*match)
+    while True:
+        original = dedup_service.original_status(match)
+        if original.call_id is not None or not original.pending or time.time() >= deadline:
+            break
+        countdown = min(dedup_service.RECHECK_SECONDS, max(deadline - time.time(), 0.0))
+        if not self.request.is_eager:
+            raise self.retry(countdown=countdown)  # the recording stays in flight
+        time.sleep(countdown)  # eager (benchmarks): no broker to hold a retry
+
+    handed_off = False
+    try:
+        if original.call_id is not None:
+            dedup_service.dedup_stats.record("duplicate")
+            result = _await_call(_submit_duplicate(
+                audio_fp=Path(file_path),
+                duration=duration,
+                duplicate_of=original.call_id,
+                timestamp=timestamp,
                 system_id=system_id,
                 tg_number=tg_number,
-                alias=None,
-                whisper_prompt=None,
-            )
-        )
-        talkgroup_db_id = tg_dto.id
+                unit_id=unit_id,
+                source=AudioInfo(duration, sample_rate, channels),
+                site=site,
+            ))
+            logger.info("dedup: %s linked to call %s", Path(file_path).name, original.call_id)
+            return result
 
-    # ------------------- 3. Create Call row via service -------------------- #
-    call_dto = create_call(
-        CallCreate(
-            system_id=system_id,
-            talkgroup_id=talkgroup_db_id,
-            unit_id=radio_unit_db_id,
-            timestamp=timestamp,
-            duration=info.duration,
-            audio_path=str(audio_fp),
-            transcript=text,
-            confidence=overall_confidence,
-            needs_review=needs_review,
-            transcriber=settings.whisper_model_name,
+        dedup_service.dedup_stats.record("timeout")
+        logger.info("dedup: original of %s was not stored in time; transcribing it", Path(file_path).name)
+        result = _transcribe_single(
+            file_path, timestamp, tg_number, unit_id, system_id, language, site=site, check_duplicates=False
         )
+        handed_off = _handed_off(result)
+        return result
+    finally:
+        if not handed_off:
+            inflight_service.release(file_path)
+
+
+@celery_app.task(
+    name="transcribe_audio_batch",
+    base=Batches,
+    flush_every=max(settings.whisper_batch_size, 1),
+    flush_interval=settings.whisper_batch_interval_ms / 1000,
+)
+def transcribe_audio_batch_task(requests) -> None:
+    """
+    Transcribe up to WHISPER_BATCH_SIZE queued calls in one batched inference pass.
+
+    Each request carries the same arguments as transcribe_audio_task. Every call
+    still gets its own Call row, publish_call_update event and task result.
+    Clips longer than one Whisper window fall back to the single-call path.
+    """
+    handed_off: set[str] = set()  # long recordings now owned by a chunk chord
+    try:
+        _transcribe_batch(requests, handed_off)
+    finally:
+        for request in requests:
+            path = request.kwargs.get("file_path") or (list(request.args) + [None, None])[1]
+            if path and path not in handed_off:
+                inflight_service.release(path)
+
+
+def _mark_failed(request, exc: Exception) -> None:
+    """Record a batched request's failure (a SimpleRequest has no errbacks to call)."""
+    celery_app.backend.mark_as_failure(request.id, exc, request=request, call_errbacks=False)
+
+
+def _related(kwargs: dict, decoded: DecodedAudio) -> dict:
+    """The Call's context from a batched request's kwargs."""
+    return dict(
+        timestamp=kwargs.get("timestamp"),
+        system_id=kwargs.get("system_id", 1),
+        tg_number=kwargs.get("tg_number"),
+        unit_id=kwargs.get("unit_id"),
+        source=decoded.info,
+        site=kwargs.get("site"),
     )
 
-    # `create_call` already publishes the SSE/update event via call_service
 
-    # ------------------- 4. Return summary to caller ----------------------- #
-    return {
-        "call_id": call_dto.id,
-        "text": text,
-        "confidence": overall_confidence,
-        "needs_review": needs_review,
-    }
+def _transcribe_batch(requests, handed_off: Optional[set] = None) -> None:
+    started = time.perf_counter()
+
+    jobs: list[tuple] = []  # (request, kwargs, decoded, vad)
+    pending: list[tuple] = []  # (request, (future, agg)) handed to the call writer
+    dedup_tokens: dict[str, str] = {}  # request.id -> duplicate-index entry of a voiced call
+    copies: list[tuple] = []  # (request, kwargs, decoded, DedupMatch) of simulcast / repeat copies
+    for request in requests:
+        metrics.observe_queue_wait(request)
+        kwargs = dict(request.kwargs)
+        file_name, file_path = (list(request.args) + [None, None])[:2]
+        kwargs.setdefault("file_name", file_name)
+        kwargs.setdefault("file_path", file_path)
+        try:
+            decoded = _decode(kwargs["file_path"])
+        except Exception as exc:  # noqa: BLE001
+            _mark_failed(request, exc)
+            continue
+        audio = decoded.samples
+
+        if len(audio) > BATCH_CLIP_MAX_SECONDS * SAMPLE_RATE:
+            try:
+                result = _transcribe_single(
+                    kwargs["file_path"],
+                    kwargs.get("timestamp"),
+                    kwargs.get("tg_number"),
+                    kwargs.get("unit_id"),
+                    kwargs.get("system_id", 1),
+                    kwargs.get("language"),
+                    decoded=decoded,
+                    site=kwargs.get("site"),
+                )
+            except Exception as exc:  # noqa: BLE001
+                _mark_failed(request, exc)
+                continue
+            if _handed_off(result) and handed_off is not None:
+                handed_off.add(kwargs["file_path"])
+            celery_app.backend.mark_as_done(request.id, result, request=request)
+            continue
+
+        vad = _voice_activity(audio)
+        if vad is not None and not vad.is_speech:
+            try:
+                pending.append((request, _submit_no_speech(
+                    audio_fp=Path(kwargs["file_path"]),
+                    duration=decoded.duration,
+                    **_related(kwargs, decoded),
+                )))
+            except Exception as exc:  # noqa: BLE001
+                _mark_failed(request, exc)
+            continue
+
+        dedup = _find_duplicate(decoded, **_related(kwargs, decoded))
+        if dedup.match is not None:
+            copies.append((request, kwargs, decoded, dedup.match))
+            continue
+        if dedup.token is not None:
+            dedup_tokens[request.id] = dedup.token
+        jobs.append((request, kwargs, decoded, vad))
+
+    if jobs:
+        try:
+            _transcribe_jobs(jobs, pending)
+        except Exception as exc:  # noqa: BLE001
+            # Only the voiced calls are lost; the rest of the batch is still stored below
+            logger.exception("batch: inference failed for %d calls", len(jobs))
+            for request, *_ in jobs:
+                _mark_failed(request, exc)
+        # Copies waiting on a call that will not be stored transcribe themselves
+        submitted = {request.id for request, _ in pending}
+        for request, *_ in jobs:
+            if request.id not in submitted:
+                dedup_service.forget(dedup_tokens.pop(request.id, None))
+    else:
+        logger.info("batch: no voiced calls")
+
+    # Rows were submitted as they became ready, so the writer groups them
+    # into as few transactions as it can; wait for all of them before the
+    # batch returns (and its messages are acked)
+    for request, submitted in pending:
+        try:
+            result = _await_call(submitted, dedup_tokens.get(request.id))
+        except Exception as exc:  # noqa: BLE001
+            _mark_failed(request, exc)
+            continue
+        celery_app.backend.mark_as_done(request.id, result, request=request)
+
+    if copies:
+        _store_copies(copies, handed_off)
+
+    if jobs:
+        elapsed = time.perf_counter() - started
+        audio_seconds = sum(decoded.duration for _, _, decoded, _ in jobs)
+        logger.info("batch: %d calls (%.1fs audio) in %.2fs -> %.2f calls/s",
+                    len(jobs), audio_seconds, elapsed, len(jobs) / elapsed if elapsed else 0.0)
+    if settings.vad_enabled:
+        logger.info(vad_stats.summary())
+    if settings.dedup_enabled:
+        logger.info(dedup_service.dedup_stats.summary())
+    if cascade_enabled():
+        logger.info(cascade_stats.summary())
+
+
+def _store_copies(copies: list[tuple], handed_off: Optional[set] = None) -> None:
+    """
+    Link a batch's simulcast / repeat copies to their originals.
+
+    Runs after the batch's own calls are stored, so originals from the same
+    batch already have their ids. Copies of calls still in the pipeline are
+    deferred to link_duplicate; copies of calls that will never be stored
+    are transcribed on their own.
+    """
+    for request, kwargs, decoded, match in copies:
+        try:
+            original = dedup_service.original_status(match)
+            if original.call_id is not None:
+                dedup_service.dedup_stats.record("duplicate")
+                result = _await_call(_submit_duplicate(
+                    audio_fp=Path(kwargs["file_path"]),
+                    duration=decoded.duration,
+                    duplicate_of=original.call_id,
+                    **_related(kwargs, decoded),
+                ))
+            elif original.pending:
+                result = _defer_duplicate(
+                    Path(kwargs["file_path"]),
+                    decoded.duration,
+                    match,
+                    language=kwargs.get("language"),
+                    **_related(kwargs, decoded),
+                )
+                if handed_off is not None:
+                    handed_off.add(kwargs["file_path"])
+            else:
+                dedup_service.dedup_stats.record("timeout")
+                result = _transcribe_single(
+                    kwargs["file_path"],
+                    kwargs.get("timestamp"),
+                    kwargs.get("tg_number"),
+                    kwargs.get("unit_id"),
+                    kwargs.get("system_id", 1),
+                    kwargs.get("language"),
+                    decoded=decoded,
+                    site=kwargs.get("site"),
+                    check_duplicates=False,
+                )
+                if _handed_off(result) and handed_off is not None:
+                    handed_off.add(kwargs["file_path"])
+        except Exception as exc:  # noqa: BLE001
+            _mark_failed(request, exc)
+            continue
+        celery_app.backend.mark_as_done(request.id, result, request=request)
+
+
+def _transcribe_jobs(jobs: list[tuple], pending: list[tuple]) -> None:
+    """Batched inference (+ cascade) over the voiced clips; submits their Calls."""
+    # All calls in a batch share the language of the first one; the API
+    # always sends settings.whisper_language so this is uniform in practice.
+    language = jobs[0][1].get("language")
+    inference_started = time.perf_counter()
+    per_clip = transcribe_many(
+        [decoded.samples for _, _, decoded, _ in jobs],
+        language=language,
+        batch_size=settings.whisper_batch_size,
+        regions=[vad.regions if vad is not None else None for _, _, _, vad in jobs],
+    )
+    aggs = [SegmentAggregator().consume(segments) for segments in per_clip]
+    transcribers = [settings.whisper_model_name] * len(jobs)
+    decoded_seconds = [vad.voiced_seconds if vad is not None else decoded.duration for _, _, decoded, vad in jobs]
+    metrics.observe_inference(
+        settings.whisper_model_name, time.perf_counter() - inference_started, sum(decoded_seconds)
+    )
+
+    # Cascade: re-run only the low-confidence clips, batched, on the larger model
+    if cascade_enabled():
+        hard = [i for i, agg in enumerate(aggs) if agg.needs_escalation]
+        cascade_stats.record(len(jobs), len(hard))
+        if hard:
+            cascade_started = time.perf_counter()
+            redo = transcribe_many(
+                [jobs[i][2].samples for i in hard],
+                language=language,
+                batch_size=settings.whisper_batch_size,
+                regions=[jobs[i][3].regions if jobs[i][3] is not None else None for i in hard],
+                model_name=settings.whisper_cascade_model,
+            )
+            for i, segments in zip(hard, redo):
+                aggs[i] = SegmentAggregator().consume(segments)
+                transcribers[i] = settings.whisper_cascade_model
+            metrics.observe_inference(
+                settings.whisper_cascade_model,
+                time.perf_counter() - cascade_started,
+                sum(decoded_seconds[i] for i in hard),
+            )
+    inference_wall = time.perf_counter() - inference_started
+    if settings.vad_enabled:
+        total = sum(decoded.duration for _, _, decoded, _ in jobs)
+        voiced = sum(vad.voiced_seconds for _, _, _, vad in jobs)
+        vad_stats.record_inference(total, voiced, inference_wall)
+
+    for (request, kwargs, decoded, _), agg, transcriber in zip(jobs, aggs, transcribers):
+        try:
+            pending.append((request, _submit_call(
+                audio_fp=Path(kwargs["file_path"]),
+                timestamp=kwargs.get("timestamp"),
+                duration=decoded.duration,
+                agg=agg,
+                system_id=kwargs.get("system_id", 1),
+                tg_number=kwargs.get("tg_number"),
+                unit_id=kwargs.get("unit_id"),
+                source=decoded.info,
+                site=kwargs.get("site"),
+                transcriber=transcriber,
+            )))
+        except Exception as exc:  # noqa: BLE001
+            _mark_failed(request, exc)